@@ -298,6 +298,13 @@ class Settings(BaseSettings):
     # Cache Settings
     XBRL_CACHE_TTL_HOURS: int = 24  # XBRL data changes only quarterly
     STRUCTURED_EXTRACTION_CACHE_TTL_SECONDS: int = 3600  # 1 hour for retry window
+    # On-disk cache of raw SEC companyfacts payloads for the XBRL fallback (one gzipped file per
+    # CIK). Empty = disabled. A fresher filing than the cached payload forces a re-fetch. Past the
+    # TTL an entry is revalidated with a conditional GET (304 = reuse); past MAX_AGE it is refetched.
+    COMPANYFACTS_CACHE_DIR: str = ""
+    COMPANYFACTS_CACHE_TTL_HOURS: int = 24
+    COMPANYFACTS_CACHE_MAX_AGE_HOURS: int = 168
+    COMPANYFACTS_CACHE_MAX_FILES: int = 500
 
     # AI Model Settings
     AI_DEFAULT_MODEL: str = "deepseek-v4-pro"  # Primary model (DeepSeek V4 migration, non-thinking; chose pro over flash on the quality preference). Prod sets this + OPENAI_BASE_URL + OPENAI_API_KEY via env/Secret Manager.
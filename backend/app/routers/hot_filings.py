@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -72,7 +73,12 @@ async def get_hot_filings(
     if isinstance(last_updated, str) and last_updated and not last_updated.endswith("Z"):
         last_updated += "Z"
 
-    return {**data, "filings": enriched_filings, "last_updated": last_updated}
+    # The payload is plain str/float/dict data with no response model, so encode it once with
+    # orjson rather than paying for FastAPI's jsonable_encoder walk plus a stdlib json.dumps.
+    return Response(
+        content=orjson.dumps({**data, "filings": enriched_filings, "last_updated": last_updated}),
+        media_type="application/json",
+    )
 
 
 @router.post("/hot_filings/refresh", status_code=status.HTTP_202_ACCEPTED)
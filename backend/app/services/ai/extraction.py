@@ -208,7 +208,7 @@ class _ExtractionMixin:
             filing_text_clean = cleaned_text
         else:
             try:
-                soup = BeautifulSoup(filing_text, 'html.parser')
+                soup = BeautifulSoup(filing_text, 'lxml')
                 # Preserve table structure by using separator that maintains spacing
                 filing_text_clean = soup.get_text(separator='\n', strip=False)
             except Exception:
@@ -494,7 +494,7 @@ class _ExtractionMixin:
         mda_thin = mda_len < self._MDA_MIN_CHARS
         if (financials_thin or mda_thin) and filing_text:
             try:
-                clean = BeautifulSoup(filing_text, "html.parser").get_text(separator="\n", strip=False)
+                clean = BeautifulSoup(filing_text, "lxml").get_text(separator="\n", strip=False)
             except Exception:  # noqa: BLE001
                 clean = filing_text
             fin_slice = self._dense_window(clean, self._FIN_KW) if financials_thin else ""
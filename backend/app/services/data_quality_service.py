@@ -173,7 +173,8 @@ async def run_and_email(db: Session) -> dict[str, Any]:
     await resend_service.send_email(
         to=[to],
         subject="EarningsNerd data-quality report",
-        html=f'{html}<pre style="display:none">{text}</pre>',
+        html=html,
+        text=text,
     )
     logger.info(
         "Data-quality report emailed to %s: %d ticker mismatches, %d coverage gaps, %d filing "
@@ -19,16 +19,15 @@ Usage:
 import asyncio
 import logging
 import threading
+import time
 import weakref
-from datetime import datetime, timedelta
 from itertools import islice
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
+import httpx
 from edgar import Company as EdgarCompany, set_identity, find as edgar_find
 
-from app.utils.datetimes import utcnow
-
 from .async_executor import run_with_circuit_breaker
 from .config import EDGAR_IDENTITY, FilingType, EDGAR_DEFAULT_TIMEOUT_SECONDS, EDGAR_THREAD_POOL_SIZE
 from .exceptions import (
@@ -64,9 +63,9 @@ RECENT_FILINGS_MATERIALIZE_CAP = 50
 # GETs for a mega-filer, through the shared limiter, inside the 15s budget → circuit-breaker pressure
 # on a cron sweep), since EdgarCompany is rebuilt per call. Bounded + TTL'd (per-process, mirrors
 # filings.py's _filings_synced_at) so a company that later starts filing the form is re-checked.
-_EMPTY_FALLBACK_TTL = timedelta(hours=6)
+_EMPTY_FALLBACK_TTL_SECONDS = 6 * 3600
 _EMPTY_FALLBACK_MAX = 1024
-_empty_fallback_cache: Dict[Tuple[str, Tuple[str, ...]], datetime] = {}
+_empty_fallback_cache: Dict[Tuple[str, Tuple[str, ...]], float] = {}  # key → time.monotonic()
 
 
 def _empty_fallback_fresh(ticker: str, base_forms: List[str]) -> bool:
@@ -75,7 +74,7 @@ def _empty_fallback_fresh(ticker: str, base_forms: List[str]) -> bool:
     The key sorts base_forms so a differently-ordered same-set request is a hit, not a miss.
     """
     ts = _empty_fallback_cache.get((ticker, tuple(sorted(base_forms))))
-    return ts is not None and (utcnow() - ts) < _EMPTY_FALLBACK_TTL
+    return ts is not None and (time.monotonic() - ts) < _EMPTY_FALLBACK_TTL_SECONDS
 
 
 def _mark_empty_fallback(ticker: str, base_forms: List[str]) -> None:
@@ -84,7 +83,7 @@ def _mark_empty_fallback(ticker: str, base_forms: List[str]) -> None:
     _empty_fallback_cache.pop(key, None)  # refresh insertion order if already present (true LRU)
     if len(_empty_fallback_cache) >= _EMPTY_FALLBACK_MAX:
         _empty_fallback_cache.pop(next(iter(_empty_fallback_cache)), None)  # insertion-ordered → oldest
-    _empty_fallback_cache[key] = utcnow()
+    _empty_fallback_cache[key] = time.monotonic()
 
 
 def get_filing_by_accession(company: EdgarCompany, accession_number: str) -> list:
@@ -116,9 +115,9 @@ def get_filing_by_accession(company: EdgarCompany, accession_number: str) -> lis
 # hard. Staleness is a non-issue here — we fetch a FIXED historical filing by accession, not "latest".
 # NOTE: only the by-accession path uses this. The filings-LIST path (get_filings_multi) keeps building
 # a fresh entity per load so it always sees the newest recent window.
-_COMPANY_CACHE_TTL = timedelta(seconds=120)
+_COMPANY_CACHE_TTL_SECONDS = 120
 _COMPANY_CACHE_MAX = 4
-_company_cache: Dict[str, Tuple[EdgarCompany, datetime]] = {}
+_company_cache: Dict[str, Tuple[EdgarCompany, float]] = {}  # cik → (entity, time.monotonic())
 # Guards the cache + lock maps below. Per-CIK locks serialize concurrent same-CIK resolution so
 # edgartools' lazy full-load (which mutates the entity) can never race between the two concurrent
 # extractions. _company_locks is a WeakValueDictionary so an idle CIK's lock is garbage-collected
@@ -149,7 +148,7 @@ def _get_or_build_company(cik: str) -> EdgarCompany:
         # double-build this cache prevents. Keep the build-time timestamp: the TTL is memory hygiene
         # only, and staleness doesn't matter for fixed-accession lookups.
         entry = _company_cache.pop(cik, None)
-        if entry is not None and (utcnow() - entry[1]) < _COMPANY_CACHE_TTL:
+        if entry is not None and (time.monotonic() - entry[1]) < _COMPANY_CACHE_TTL_SECONDS:
             _company_cache[cik] = entry
             return entry[0]
     # Build OUTSIDE the global lock (construction hits the network); the per-CIK lock the caller holds
@@ -158,7 +157,7 @@ def _get_or_build_company(cik: str) -> EdgarCompany:
     with _company_cache_lock:
         if cik not in _company_cache and len(_company_cache) >= _COMPANY_CACHE_MAX:
             _company_cache.pop(next(iter(_company_cache)), None)  # LRU: least-recently-used is oldest
-        _company_cache[cik] = (company, utcnow())
+        _company_cache[cik] = (company, time.monotonic())
     return company
 
 
@@ -178,6 +177,40 @@ def resolve_filing_by_accession(cik: str, accession_number: str) -> Tuple[EdgarC
         return company, get_filing_by_accession(company, accession_number)
 
 
+# Shared pooled client for direct sec.gov GETs made by the edgar layer: the companyfacts fallback
+# (data.sec.gov), the company_tickers.json ticker map and filing documents (www.sec.gov). Reusing it
+# keeps TLS sessions and keep-alive connections warm instead of a fresh handshake per fetch. Created
+# lazily and tied to the event loop that made it — pooled connections are loop-bound, and tests run
+# several loops.
+_sec_client: Optional[httpx.AsyncClient] = None
+_sec_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_sec_client() -> httpx.AsyncClient:
+    """Return the shared sec.gov client for the running loop, creating it on first use.
+
+    Synchronous (no await between check and assignment), so no lock is needed for a single loop.
+    """
+    global _sec_client, _sec_client_loop
+    loop = asyncio.get_running_loop()
+    if _sec_client is None or _sec_client.is_closed or _sec_client_loop is not loop:
+        _sec_client = httpx.AsyncClient(
+            headers={"User-Agent": EDGAR_IDENTITY},
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        _sec_client_loop = loop
+    return _sec_client
+
+
+async def close_sec_client() -> None:
+    """Close the shared sec.gov client (app shutdown)."""
+    global _sec_client, _sec_client_loop
+    client, _sec_client, _sec_client_loop = _sec_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class EdgarClient:
     """
     Async client for SEC EDGAR operations using EdgarTools.
@@ -0,0 +1,176 @@
+"""
+On-disk cache for raw SEC companyfacts payloads.
+
+The companyfacts fallback downloads ``companyfacts/CIK##########.json`` (often several MB) for
+every filing it resolves, so summarizing a few filings of one company re-fetches the same payload.
+This keeps the gzipped response bytes per CIK under ``settings.COMPANYFACTS_CACHE_DIR`` for
+``COMPANYFACTS_CACHE_TTL_HOURS`` and bounds the directory to ``COMPANYFACTS_CACHE_MAX_FILES``
+files (least recently used go first). Disabled when the directory is unset.
+
+Past the TTL an entry is not dropped but revalidated: its response validators (``ETag`` /
+``Last-Modified``) are stored with it, so the next fetch is a conditional GET and an unchanged CIK
+costs a 304 instead of the full payload. Only entries older than ``COMPANYFACTS_CACHE_MAX_AGE_HOURS``
+are re-downloaded unconditionally.
+
+All functions are synchronous file I/O: call them through ``run_in_executor_with_timeout``.
+Failures are logged and treated as misses — the cache must never break the fallback.
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Validators ride inside the gzip payload as one header line so the entry and its validators are
+# replaced together by the atomic rename (a sidecar file could pair a new body with an old ETag).
+_VALIDATORS_MAGIC = b"#validators "
+
+
+class CachedCompanyFacts(NamedTuple):
+    raw: bytes
+    fresh: bool  # within COMPANYFACTS_CACHE_TTL_HOURS: usable without asking SEC
+    # Conditional-request headers (If-None-Match / If-Modified-Since); empty if SEC sent none.
+    validators: Dict[str, str]
+
+
+def validators_from_headers(headers) -> Dict[str, str]:
+    """Map a response's ETag/Last-Modified to the request headers that revalidate it."""
+    validators = {}
+    if headers.get("etag"):
+        validators["If-None-Match"] = headers["etag"]
+    if headers.get("last-modified"):
+        validators["If-Modified-Since"] = headers["last-modified"]
+    return validators
+
+
+def companyfacts_cache_enabled() -> bool:
+    """Whether the on-disk cache is configured (lets async callers skip the executor hop)."""
+    return bool(settings.COMPANYFACTS_CACHE_DIR)
+
+
+def _cache_dir() -> Optional[Path]:
+    configured = settings.COMPANYFACTS_CACHE_DIR
+    return Path(configured) if configured else None
+
+
+def _cache_path(cache_dir: Path, cik: str) -> Path:
+    return cache_dir / f"CIK{str(cik).lstrip('0').zfill(10)}.json.gz"
+
+
+def _pack(raw: bytes, validators: Optional[Dict[str, str]]) -> bytes:
+    if not validators:
+        return raw
+    return _VALIDATORS_MAGIC + json.dumps(validators).encode() + b"\n" + raw
+
+
+def _unpack(blob: bytes) -> Tuple[bytes, Dict[str, str]]:
+    if not blob.startswith(_VALIDATORS_MAGIC):
+        return blob, {}
+    header, _, raw = blob.partition(b"\n")
+    try:
+        return raw, json.loads(header[len(_VALIDATORS_MAGIC):])
+    except ValueError:
+        return raw, {}
+
+
+def read_companyfacts(cik: str) -> Optional[CachedCompanyFacts]:
+    """Return the cached companyfacts entry for ``cik``, or None on a miss/too-old/error.
+
+    A returned entry past the TTL has ``fresh=False``: revalidate it with its ``validators``.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    path = _cache_path(cache_dir, cik)
+    try:
+        mtime = path.stat().st_mtime
+        age = time.time() - mtime
+        if age >= settings.COMPANYFACTS_CACHE_MAX_AGE_HOURS * 3600:
+            return None
+        raw, validators = _unpack(gzip.decompress(path.read_bytes()))
+        # Reads refresh atime explicitly (noatime mounts are common) so the LRU sweep keeps hot CIKs.
+        os.utime(path, (time.time(), mtime))
+        return CachedCompanyFacts(raw, age < settings.COMPANYFACTS_CACHE_TTL_HOURS * 3600, validators)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, gzip.BadGzipFile) as e:
+        logger.warning(f"Companyfacts cache read failed for CIK {cik}: {e}")
+        return None
+
+
+def write_companyfacts(cik: str, raw: bytes, validators: Optional[Dict[str, str]] = None) -> None:
+    """Store the raw companyfacts JSON (and its revalidation headers) for ``cik``, then trim the
+    directory to its file cap."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    path = _cache_path(cache_dir, cik)
+    tmp_path = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a half-written file. The temp name is
+        # unique per write: executor threads can store the same CIK at once (two accessions of one
+        # company), and a shared name would let one rename move the other's half-written file.
+        payload = gzip.compress(_pack(raw, validators), compresslevel=6)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            tmp.write(payload)
+        os.replace(tmp_path, path)
+        tmp_path = None
+        _evict_over_cap(cache_dir)
+    except OSError as e:
+        logger.warning(f"Companyfacts cache write failed for CIK {cik}: {e}")
+    finally:
+        if tmp_path is not None:  # failed before the rename: don't leave the temp file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def mark_companyfacts_revalidated(cik: str) -> None:
+    """Restart ``cik``'s TTL after SEC answered 304 Not Modified (the body is still current)."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        os.utime(_cache_path(cache_dir, cik))
+    except OSError as e:
+        logger.warning(f"Companyfacts cache touch failed for CIK {cik}: {e}")
+
+
+def _last_use(path: Path) -> Optional[float]:
+    """The file's atime, or None if another worker/thread removed it since the glob."""
+    try:
+        return path.stat().st_atime
+    except FileNotFoundError:
+        return None
+
+
+def _evict_over_cap(cache_dir: Path) -> None:
+    files = list(cache_dir.glob("CIK*.json.gz"))
+    if len(files) <= settings.COMPANYFACTS_CACHE_MAX_FILES:
+        return
+    # Stat every file once up front (skipping ones already gone), then sort: a concurrent delete
+    # mid-sort would otherwise raise out of the key function and report a successful write as failed.
+    last_used = [(atime, path) for path in files if (atime := _last_use(path)) is not None]
+    excess = len(last_used) - settings.COMPANYFACTS_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    last_used.sort(key=itemgetter(0))
+    for _, stale in last_used[:excess]:
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
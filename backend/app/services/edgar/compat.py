@@ -10,15 +10,15 @@ Usage:
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
 from typing import Any, Dict, List, Optional
 
 import httpx
 
-from .client import edgar_client
+from .client import edgar_client, get_sec_client
 from .xbrl_service import edgar_xbrl_service, clear_xbrl_cache, get_xbrl_cache_stats
 from .exceptions import EdgarError
-from .config import FilingType, EDGAR_IDENTITY
+from .config import FilingType
 from .circuit_breaker import edgar_circuit_breaker, CircuitOpenError
 from app.services.sec_rate_limiter import sec_rate_limiter
 
@@ -35,13 +35,14 @@ class SECEdgarServiceCompat:
 
     # Cached company tickers for fast local search
     _tickers_cache: Optional[Dict[str, Dict]] = None
-    _tickers_cache_time: Optional[datetime] = None
-    _cache_ttl = timedelta(hours=24)
+    # time.monotonic() stamp of the last refresh: a float compare per lookup, immune to clock jumps.
+    _tickers_cache_time: Optional[float] = None
+    _cache_ttl_seconds = 24 * 3600
     # CIK (leading-zeros stripped) → primary ticker, derived from the tickers cache and rebuilt
     # only when that cache refreshes (P0-1). Memoized so the /search hot path does an O(1)
     # lookup per CIK instead of an O(N) scan of the ~10k-entry file per CIK.
     _primary_map: Optional[Dict[str, str]] = None
-    _primary_map_built_at: Optional[datetime] = None
+    _primary_map_built_at: Optional[float] = None
 
     async def _get_cached_tickers(self) -> Dict[str, Dict]:
         """
@@ -56,7 +57,7 @@ class SECEdgarServiceCompat:
         if (
             self._tickers_cache is not None
             and self._tickers_cache_time is not None
-            and datetime.now() - self._tickers_cache_time < self._cache_ttl
+            and time.monotonic() - self._tickers_cache_time < self._cache_ttl_seconds
         ):
             return self._tickers_cache
 
@@ -66,7 +67,7 @@ class SECEdgarServiceCompat:
         if redis_data is not None:
             logger.debug("SEC tickers L2 cache hit")
             SECEdgarServiceCompat._tickers_cache = redis_data
-            SECEdgarServiceCompat._tickers_cache_time = datetime.now()
+            SECEdgarServiceCompat._tickers_cache_time = time.monotonic()
             return redis_data
 
         # Fetch from SEC EDGAR
@@ -77,26 +78,26 @@ class SECEdgarServiceCompat:
                 # restart), so it must fail-fast and fall back to the stale cache below rather than
                 # sleep through the 5-attempt / Retry-After-120s ladder — that belongs to cron-shaped
                 # callers (S4 review #3). It carried the breaker but bypassed the limiter.
-                async with httpx.AsyncClient() as client:
-                    async def _do_request() -> httpx.Response:
-                        resp = await client.get(
-                            "https://www.sec.gov/files/company_tickers.json",
-                            headers={"User-Agent": EDGAR_IDENTITY},
-                            timeout=15.0,
-                        )
-                        resp.raise_for_status()
-                        return resp
-
-                    response = await sec_rate_limiter.execute(_do_request)
-                    data = response.json()
-
-                    # Update both cache tiers
-                    SECEdgarServiceCompat._tickers_cache = data
-                    SECEdgarServiceCompat._tickers_cache_time = datetime.now()
-                    await self._set_tickers_to_redis(redis_key, data)
-
-                    logger.debug("SEC tickers fetched and cached (L1+L2)")
-                    return data
+                # Shared pooled sec.gov client (keep-alive + TLS reuse, EDGAR User-Agent preset).
+                client = get_sec_client()
+                async def _do_request() -> httpx.Response:
+                    resp = await client.get(
+                        "https://www.sec.gov/files/company_tickers.json",
+                        timeout=15.0,
+                    )
+                    resp.raise_for_status()
+                    return resp
+
+                response = await sec_rate_limiter.execute(_do_request)
+                data = response.json()
+
+                # Update both cache tiers
+                SECEdgarServiceCompat._tickers_cache = data
+                SECEdgarServiceCompat._tickers_cache_time = time.monotonic()
+                await self._set_tickers_to_redis(redis_key, data)
+
+                logger.debug("SEC tickers fetched and cached (L1+L2)")
+                return data
         except CircuitOpenError as e:
             if self._tickers_cache is not None:
                 logger.warning("SEC circuit breaker open, serving stale cache: %s", e)
@@ -300,28 +301,28 @@ class SECEdgarServiceCompat:
 
         try:
             async with edgar_circuit_breaker:
-                async with httpx.AsyncClient() as client:
-                    # Each attempt acquires a limiter token before hitting sec.gov (the fetch carried
-                    # the breaker but bypassed the limiter). The manual exponential backoff below owns
-                    # retries, so use execute() (token wait) not execute_with_backoff.
-                    async def _do_get() -> httpx.Response:
-                        resp = await client.get(
-                            document_url,
-                            headers={"User-Agent": EDGAR_IDENTITY},
-                            timeout=timeout,
-                            follow_redirects=True,
-                        )
-                        resp.raise_for_status()
-                        return resp
-
-                    for attempt in range(max_retries):
-                        try:
-                            response = await sec_rate_limiter.execute(_do_get)
-                            return response.text
-                        except Exception:
-                            if attempt == max_retries - 1:
-                                raise
-                            await aio.sleep(2 ** attempt)
+                # Shared pooled sec.gov client (keep-alive + TLS reuse, EDGAR User-Agent preset).
+                client = get_sec_client()
+                # Each attempt acquires a limiter token before hitting sec.gov (the fetch carried
+                # the breaker but bypassed the limiter). The manual exponential backoff below owns
+                # retries, so use execute() (token wait) not execute_with_backoff.
+                async def _do_get() -> httpx.Response:
+                    resp = await client.get(
+                        document_url,
+                        timeout=timeout,
+                        follow_redirects=True,
+                    )
+                    resp.raise_for_status()
+                    return resp
+
+                for attempt in range(max_retries):
+                    try:
+                        response = await sec_rate_limiter.execute(_do_get)
+                        return response.text
+                    except Exception:
+                        if attempt == max_retries - 1:
+                            raise
+                        await aio.sleep(2 ** attempt)
         except CircuitOpenError as e:
             raise EdgarError(f"SEC EDGAR circuit breaker is open: {e}", cause=e)
         except Exception as e:
@@ -18,6 +18,7 @@ exercise these functions with fake fact-query objects.
 import logging
 import math
 from datetime import date
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -318,7 +319,7 @@ def _resolve_period_value(facts: List[Tuple[float, float]]) -> Optional[float]:
     distinct = {round(v, 4) for v, _ in facts}
     if len(distinct) <= 1:
         return next(iter(distinct)) if distinct else None
-    best_value, _best_dec = max(facts, key=lambda vd: vd[1])
+    best_value, _best_dec = max(facts, key=itemgetter(1))
     for value, dec in facts:
         if round(value, 4) == round(best_value, 4):
             continue
@@ -438,7 +439,7 @@ def dividend_component_sum_series(
             continue
         for end, value in series:
             totals[end] = totals.get(end, 0.0) + value
-    return sorted(totals.items(), key=lambda kv: kv[0], reverse=True), currency
+    return sorted(totals.items(), key=itemgetter(0), reverse=True), currency
 
 
 def instant_series_with_currency(
@@ -826,7 +827,7 @@ def _statement_period_columns(df: Any, form: str) -> List[Tuple[str, Any]]:
             continue
         seen.add(key)
         cols.append((end, col))
-    cols.sort(key=lambda pc: pc[0], reverse=True)
+    cols.sort(key=itemgetter(0), reverse=True)
     return cols
 
 
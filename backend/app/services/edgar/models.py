@@ -14,7 +14,7 @@ All models use dataclasses for:
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import FilingType
 
@@ -177,31 +177,19 @@ class MetricChange:
     direction: Optional[str] = None  # "increase", "decrease", "unchanged"
 
     @staticmethod
-    def compute(
+    def _fields(
         current_value: Optional[float],
         prior_value: Optional[float]
-    ) -> "MetricChange":
-        """
-        Compute period-over-period change.
-
-        Args:
-            current_value: Current period value
-            prior_value: Prior period value
-
-        Returns:
-            MetricChange with computed values
-        """
+    ) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+        """(absolute, percentage, direction) shared by compute() and compute_dict()."""
         if current_value is None or prior_value is None:
-            return MetricChange()
+            return None, None, None
 
         if prior_value == 0:
             direction = "increase" if current_value > 0 else (
                 "decrease" if current_value < 0 else "unchanged"
             )
-            return MetricChange(
-                absolute=round(current_value, 2),
-                direction=direction,
-            )
+            return round(current_value, 2), None, direction
 
         absolute_change = current_value - prior_value
         percentage_change = (absolute_change / abs(prior_value)) * 100
@@ -213,11 +201,34 @@ class MetricChange:
         else:
             direction = "unchanged"
 
-        return MetricChange(
-            absolute=round(absolute_change, 2),
-            percentage=round(percentage_change, 2),
-            direction=direction,
-        )
+        return round(absolute_change, 2), round(percentage_change, 2), direction
+
+    @staticmethod
+    def compute(
+        current_value: Optional[float],
+        prior_value: Optional[float]
+    ) -> "MetricChange":
+        """
+        Compute period-over-period change.
+
+        Args:
+            current_value: Current period value
+            prior_value: Prior period value
+
+        Returns:
+            MetricChange with computed values
+        """
+        absolute, percentage, direction = MetricChange._fields(current_value, prior_value)
+        return MetricChange(absolute=absolute, percentage=percentage, direction=direction)
+
+    @staticmethod
+    def compute_dict(
+        current_value: Optional[float],
+        prior_value: Optional[float]
+    ) -> Dict[str, Any]:
+        """Same as ``compute(...).to_dict()`` without building the intermediate dataclass."""
+        absolute, percentage, direction = MetricChange._fields(current_value, prior_value)
+        return {"absolute": absolute, "percentage": percentage, "direction": direction}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -14,8 +14,13 @@ Schema notes for ``Statement.to_dataframe()`` in edgartools 5.x:
   bare ``"2025-06-30"``.
 """
 
+import heapq
 import re
-from typing import Any, List, Optional, Tuple
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
 
 _PERIOD_COLUMN_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:\s*\((\w+)\))?$")
 
@@ -48,19 +53,6 @@ def normalize_concept(concept: Any) -> str:
     return re.sub(r"^[a-z][\w-]*[_:](?=[A-Z])", "", text)
 
 
-def _coerce_scalar(value: Any) -> Optional[float]:
-    """Convert a cell to float, rejecting None/NaN/non-numeric values."""
-    if value is None:
-        return None
-    try:
-        result = float(value)
-    except (ValueError, TypeError):
-        return None
-    if result != result:  # NaN
-        return None
-    return result
-
-
 def period_columns(df) -> List[Tuple[str, str, Optional[str]]]:
     """Return ``(column_label, period_iso, duration_marker)`` for period columns."""
     found = []
@@ -71,20 +63,38 @@ def period_columns(df) -> List[Tuple[str, str, Optional[str]]]:
     return found
 
 
-def extract_metric_values(
-    df, candidates: List[str]
-) -> Tuple[Optional[str], List[Tuple[str, float]]]:
-    """Extract ``(matched_concept, [(period_iso, value), ...])``.
+@dataclass(frozen=True)
+class StatementRows:
+    """A statement DataFrame pre-indexed for repeated metric lookups.
 
-    Matches ``candidates`` (bare concept names, e.g. ``"NetIncomeLoss"``)
-    against the ``concept`` column when present, else against the index
-    (legacy shape). Dimension/abstract rows are excluded. When the same
-    period end appears under multiple duration markers, the full-period
-    value (FY, then the longest quarter marker) wins. Values are sorted
-    by period descending.
+    Built once per statement by ``index_statement``: dimension/abstract rows
+    are dropped and concepts normalized a single time, and ``present`` holds
+    the concept names so each candidate probe is one set lookup. Several
+    metrics are read from the same statement, so sharing this avoids
+    re-filtering and re-normalizing every row per metric. ``periods`` holds the
+    parsed period columns for the same reason.
     """
+
+    rows: Any
+    concepts: Any  # normalized concept per row; None for the legacy index shape
+    present: frozenset
+    periods: Tuple[Tuple[int, str, Optional[str]], ...]  # (column position, period_iso, marker)
+
+
+def _period_positions(df) -> Tuple[Tuple[int, str, Optional[str]], ...]:
+    """Parse the period columns once: ``(column position, period_iso, duration marker)``."""
+    found = []
+    for pos, col in enumerate(df.columns):
+        match = _PERIOD_COLUMN_RE.match(str(col).strip())
+        if match:
+            found.append((pos, match.group(1), match.group(2)))
+    return tuple(found)
+
+
+def index_statement(df) -> Optional[StatementRows]:
+    """Index a statement DataFrame for ``extract_metric_values`` (None if empty)."""
     if df is None or df.empty:
-        return None, []
+        return None
 
     if "concept" in df.columns:
         rows = df
@@ -93,40 +103,65 @@ def extract_metric_values(
         if "dimension" in df.columns:
             rows = rows[rows["dimension"] != True]  # noqa: E712
         concepts = rows["concept"].map(normalize_concept)
-        for candidate in candidates:
-            matched = rows[concepts == candidate]
-            if matched.empty:
-                continue
-            return candidate, _values_from_rows(matched)
-        return None, []
+        return StatementRows(rows, concepts, frozenset(concepts.tolist()), _period_positions(rows))
 
     # Legacy shape: concepts as index, period columns directly.
-    for candidate in candidates:
-        if candidate in df.index:
-            return candidate, _values_from_rows(df.loc[[candidate]])
-    return None, []
+    return StatementRows(df, None, frozenset(df.index.tolist()), _period_positions(df))
+
+
+def extract_metric_values(
+    df, candidates: Sequence[str], limit: Optional[int] = None
+) -> Tuple[Optional[str], List[Tuple[str, float]]]:
+    """Extract ``(matched_concept, [(period_iso, value), ...])``.
+
+    Matches ``candidates`` (bare concept names, e.g. ``"NetIncomeLoss"``)
+    against the ``concept`` column when present, else against the index
+    (legacy shape). Dimension/abstract rows are excluded. When the same
+    period end appears under multiple duration markers, the full-period
+    value (FY, then the longest quarter marker) wins. Values are sorted
+    by period descending; ``limit`` keeps only the most recent N periods
+    (a partial top-N selection rather than a full sort).
 
+    ``df`` may be a DataFrame or a ``StatementRows`` from ``index_statement``
+    (pass the latter when reading several metrics from one statement).
+    """
+    stmt = df if isinstance(df, StatementRows) else index_statement(df)
+    if stmt is None:
+        return None, []
+
+    candidate = next((c for c in candidates if c in stmt.present), None)
+    if candidate is None:
+        return None, []
+    if stmt.concepts is None:
+        return candidate, _values_from_rows(stmt.rows.loc[[candidate]], stmt.periods, limit)
+    return candidate, _values_from_rows(stmt.rows[stmt.concepts == candidate], stmt.periods, limit)
+
+
+def _values_from_rows(
+    matched, periods: Sequence[Tuple[int, str, Optional[str]]], limit: Optional[int] = None
+) -> List[Tuple[str, float]]:
+    if not periods:
+        return []
+
+    # Select period columns positionally so duplicate column labels yield each column exactly
+    # once, then coerce every cell in one vectorized pass (None/NaN/non-numeric -> NaN) and take
+    # each column's first non-NaN value: the first consolidated row for a column wins.
+    # Fast paths: statements that arrive with float columns skip the per-column coercion, and the
+    # usual single matched row needs no back-fill.
+    block = matched.iloc[:, [pos for pos, _, _ in periods]].set_axis(range(len(periods)), axis=1)
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in block.dtypes):
+        block = block.apply(pd.to_numeric, errors="coerce")
+    firsts = (block.iloc[0] if len(block) == 1 else block.bfill().iloc[0]).tolist()
 
-def _values_from_rows(matched) -> List[Tuple[str, float]]:
     best: dict = {}  # period_iso -> (duration_rank, value)
-    # Iterate positionally so duplicate column labels yield each scalar exactly
-    # once instead of a sub-Series that fails float() conversion.
-    for pos, col in enumerate(matched.columns):
-        match = _PERIOD_COLUMN_RE.match(str(col).strip())
-        if not match:
+    for (_, period_iso, marker), value in zip(periods, firsts):
+        if value != value:  # NaN: no numeric value in this column
             continue
-        period_iso, marker = match.group(1), match.group(2)
-        for value in matched.iloc[:, pos].tolist():
-            scalar = _coerce_scalar(value)
-            if scalar is None:
-                continue
-            rank = _DURATION_RANK.get(marker, 5) if marker else 5
-            current = best.get(period_iso)
-            if current is None or rank < current[0]:
-                best[period_iso] = (rank, scalar)
-            break  # first consolidated row for this column wins
-    return sorted(
-        ((period, value) for period, (_, value) in best.items()),
-        key=lambda item: item[0],
-        reverse=True,
-    )
+        rank = _DURATION_RANK.get(marker, 5) if marker else 5
+        current = best.get(period_iso)
+        if current is None or rank < current[0]:
+            best[period_iso] = (rank, float(value))
+    values = [(period, value) for period, (_, value) in best.items()]
+    if limit is not None:
+        return heapq.nlargest(limit, values, key=itemgetter(0))
+    return sorted(values, key=itemgetter(0), reverse=True)
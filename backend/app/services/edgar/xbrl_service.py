@@ -6,7 +6,7 @@ This service maintains API compatibility with the legacy xbrl_service.py
 to enable gradual migration.
 
 Caching Strategy (Two-Tier):
-- L1: In-memory cache (fast, process-local, LRU eviction at 1000 entries)
+- L1: In-memory cache (fast, process-local, least-hit eviction with periodic ageing at 1000 entries)
 - L2: Redis cache (persistent, shared across instances)
 
 Usage:
@@ -20,11 +20,18 @@ Usage:
 """
 
 import asyncio
+import heapq
 import logging
+import sys
+import threading
+import time
 from collections import OrderedDict
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import httpx
+import orjson
 from edgar import Company as EdgarCompany, set_identity
 
 # The XBRL primary-path calls use a plain timeout, NOT run_with_circuit_breaker: large filings
@@ -34,8 +41,16 @@ from edgar import Company as EdgarCompany, set_identity
 # detector reporting the opposite of the truth. The fetch-shaped calls in edgar/client.py +
 # edgar/compat.py give the breaker its clean SEC-health signal (S4 review, finding #2).
 from .async_executor import run_in_executor_with_timeout
-from .client import resolve_filing_by_accession
+from .client import get_sec_client, resolve_filing_by_accession
+from app.services.redis_service import CacheTTL, cache_get, cache_set
 from app.services.sec_rate_limiter import sec_rate_limiter
+from .companyfacts_cache import (
+    companyfacts_cache_enabled,
+    mark_companyfacts_revalidated,
+    read_companyfacts,
+    validators_from_headers,
+    write_companyfacts,
+)
 from .config import EDGAR_IDENTITY, EDGAR_DEFAULT_TIMEOUT_SECONDS
 from .ads_ratios import ads_ratio_for_cik, build_per_ads_eps
 from .instance_extractor import (
@@ -53,7 +68,7 @@ from .instance_extractor import (
     segment_series_by_member,
 )
 from .models import MetricChange
-from .statement_parser import extract_metric_values, statement_dataframe
+from .statement_parser import extract_metric_values, index_statement, statement_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +77,60 @@ logger = logging.getLogger(__name__)
 # unrestricted-cash tag is present — the JPM-class bank case whose only cash line is the
 # migrated tag (data-quality plan P0-3). test_cash_registry_consistency.py pins this ordering
 # across all three cash registries.
-CASH_TAG_CANDIDATES: List[str] = [
+CASH_TAG_CANDIDATES: Tuple[str, ...] = (
     "CashAndCashEquivalentsAtCarryingValue",
     "Cash",
     "CashAndCashEquivalents",
     "CashCashEquivalentsAndShortTermInvestments",
     "CashCashEquivalentsRestrictedCashAndRestrictedCashEquivalents",
-]
+)
+
+# Latest-financials fallback (Company.get_financials): per statement, the metrics read from it and
+# their candidate concepts in priority order. Module-level so the tuples are built once, not per call.
+_LATEST_FINANCIALS_CANDIDATES: Tuple[Tuple[str, Tuple[Tuple[str, Sequence[str]], ...]], ...] = (
+    ("income_statement", (
+        ("revenue", ("RevenueFromContractWithCustomerExcludingAssessedTax", "Revenues",
+                     "Revenue", "TotalRevenue", "TotalRevenues", "NetSales", "SalesRevenueNet")),
+        ("net_income", ("NetIncomeLoss", "ProfitLoss", "NetIncome",
+                        "NetIncomeLossAvailableToCommonStockholdersBasic")),
+        ("earnings_per_share", ("EarningsPerShareBasic", "EarningsPerShareDiluted",
+                                "BasicEarningsPerShare", "EarningsPerShareBasicAndDiluted")),
+        ("eps_diluted", ("EarningsPerShareDiluted", "EarningsPerShareBasicAndDiluted")),
+        ("gross_profit", ("GrossProfit",)),
+        ("operating_income", ("OperatingIncomeLoss",)),
+    )),
+    ("balance_sheet", (
+        ("total_assets", ("Assets", "TotalAssets")),
+        ("total_liabilities", ("Liabilities", "TotalLiabilities", "LiabilitiesAndStockholdersEquity")),
+        ("cash_and_equivalents", CASH_TAG_CANDIDATES),
+        ("shareholders_equity", ("StockholdersEquity",
+                                 "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest")),
+        ("long_term_debt", ("LongTermDebtNoncurrent", "LongTermDebt")),
+    )),
+    # P1.1 depth: operating CF + capex -> free cash flow
+    ("cash_flow_statement", (
+        ("operating_cash_flow", ("NetCashProvidedByUsedInOperatingActivities",
+                                 "NetCashProvidedByUsedInOperatingActivitiesContinuingOperations")),
+        ("capital_expenditures", ("PaymentsToAcquirePropertyPlantAndEquipment",
+                                  "PaymentsToAcquireProductiveAssets")),
+    )),
+)
+
+# Companyfacts concept candidates per metric, with the unit keys to try for each.
+# Looked up directly in us-gaap: a handful of probes beats walking the several
+# hundred concepts a large filer reports.
+_COMPANY_FACTS_CANDIDATES: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    ("revenue", ("Revenues", "Revenue", "RevenueFromContractWithCustomerExcludingAssessedTax",
+                 "SalesRevenueNet", "NetSales", "TotalRevenue"), ("USD",)),
+    ("net_income", ("NetIncomeLoss", "ProfitLoss", "NetIncomeLossAvailableToCommonStockholdersBasic"),
+     ("USD",)),
+    ("total_assets", ("Assets",), ("USD",)),
+    ("earnings_per_share", ("EarningsPerShareBasic", "EarningsPerShareDiluted",
+                            "EarningsPerShareBasicAndDiluted"), ("USD/shares", "USD", "pure")),
+)
+
+# Companyfacts payloads at least this large are decoded + parsed in the executor, not on the loop.
+_COMPANY_FACTS_OFFLOAD_BYTES = 1 << 20
 
 # Ensure identity is set
 set_identity(EDGAR_IDENTITY)
@@ -83,20 +145,94 @@ set_identity(EDGAR_IDENTITY)
 # new keys and must age out so the §4 deterministic feed sees them without a manual refresh.
 _XBRL_CACHE_VERSION = "v4"
 
-# Module-level cache for XBRL data (L1 - in-memory with LRU eviction)
+# Module-level cache for XBRL data (L1 - in-memory with least-hit (LFU) eviction and ageing)
 # Key: "{cik}:{accession_number}"
-# Value: (cached_datetime, data_dict)
-# Using OrderedDict for LRU eviction - most recently accessed items at end
-_xbrl_cache: OrderedDict[str, Tuple[datetime, Optional[Dict]]] = OrderedDict()
-_cache_ttl = timedelta(hours=24)
-_cache_max_size = 1000  # Maximum entries before LRU eviction
+# Value: [cached_monotonic_seconds, data_dict, hit_count] — a list so a hit can bump the counter
+# in place. Eviction drops the entry with the fewest hits (ties: oldest insertion), so a hit is a
+# read + integer increment with no reordering; the O(n) victim scan runs only on eviction.
+# Timestamps are time.monotonic() floats: the TTL check on every hit is plain float arithmetic
+# (no datetime/timedelta allocation) and immune to wall-clock jumps.
+_xbrl_cache: OrderedDict[str, List[Any]] = OrderedDict()
+_CACHE_TTL_SECONDS = 24 * 3600
+_cache_max_size = 1000  # Maximum entries before eviction
+# Backstop only: hit counters are also halved if one reaches this within a single ageing interval.
+_HIT_COUNT_CEILING = 1 << 30
+
+# Expired entries are only dropped on a hit-after-expiry, so cold ones would otherwise sit in L1
+# until capacity eviction. Inserts sweep them at most this often (and always when the cache is
+# full, so dead entries go before live ones are evicted) instead of checking on every call.
+_SWEEP_INTERVAL_SECONDS = 600
+_last_sweep = 0.0
+# Ageing: the sweep also halves every live hit counter at most once per interval, so an entry that
+# was hot hours ago loses to current traffic instead of pinning itself for the whole 24h TTL. Kept
+# apart from _last_sweep, which full-cache inserts reset on every call.
+_last_decay = time.monotonic()
 
 # Cache operation counters for structured logging and metrics
 _cache_hits = 0
 _cache_misses = 0
 _cache_evictions = 0
+_cache_expirations = 0
+
+# In-flight L1-miss loads keyed like _xbrl_cache: concurrent requests for the same filing await
+# one shared future instead of stampeding Redis/EdgarTools/SEC with duplicate fetches.
+# Process-local is the right scope — prod is a single Cloud Run instance with Redis off.
+_inflight_fetches: Dict[str, asyncio.Future] = {}
+
+# Memo for extract_standardized_metrics. The same xbrl_data dict is standardized repeatedly (the
+# L1 cache hands out one shared dict per filing; the summary pipeline, provenance and facts writers
+# each extract from it), so results are kept for the last few inputs. Key: id(xbrl_data). Value:
+# (xbrl_data, fingerprint, metrics) — holding the input pins its id so it can't be reused by a
+# different dict while the entry lives; the fingerprint snapshots the input's values so in-place
+# growth OR an in-place value correction rebuilds. Callers get a copy of the memoized result (see
+# _copy_standardized). Extraction also runs in worker threads (facts backfill), hence a threading lock.
+_standardized_memo: OrderedDict[int, Tuple[Dict, Tuple, Dict[str, Any]]] = OrderedDict()
+_STANDARDIZED_MEMO_SIZE = 64
+_standardized_memo_lock = threading.Lock()
+
+
+def _standardized_fingerprint(xbrl_data: Dict) -> Tuple:
+    """Snapshot of everything standardization reads, compared with ``==`` (never hashed).
+
+    Series entries and dict annotations (ads_ratio) are captured one level deep: a value edited
+    inside an entry dict changes the fingerprint. Edits nested deeper than that are not tracked.
+    """
+    return tuple(
+        (key, [tuple(entry.values()) if type(entry) is dict else entry for entry in value])
+        if isinstance(value, list)
+        else (key, tuple(value.items())) if isinstance(value, dict)
+        else (key, value)
+        for key, value in xbrl_data.items()
+    )
+
+
+def _copy_standardized(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a standardized-metrics dict down to its leaf dicts (~14x cheaper than deepcopy).
 
-# Async lock to protect cache operations from concurrent coroutine access.
+    Every value below a metric entry is a flat dict (series points, change, per_ads) or a list of
+    them, so this is a full copy: mutating the result can't reach the memoized original. A metric's
+    ``current``/``prior`` stay the same objects as ``series[0]``/``series[1]``, as when built.
+    """
+    copied: Dict[str, Any] = {}
+    for key, value in metrics.items():
+        if type(value) is dict:
+            entry = {k: dict(v) if type(v) is dict else v for k, v in value.items()}
+            series = value.get("series")
+            if series:
+                series = entry["series"] = [dict(point) for point in series]
+                entry["current"] = series[0]
+                if "prior" in entry:
+                    entry["prior"] = series[1]
+            copied[key] = entry
+        elif type(value) is list:
+            copied[key] = [dict(row) if type(row) is dict else row for row in value]
+        else:
+            copied[key] = value
+    return copied
+
+
+# Async lock to protect cache mutations (insert/evict/expire) from concurrent coroutine access.
+# The L1 hit path in get_xbrl_data is deliberately lock-free (see the comment there).
 # WHY lazy initialization: asyncio.Lock must be created within an event loop context.
 # If created at module import time (outside of async context), it binds to no loop
 # or the wrong loop, causing "attached to a different loop" errors.
@@ -140,28 +276,103 @@ async def async_clear_xbrl_cache() -> int:
         return count
 
 
-def _cache_set_sync(key: str, value: Tuple[datetime, Optional[Dict]]) -> None:
+# Per-entry string fields that repeat heavily across a filing's series: every metric shares the
+# same handful of period ends, forms and accession numbers.
+_SERIES_STRING_FIELDS = ("period", "form", "accn", "currency", "raw_tag")
+
+
+def _intern_series_strings(data: Dict[str, Any]) -> None:
+    """Intern the repeated string fields of every series entry in place before L1 storage.
+
+    A payload decoded from Redis (or assembled from companyfacts JSON) carries a separate str
+    object per occurrence, so ~20 metrics x 5 entries hold hundreds of copies of a dozen distinct
+    strings. Interning collapses them to shared objects for as long as the entry sits in L1.
+    """
+    if not isinstance(data, dict):
+        return
+    for series in data.values():
+        if not isinstance(series, list):
+            continue
+        for entry in series:
+            if not isinstance(entry, dict):
+                continue
+            for field in _SERIES_STRING_FIELDS:
+                value = entry.get(field)
+                if type(value) is str:
+                    entry[field] = sys.intern(value)
+
+
+def _record_cache_hit(entry: List[Any]) -> None:
+    """Bump an entry's hit counter, halving every counter once one saturates (ageing)."""
+    entry[2] += 1
+    if entry[2] >= _HIT_COUNT_CEILING:
+        for other in _xbrl_cache.values():
+            other[2] >>= 1
+
+
+def _sweep_expired_sync(now: float) -> int:
+    """Drop every expired L1 entry and age live hit counters (call within lock).
+
+    Returns the number removed. Counters are halved in the same pass, at most once per
+    ``_SWEEP_INTERVAL_SECONDS``.
+    """
+    global _last_sweep, _last_decay, _cache_expirations
+
+    _last_sweep = now
+    decay = now - _last_decay >= _SWEEP_INTERVAL_SECONDS
+    if decay:
+        _last_decay = now
+    expired = []
+    for k, entry in _xbrl_cache.items():
+        if now - entry[0] >= _CACHE_TTL_SECONDS:
+            expired.append(k)
+        elif decay:
+            entry[2] >>= 1
+    for k in expired:
+        del _xbrl_cache[k]
+    if expired:
+        _cache_expirations += len(expired)
+        logger.info(
+            "XBRL L1 cache sweep",
+            extra={
+                "event": "cache_sweep",
+                "cache_type": "xbrl_l1",
+                "expired_count": len(expired),
+                "cache_size": len(_xbrl_cache),
+            }
+        )
+    return len(expired)
+
+
+def _cache_set_sync(key: str, value: Tuple[float, Optional[Dict]]) -> None:
     """
-    Set a value in L1 cache with LRU eviction (sync version, call within lock).
+    Set a value in L1 cache with least-hit (LFU) eviction (sync version, call within lock).
 
-    If cache exceeds max size, evicts oldest entries (least recently used).
-    Tracks eviction count for metrics and uses structured logging.
+    If the cache is full, evicts the least-hit entries (oldest first on ties) BEFORE inserting,
+    so a brand-new entry is never its own victim. Hit counts age via the periodic sweep, so past
+    popularity decays. Tracks eviction count for metrics and uses structured logging.
     """
     global _xbrl_cache, _cache_evictions
 
-    # If key exists, move to end (most recently used)
-    if key in _xbrl_cache:
-        _xbrl_cache.move_to_end(key)
-        _xbrl_cache[key] = value
+    cached_time, data = value
+
+    # If key exists, refresh it in place (keeps its hit count and position)
+    existing = _xbrl_cache.get(key)
+    if existing is not None:
+        existing[0], existing[1] = cached_time, data
         return
 
-    # Add new entry
-    _xbrl_cache[key] = value
+    # Periodic TTL sweep; runs before the new entry is added so it can never sweep it.
+    now = time.monotonic()
+    if len(_xbrl_cache) >= _cache_max_size or now - _last_sweep >= _SWEEP_INTERVAL_SECONDS:
+        _sweep_expired_sync(now)
 
-    # Evict oldest entries if over max size
+    # Evict least-hit entries until there is room for the new one
     evicted_this_call = 0
-    while len(_xbrl_cache) > _cache_max_size:
-        oldest_key, (cached_time, _) = _xbrl_cache.popitem(last=False)
+    while _xbrl_cache and len(_xbrl_cache) >= _cache_max_size:
+        # min() returns the first minimum in insertion order, so ties evict the oldest entry.
+        oldest_key = min(_xbrl_cache, key=lambda k: _xbrl_cache[k][2])
+        evicted_time = _xbrl_cache.pop(oldest_key)[0]
         _cache_evictions += 1
         evicted_this_call += 1
         # Structured log with key details for debugging cache pressure
@@ -171,12 +382,15 @@ def _cache_set_sync(key: str, value: Tuple[datetime, Optional[Dict]]) -> None:
                 "event": "cache_eviction",
                 "cache_type": "xbrl_l1",
                 "evicted_key": oldest_key,
-                "entry_age_hours": round((datetime.now() - cached_time).total_seconds() / 3600, 2),
+                "entry_age_hours": round((time.monotonic() - evicted_time) / 3600, 2),
                 "cache_size": len(_xbrl_cache),
                 "total_evictions": _cache_evictions,
             }
         )
 
+    # Add new entry
+    _xbrl_cache[key] = [cached_time, data, 0]
+
     # Log batch eviction summary if multiple entries evicted
     if evicted_this_call > 1:
         logger.warning(
@@ -198,11 +412,11 @@ def get_xbrl_cache_stats() -> Dict[str, Any]:
     Returns dict with both new (l1_*) and legacy (total_entries, valid_entries)
     keys for backward compatibility.
     """
-    now = datetime.now()
+    now = time.monotonic()
     total = len(_xbrl_cache)
     valid_count = sum(
-        1 for cached_time, _ in _xbrl_cache.values()
-        if now - cached_time < _cache_ttl
+        1 for entry in _xbrl_cache.values()
+        if now - entry[0] < _CACHE_TTL_SECONDS
     )
     expired_count = total - valid_count
 
@@ -221,7 +435,8 @@ def get_xbrl_cache_stats() -> Dict[str, Any]:
         "l1_misses": _cache_misses,
         "l1_hit_rate": hit_rate,
         "l1_evictions": _cache_evictions,
-        "cache_ttl_hours": _cache_ttl.total_seconds() / 3600,
+        "l1_expirations": _cache_expirations,
+        "cache_ttl_hours": _CACHE_TTL_SECONDS / 3600,
         # Backward compatibility aliases (deprecated)
         "total_entries": total,
         "valid_entries": valid_count,
@@ -411,7 +626,7 @@ def _extract_from_filing_instance_sync(
                 ]
                 _record_currency(div_currency, len(div_series))
         except Exception as exc:  # noqa: BLE001
-            logger.debug(f"Dividend component fallback failed: {exc}")
+            logger.debug("Dividend component fallback failed: %s", exc)
 
     # Emit the statement-derived financial metrics (revenue and/or bank components), each carrying
     # its raw_tag. Values are in the filer's own reporting currency (domestic financials = USD).
@@ -431,7 +646,7 @@ def _extract_from_filing_instance_sync(
 
     # Filing-level reporting currency = the currency carried by the most monetary facts.
     if currency_votes:
-        result["reporting_currency"] = max(currency_votes.items(), key=lambda kv: kv[1])[0]
+        result["reporting_currency"] = max(currency_votes.items(), key=itemgetter(1))[0]
 
     # Item A: attach the issuer's locked ADS ratio (ratio != 1 ADRs only) so the standardized
     # metrics can surface a per-ADS EPS alongside the as-filed per-ordinary-share figure. Absent
@@ -597,34 +812,63 @@ class EdgarXBRLService:
 
         # Build cache keys (versioned — see _XBRL_CACHE_VERSION)
         memory_key = f"{_XBRL_CACHE_VERSION}:{cik}:{accession_number}"
-        redis_key = f"xbrl:{_XBRL_CACHE_VERSION}:{cik}:{accession_number}"
 
-        # L1: Check in-memory cache first (fastest) - protected by async lock
-        async with _get_cache_lock():
-            if memory_key in _xbrl_cache:
-                cached_time, cached_data = _xbrl_cache[memory_key]
-                if datetime.now() - cached_time < _cache_ttl:
-                    # Move to end for LRU ordering (most recently used)
-                    _xbrl_cache.move_to_end(memory_key)
-                    _cache_hits += 1
-                    logger.debug(f"XBRL L1 cache hit for {memory_key}")
-                    return cached_data
-                else:
-                    logger.debug(f"XBRL L1 cache expired for {memory_key}")
+        # L1: Check in-memory cache first (fastest). The hit path is lock-free: the peek and
+        # counter bumps contain no await, so no other coroutine can interleave with them on the
+        # event loop. The lock only guards mutations that span an await. Debug logging in this
+        # module uses lazy %-formatting so a disabled debug level costs no string building here.
+        entry = _xbrl_cache.get(memory_key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < _CACHE_TTL_SECONDS:
+                _record_cache_hit(entry)
+                _cache_hits += 1
+                logger.debug("XBRL L1 cache hit for %s", memory_key)
+                return entry[1]
+            logger.debug("XBRL L1 cache expired for %s", memory_key)
+            async with _get_cache_lock():
+                # Another coroutine may have refreshed the key while we waited for the lock.
+                if _xbrl_cache.get(memory_key) is entry:
                     del _xbrl_cache[memory_key]
-                    # L1 cache miss (expired) - track inside lock for thread safety
-                    _cache_misses += 1
-            else:
-                # L1 cache miss (not found) - track inside lock for thread safety
-                _cache_misses += 1
+        _cache_misses += 1
+        redis_key = f"xbrl:{_XBRL_CACHE_VERSION}:{cik}:{accession_number}"
+
+        # Single-flight (the summary_pipeline._claim_inflight pattern): concurrent misses on the
+        # same key await the first caller's L2 read + EdgarTools fetch instead of each running
+        # their own. No lock needed — there is no await between the lookup and the claim.
+        inflight = _inflight_fetches.get(memory_key)
+        if inflight is not None:
+            logger.debug("XBRL fetch already in flight for %s; awaiting it", memory_key)
+            # shield: a cancelled waiter must not cancel the shared fetch for everyone else.
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        _inflight_fetches[memory_key] = future
+        result: Optional[Dict[str, Any]] = None
+        try:
+            result = await self._load_uncached(memory_key, redis_key, cik, accession_number)
+            return result
+        finally:
+            if _inflight_fetches.get(memory_key) is future:
+                _inflight_fetches.pop(memory_key, None)
+            # On leader failure/cancellation waiters see None — get_xbrl_data's "no data" value.
+            future.set_result(result)
 
+    async def _load_uncached(
+        self,
+        memory_key: str,
+        redis_key: str,
+        cik: str,
+        accession_number: str,
+    ) -> Optional[Dict[str, Any]]:
+        """L1 miss path: L2 (Redis) read, then EdgarTools fetch; populates both tiers."""
         # L2: Check Redis cache (persistent, shared)
         redis_data = await self._get_from_redis(redis_key)
         if redis_data is not None:
-            logger.debug(f"XBRL L2 cache hit for {redis_key}")
-            # Populate L1 cache from L2 with LRU eviction
+            logger.debug("XBRL L2 cache hit for %s", redis_key)
+            _intern_series_strings(redis_data)
+            # Populate L1 cache from L2 with least-hit eviction
             async with _get_cache_lock():
-                _cache_set_sync(memory_key, (datetime.now(), redis_data))
+                _cache_set_sync(memory_key, (time.monotonic(), redis_data))
             return redis_data
 
         # Cache miss - fetch from EdgarTools
@@ -632,31 +876,34 @@ class EdgarXBRLService:
 
         # Cache successful results in both tiers
         if result is not None:
+            _intern_series_strings(result)
             async with _get_cache_lock():
-                _cache_set_sync(memory_key, (datetime.now(), result))
+                _cache_set_sync(memory_key, (time.monotonic(), result))
             await self._set_to_redis(redis_key, result)
-            logger.debug(f"XBRL cached (L1+L2) for {memory_key}")
+            logger.debug("XBRL cached (L1+L2) for %s", memory_key)
         else:
-            logger.debug(f"XBRL NOT cached for {memory_key} (no data)")
+            logger.debug("XBRL NOT cached for %s (no data)", memory_key)
 
         return result
 
     async def _get_from_redis(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get XBRL data from Redis cache (L2)."""
+        """Get XBRL data from Redis cache (L2).
+
+        One round-trip: cache_get issues a bare GET (no EXISTS probe) and maps a nil reply or
+        any Redis failure to None, which the caller treats as a miss.
+        """
         try:
-            from app.services.redis_service import cache_get
             return await cache_get(key)
         except Exception as e:
-            logger.debug(f"Redis L2 cache get failed for {key}: {e}")
+            logger.debug("Redis L2 cache get failed for %s: %s", key, e)
             return None
 
     async def _set_to_redis(self, key: str, data: Dict[str, Any]) -> bool:
         """Set XBRL data in Redis cache (L2)."""
         try:
-            from app.services.redis_service import cache_set, CacheTTL
             return await cache_set(key, data, CacheTTL.XBRL_DATA)
         except Exception as e:
-            logger.debug(f"Redis L2 cache set failed for {key}: {e}")
+            logger.debug("Redis L2 cache set failed for %s: %s", key, e)
             return False
 
     async def _fetch_xbrl_data(
@@ -679,7 +926,7 @@ class EdgarXBRLService:
 
         result = await self._fetch_from_filing_instance(cik_padded, accession_number)
         if result is not None:
-            logger.debug(f"XBRL extracted from filing instance for {accession_number}")
+            logger.debug("XBRL extracted from filing instance for %s", accession_number)
             return result
 
         result = await self._fallback_to_company_facts(cik_padded, accession_number)
@@ -747,17 +994,12 @@ class EdgarXBRLService:
         the companyfacts API both produced nothing.
         """
         try:
-            # Get company via EdgarTools
-            edgar_company = await run_in_executor_with_timeout(
-                lambda: EdgarCompany(cik_padded),
-                timeout=self.timeout,
-            )
-
-            # Get financials. EdgarTools 5.x exposes Company.get_financials()
-            # (there is no `financials` property; attribute access raises and
-            # silently forced every request onto the company-facts fallback).
+            # Build the company and its financials in one executor hop: both are blocking EdgarTools
+            # calls and nothing async happens between them. EdgarTools 5.x exposes
+            # Company.get_financials() (there is no `financials` property; attribute access raises
+            # and silently forced every request onto the company-facts fallback).
             financials = await run_in_executor_with_timeout(
-                edgar_company.get_financials,
+                lambda: EdgarCompany(cik_padded).get_financials(),
                 timeout=self.timeout,
             )
 
@@ -783,89 +1025,35 @@ class EdgarXBRLService:
                 "long_term_debt": [],
             }
 
-            # Try to get income statement
-            try:
-                df = await run_in_executor_with_timeout(lambda: statement_dataframe(financials, "income_statement"), timeout=self.timeout)
-                if df is not None and not df.empty:
-                    result["revenue"] = self._extract_from_dataframe(
-                        df,
-                        ["RevenueFromContractWithCustomerExcludingAssessedTax", "Revenues",
-                         "Revenue", "TotalRevenue", "TotalRevenues", "NetSales", "SalesRevenueNet"],
-                        accession_number
-                    )
-                    result["net_income"] = self._extract_from_dataframe(
-                        df,
-                        ["NetIncomeLoss", "ProfitLoss", "NetIncome",
-                         "NetIncomeLossAvailableToCommonStockholdersBasic"],
-                        accession_number
-                    )
-                    result["earnings_per_share"] = self._extract_from_dataframe(
-                        df,
-                        ["EarningsPerShareBasic", "EarningsPerShareDiluted",
-                         "BasicEarningsPerShare", "EarningsPerShareBasicAndDiluted"],
-                        accession_number
-                    )
-                    result["eps_diluted"] = self._extract_from_dataframe(
-                        df, ["EarningsPerShareDiluted", "EarningsPerShareBasicAndDiluted"], accession_number
-                    )
-                    result["gross_profit"] = self._extract_from_dataframe(
-                        df, ["GrossProfit"], accession_number
-                    )
-                    result["operating_income"] = self._extract_from_dataframe(
-                        df, ["OperatingIncomeLoss"], accession_number
-                    )
-            except Exception as e:
-                logger.warning(f"Error extracting income statement: {e}")
-
-            # Try to get balance sheet
-            try:
-                df = await run_in_executor_with_timeout(lambda: statement_dataframe(financials, "balance_sheet"), timeout=self.timeout)
-                if df is not None and not df.empty:
-                    result["total_assets"] = self._extract_from_dataframe(
-                        df,
-                        ["Assets", "TotalAssets"],
-                        accession_number
-                    )
-                    result["total_liabilities"] = self._extract_from_dataframe(
-                        df,
-                        ["Liabilities", "TotalLiabilities", "LiabilitiesAndStockholdersEquity"],
-                        accession_number
-                    )
-                    result["cash_and_equivalents"] = self._extract_from_dataframe(
-                        df,
-                        CASH_TAG_CANDIDATES,
-                        accession_number
-                    )
-                    result["shareholders_equity"] = self._extract_from_dataframe(
-                        df,
-                        ["StockholdersEquity",
-                         "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest"],
-                        accession_number
-                    )
-                    result["long_term_debt"] = self._extract_from_dataframe(
-                        df, ["LongTermDebtNoncurrent", "LongTermDebt"], accession_number
-                    )
-            except Exception as e:
-                logger.warning(f"Error extracting balance sheet: {e}")
-
-            # Try to get cash-flow statement (P1.1 depth: operating CF + capex -> free cash flow)
-            try:
-                df = await run_in_executor_with_timeout(lambda: statement_dataframe(financials, "cash_flow_statement"), timeout=self.timeout)
-                if df is not None and not df.empty:
-                    result["operating_cash_flow"] = self._extract_from_dataframe(
-                        df,
-                        ["NetCashProvidedByUsedInOperatingActivities",
-                         "NetCashProvidedByUsedInOperatingActivitiesContinuingOperations"],
-                        accession_number
-                    )
-                    result["capital_expenditures"] = self._extract_from_dataframe(
-                        df,
-                        ["PaymentsToAcquirePropertyPlantAndEquipment",
-                         "PaymentsToAcquireProductiveAssets"],
-                        accession_number
-                    )
-            except Exception as e:
-                logger.warning(f"Error extracting cash-flow statement: {e}")
+            # One DataFrame + one index per statement, shared by every metric read from it. All three
+            # statements are read in ONE executor hop, sequentially: they share one EdgarTools
+            # Financials/XBRL object whose lazy per-instance caches are unlocked, so reading them from
+            # parallel pool threads is not safe, and a per-statement hop would hold up to 3 of the
+            # `edgar` pool's workers for one filing (a timed-out hop keeps its thread). A failing
+            # statement is captured in place so it doesn't drop the others' metrics.
+            def read_statements() -> List[Any]:
+                statements: List[Any] = []
+                for name, _ in _LATEST_FINANCIALS_CANDIDATES:
+                    try:
+                        statements.append(index_statement(statement_dataframe(financials, name)))
+                    except Exception as exc:
+                        statements.append(exc)
+                return statements
+
+            # Same worst-case budget as the former per-statement timeouts, spent in one hop.
+            statements = await run_in_executor_with_timeout(
+                read_statements,
+                timeout=self.timeout * len(_LATEST_FINANCIALS_CANDIDATES),
+            )
+            for (statement_name, metric_candidates), stmt in zip(_LATEST_FINANCIALS_CANDIDATES, statements):
+                try:
+                    if isinstance(stmt, BaseException):
+                        raise stmt
+                    if stmt is not None:
+                        for metric, candidates in metric_candidates:
+                            result[metric] = self._extract_from_dataframe(stmt, candidates, accession_number)
+                except Exception as e:
+                    logger.warning(f"Error extracting {statement_name.replace('_', ' ')}: {e}")
 
             # If we got any data, return it (companyfacts already ran earlier
             # in the chain — see _fetch_xbrl_data — so there is nothing left
@@ -881,11 +1069,11 @@ class EdgarXBRLService:
     def _extract_from_dataframe(
         self,
         df,
-        candidates: List[str],
+        candidates: Sequence[str],
         accession_number: str,
     ) -> List[Dict[str, Any]]:
-        """Extract metric values from an EdgarTools statement DataFrame."""
-        _, values = extract_metric_values(df, candidates)
+        """Extract metric values from an EdgarTools statement DataFrame (or its ``index_statement``)."""
+        _, values = extract_metric_values(df, candidates, limit=5)
         return [
             {
                 "period": period,
@@ -893,7 +1081,7 @@ class EdgarXBRLService:
                 "form": None,
                 "accn": accession_number,
             }
-            for period, value in values[:5]
+            for period, value in values
         ]
 
     async def _fallback_to_company_facts(
@@ -907,10 +1095,25 @@ class EdgarXBRLService:
         This replicates the logic from the legacy xbrl_service.py for cases
         where EdgarTools doesn't have the data.
         """
-        import httpx
-
         logger.info(f"Falling back to SEC company facts API for CIK {cik}")
 
+        use_disk_cache = companyfacts_cache_enabled()
+        cached = None
+        cached_result = None
+        if use_disk_cache:
+            try:
+                cached = await run_in_executor_with_timeout(lambda: read_companyfacts(cik), timeout=self.timeout)
+                if cached is not None and cached.fresh:
+                    cached_result = await self._decode_company_facts(cached.raw, accession_number)
+                    # A payload cached before the target filing was published lacks its facts:
+                    # treat that as a miss rather than serve the prior filing's figures.
+                    if not accession_number or self._has_target_facts(cached_result, accession_number):
+                        logger.debug("Companyfacts disk cache hit for CIK %s", cik)
+                        return cached_result
+            except Exception as e:
+                logger.warning(f"Companyfacts disk cache unusable for CIK {cik}: {e}")
+                cached = None
+
         try:
             facts_url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
 
@@ -919,24 +1122,67 @@ class EdgarXBRLService:
             # fail-fasts rather than sleeping through the full backoff ladder (S4 review #3).
             # raise_for_status turns a non-200 into an exception, preserving "non-200 -> None" via the
             # outer except.
-            async with httpx.AsyncClient() as client:
-                async def _do_request() -> httpx.Response:
-                    resp = await client.get(
-                        facts_url,
-                        headers={"User-Agent": EDGAR_IDENTITY},
-                        timeout=30.0,
-                    )
+            client = get_sec_client()
+            # Anything still on disk (stale, or fresh but missing the target) is revalidated: an
+            # unchanged payload comes back as an empty 304 instead of several MB.
+            conditional_headers = cached.validators if cached is not None else None
+
+            async def _do_request() -> httpx.Response:
+                resp = await client.get(facts_url, headers=conditional_headers)
+                if resp.status_code != 304:
                     resp.raise_for_status()
-                    return resp
-
-                response = await sec_rate_limiter.execute(_do_request)
-                data = response.json()
-                return self._parse_company_facts(data, accession_number)
+                return resp
+
+            response = await sec_rate_limiter.execute(_do_request)
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Companyfacts for CIK %s not modified; reusing disk cache", cik)
+                try:
+                    await run_in_executor_with_timeout(lambda: mark_companyfacts_revalidated(cik), timeout=self.timeout)
+                except Exception as e:
+                    logger.warning(f"Companyfacts disk cache touch skipped for CIK {cik}: {e}")
+                if cached_result is None:
+                    cached_result = await self._decode_company_facts(cached.raw, accession_number)
+                return cached_result
+
+            raw = response.content
+            result = await self._decode_company_facts(raw, accession_number)
+            if use_disk_cache:
+                validators = validators_from_headers(response.headers)
+                try:
+                    await run_in_executor_with_timeout(
+                        lambda: write_companyfacts(cik, raw, validators), timeout=self.timeout
+                    )
+                except Exception as e:
+                    logger.warning(f"Companyfacts disk cache write skipped for CIK {cik}: {e}")
+            return result
 
         except Exception as e:
             logger.error(f"Error in company facts fallback: {e}")
             return None
 
+    async def _decode_company_facts(self, raw: bytes, accession_number: str) -> Dict[str, List[Dict]]:
+        """Decode + parse a raw companyfacts payload, off the event loop when it is large.
+
+        orjson over httpx's stdlib-json ``.json()``: companyfacts for a large filer is several MB.
+        Payloads past ``_COMPANY_FACTS_OFFLOAD_BYTES`` are decoded and walked in the executor so the
+        Python-level parse doesn't stall other requests; small ones stay inline (no thread hop).
+        """
+        if len(raw) < _COMPANY_FACTS_OFFLOAD_BYTES:
+            return self._parse_company_facts(orjson.loads(raw), accession_number)
+        return await run_in_executor_with_timeout(
+            lambda: self._parse_company_facts(orjson.loads(raw), accession_number), timeout=self.timeout
+        )
+
+    @staticmethod
+    def _has_target_facts(result: Dict[str, List[Dict]], target_accession: str) -> bool:
+        """Whether any parsed companyfacts entry came from the target filing."""
+        normalized = target_accession.replace("-", "")
+        return any(
+            (item.get("accn") or "").replace("-", "") == normalized
+            for items in result.values()
+            for item in items
+        )
+
     def _parse_company_facts(
         self,
         facts_data: Dict,
@@ -953,12 +1199,18 @@ class EdgarXBRLService:
         }
 
         normalized_accession = target_accession.replace("-", "") if target_accession else None
+        # Hundreds of facts share a handful of accession numbers, so normalize each distinct
+        # accn once instead of re-running str.replace for every fact on every pass.
+        target_by_accn: Dict[str, bool] = {}
 
         def _is_target(item: Dict) -> bool:
-            return bool(
-                normalized_accession
-                and item.get("accn", "").replace("-", "") == normalized_accession
-            )
+            accn = item.get("accn", "")
+            hit = target_by_accn.get(accn)
+            if hit is None:
+                hit = target_by_accn[accn] = bool(
+                    normalized_accession and accn.replace("-", "") == normalized_accession
+                )
+            return hit
 
         def _duration_penalty(item: Dict) -> int:
             """Distance from the standard duration for the item's form.
@@ -979,21 +1231,7 @@ class EdgarXBRLService:
             target_days = 365 if (item.get("form") or "").startswith("10-K") else 91
             return abs(days - target_days)
 
-        def filter_and_sort(data_list: list, max_items: int = 5) -> list:
-            if not isinstance(data_list, list):
-                return []
-
-            valid_items = [
-                item for item in data_list
-                if isinstance(item, dict) and item.get("end")
-            ]
-
-            # When the target filing reported this concept, use its facts only
-            # (current value + the comparatives restated in that same filing).
-            matching = [item for item in valid_items if _is_target(item)]
-            if matching:
-                valid_items = matching
-
+        def filter_and_sort(valid_items: list, max_items: int = 5) -> list:
             # Dedupe by period end: prefer the standard duration for the form,
             # then the most recently filed restatement.
             best_by_end: Dict[str, Dict] = {}
@@ -1008,14 +1246,10 @@ class EdgarXBRLService:
                 if key[0] < incumbent_key[0] or (key[0] == incumbent_key[0] and key[1] > incumbent_key[1]):
                     best_by_end[item["end"]] = item
 
-            sorted_items = sorted(
-                best_by_end.values(),
-                key=lambda x: x.get("end", ""),
-                reverse=True
-            )
-            return sorted_items[:max_items]
+            # Only the most recent max_items survive: partial top-N instead of a full sort.
+            return heapq.nlargest(max_items, best_by_end.values(), key=itemgetter("end"))
 
-        def select_fact_data(fields: List[str], unit_keys: Tuple[str, ...] = ("USD",)) -> list:
+        def select_fact_data(fields: Sequence[str], unit_keys: Sequence[str]) -> list:
             """Pick the candidate concept actually used by recent filings.
 
             Taking the first concept present is wrong: issuers retire tags over
@@ -1024,6 +1258,10 @@ class EdgarXBRLService:
             stale concept would shadow the live one and surface years-old
             values as "current". Prefer a concept with facts from the target
             filing; otherwise the one with the most recent period end.
+
+            When the target filing reported the chosen concept, only its facts
+            are returned (current value + the comparatives restated in that
+            same filing); otherwise all of the concept's dated facts.
             """
             best_key: Optional[Tuple[int, str]] = None
             best_data: list = []
@@ -1033,18 +1271,31 @@ class EdgarXBRLService:
                     continue
                 for unit_key in unit_keys:
                     data = fact["units"].get(unit_key) or []
-                    valid = [i for i in data if isinstance(i, dict) and i.get("end")]
+                    # One pass splits out the target filing's facts and tracks the latest end,
+                    # so the winner needs no second filtering pass.
+                    valid: list = []
+                    targets: list = []
+                    latest_end = ""
+                    for item in data:
+                        if not isinstance(item, dict):
+                            continue
+                        end = item.get("end")
+                        if not end:
+                            continue
+                        valid.append(item)
+                        if _is_target(item):
+                            targets.append(item)
+                        if end > latest_end:
+                            latest_end = end
                     if not valid:
                         continue
-                    has_target = any(_is_target(i) for i in valid)
-                    latest_end = max(i["end"] for i in valid)
-                    key = (0 if has_target else 1, latest_end)
+                    key = (0 if targets else 1, latest_end)
                     if (
                         best_key is None
                         or key[0] < best_key[0]
                         or (key[0] == best_key[0] and key[1] > best_key[1])
                     ):
-                        best_key, best_data = key, valid
+                        best_key, best_data = key, targets or valid
                     break  # first unit key with data for this concept
             return best_data
 
@@ -1064,15 +1315,8 @@ class EdgarXBRLService:
             if not isinstance(us_gaap, dict):
                 return result
 
-            append_items("revenue", select_fact_data(
-                ["Revenues", "Revenue", "RevenueFromContractWithCustomerExcludingAssessedTax",
-                 "SalesRevenueNet", "NetSales", "TotalRevenue"]))
-            append_items("net_income", select_fact_data(
-                ["NetIncomeLoss", "ProfitLoss", "NetIncomeLossAvailableToCommonStockholdersBasic"]))
-            append_items("total_assets", select_fact_data(["Assets"]))
-            append_items("earnings_per_share", select_fact_data(
-                ["EarningsPerShareBasic", "EarningsPerShareDiluted", "EarningsPerShareBasicAndDiluted"],
-                unit_keys=("USD/shares", "USD", "pure")))
+            for metric, fields, unit_keys in _COMPANY_FACTS_CANDIDATES:
+                append_items(metric, select_fact_data(fields, unit_keys))
 
         except Exception as e:
             logger.warning(f"Error parsing company facts: {e}")
@@ -1091,26 +1335,46 @@ class EdgarXBRLService:
         Returns:
             Dictionary with standardized metrics including current, prior,
             change calculations, and series data. Returns empty dict if
-            xbrl_data is None or empty.
+            xbrl_data is None or empty. Each call returns a fresh dict the
+            caller may mutate; results are memoized per input dict and
+            rebuilt when its values change.
         """
         # Handle None or empty input
         if not xbrl_data:
             return {}
 
-        def normalise_series(entries: List[Dict]) -> List[Dict]:
-            cleaned = []
-            seen_periods = set()
-            sorted_entries = sorted(
-                (e for e in entries if e.get("period") and e.get("value") is not None),
-                key=lambda x: x.get("period"),
-                reverse=True,
-            )
-            for entry in sorted_entries:
+        memo_key = id(xbrl_data)
+        fingerprint = _standardized_fingerprint(xbrl_data)
+        with _standardized_memo_lock:
+            cached = _standardized_memo.get(memo_key)
+            if cached is not None and cached[0] is xbrl_data and cached[1] == fingerprint:
+                _standardized_memo.move_to_end(memo_key)
+                return _copy_standardized(cached[2])
+
+        metrics = self._build_standardized_metrics(xbrl_data)
+
+        with _standardized_memo_lock:
+            _standardized_memo[memo_key] = (xbrl_data, fingerprint, metrics)
+            _standardized_memo.move_to_end(memo_key)
+            while len(_standardized_memo) > _STANDARDIZED_MEMO_SIZE:
+                _standardized_memo.popitem(last=False)
+        return _copy_standardized(metrics)
+
+    def _build_standardized_metrics(self, xbrl_data: Dict) -> Dict[str, Any]:
+        """Standardize a non-empty xbrl_data dict (uncached; see extract_standardized_metrics)."""
+
+        def normalise_series(entries: Sequence[Dict]) -> List[Dict]:
+            if not entries:
+                return []
+            # One pass keeps the first usable entry per period (what the stable descending sort
+            # used to surface first), so only the distinct periods are sorted.
+            first_by_period: Dict[str, Dict] = {}
+            for entry in entries:
                 period = entry.get("period")
-                if period in seen_periods:
-                    continue
-                seen_periods.add(period)
-                cleaned.append({
+                if period and period not in first_by_period and entry.get("value") is not None:
+                    first_by_period[period] = entry
+            return [
+                {
                     "period": period,
                     "value": entry.get("value"),
                     "form": entry.get("form"),
@@ -1119,27 +1383,28 @@ class EdgarXBRLService:
                     # from (audit trail) and the change report can detect a concept that flips
                     # between filings. None for legacy/pre-fix series.
                     "raw_tag": entry.get("raw_tag"),
-                })
-            return cleaned
+                }
+                for period, entry in sorted(first_by_period.items(), key=itemgetter(0), reverse=True)
+            ]
 
         def build_metric_entry(series: List[Dict]) -> Dict:
-            entry = {}
-            if series:
-                entry["current"] = series[0]
+            if not series:
+                return {}
+            current = series[0]
+            entry = {"current": current}
             if len(series) > 1:
-                entry["prior"] = series[1]
-                current_val = series[0].get("value")
-                prior_val = series[1].get("value")
-                entry["change"] = MetricChange.compute(current_val, prior_val).to_dict()
-            if series:
-                entry["series"] = series
+                prior = series[1]
+                entry["prior"] = prior
+                entry["change"] = MetricChange.compute_dict(current.get("value"), prior.get("value"))
+            entry["series"] = series
             return entry
 
         metrics = {}
 
-        revenue_series = normalise_series(xbrl_data.get("revenue", []))
-        net_income_series = normalise_series(xbrl_data.get("net_income", []))
-        eps_series = normalise_series(xbrl_data.get("earnings_per_share", []))
+        # `or ()` instead of a `[]` default: most filings lack most keys, so skip the allocation.
+        revenue_series = normalise_series(xbrl_data.get("revenue") or ())
+        net_income_series = normalise_series(xbrl_data.get("net_income") or ())
+        eps_series = normalise_series(xbrl_data.get("earnings_per_share") or ())
 
         if revenue_series:
             metrics["revenue"] = build_metric_entry(revenue_series)
@@ -1152,22 +1417,24 @@ class EdgarXBRLService:
 
         # Calculate net margin
         if revenue_series and net_income_series:
-            income_by_period = {e["period"]: e for e in net_income_series}
-            margin_series = []
-            for rev_entry in revenue_series:
-                period = rev_entry["period"]
-                inc_entry = income_by_period.get(period)
-                rev_value = rev_entry.get("value")
-                inc_value = inc_entry.get("value") if inc_entry else None
-                if rev_value and inc_value and rev_value != 0:
-                    margin_series.append({
-                        "period": period,
-                        "value": (inc_value / rev_value) * 100,
-                        "form": rev_entry.get("form"),
-                    })
+            # Hash join on period; normalise_series guarantees non-None values and unique periods,
+            # so a zero (falsy) revenue or income is the only case left to skip.
+            income_by_period = {e["period"]: e["value"] for e in net_income_series}
+            margin_series = [
+                {
+                    "period": rev_entry["period"],
+                    "value": (inc_value / rev_entry["value"]) * 100,
+                    "form": rev_entry["form"],
+                }
+                for rev_entry in revenue_series
+                if rev_entry["value"] and (inc_value := income_by_period.get(rev_entry["period"]))
+            ]
             if margin_series:
                 metrics["net_margin"] = build_metric_entry(margin_series)
 
+        # Kept by key so the derived metrics below (liquidity, FCF, margins, returns) reuse these
+        # series instead of normalising the same inputs a second time.
+        normalised: Dict[str, List[Dict]] = {}
         # P1.1 depth + roadmap 2.6: surface cash-flow + balance-sheet metrics the pipeline collects.
         # The 2.6 keys (investing/financing CF, current assets/liabilities) only carry a series when
         # RICHER_FINANCIALS_ENABLED was on at extraction, so listing them here is inert until then.
@@ -1182,15 +1449,15 @@ class EdgarXBRLService:
                     "premiums_earned", "net_investment_income",
                     # T5.3 shareholder returns (cash paid, as-tagged positive magnitudes).
                     "dividends_paid", "share_repurchases"):
-            series = normalise_series(xbrl_data.get(key, []))
+            series = normalised[key] = normalise_series(xbrl_data.get(key) or ())
             if series:
                 metrics[key] = build_metric_entry(series)
 
         # Roadmap 2.6 derived liquidity (per period): working capital = current assets − current
         # liabilities; current ratio = current assets ÷ current liabilities. Self-gating — both
         # require the 2.6 balance-sheet lines, which only exist when the flag is on.
-        ca_series = normalise_series(xbrl_data.get("current_assets", []))
-        cl_series = normalise_series(xbrl_data.get("current_liabilities", []))
+        ca_series = normalised["current_assets"]
+        cl_series = normalised["current_liabilities"]
         if ca_series and cl_series:
             cl_by_period = {e["period"]: e for e in cl_series}
             wc_series, cr_series = [], []
@@ -1214,8 +1481,8 @@ class EdgarXBRLService:
 
         # Derived: free cash flow = operating cash flow - capital expenditures (per period).
         # abs(capex) handles filers that tag the outflow as negative.
-        ocf_series = normalise_series(xbrl_data.get("operating_cash_flow", []))
-        capex_series = normalise_series(xbrl_data.get("capital_expenditures", []))
+        ocf_series = normalised["operating_cash_flow"]
+        capex_series = normalised["capital_expenditures"]
         if ocf_series and capex_series:
             capex_by_period = {e["period"]: e for e in capex_series}
             fcf_series = []
@@ -1232,7 +1499,7 @@ class EdgarXBRLService:
         # Derived margins (gross/operating). Same issuer-type caveat as net_margin (hardened in P1.3).
         for margin_key, numerator_key in (("gross_margin", "gross_profit"),
                                           ("operating_margin", "operating_income")):
-            num_series = normalise_series(xbrl_data.get(numerator_key, []))
+            num_series = normalised[numerator_key]
             if revenue_series and num_series:
                 num_by_period = {e["period"]: e for e in num_series}
                 m_series = []
@@ -1254,8 +1521,8 @@ class EdgarXBRLService:
         # loss-maker confidently positive — a machine-authored wrong statement on both the grounding
         # and the T5.3 §4 surface. Skip those periods; ROA is unaffected in practice (total_assets
         # is hard-rejected when negative).
-        equity_series = normalise_series(xbrl_data.get("shareholders_equity", []))
-        assets_series = normalise_series(xbrl_data.get("total_assets", []))
+        equity_series = normalised["shareholders_equity"]
+        assets_series = normalised["total_assets"]
         for ratio_key, denom_series in (("return_on_equity", equity_series),
                                         ("return_on_assets", assets_series)):
             if net_income_series and denom_series:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import html
+import string
 
 from app.config import settings
 from app.services.resend_service import send_email
@@ -14,8 +15,9 @@ _ALERT_FOOTER = (
 )
 
 
-def _wrap_html(body: str, footer: str = _DEFAULT_FOOTER) -> str:
-    return f"""
+# The shell is split once at import around the two slots so each send is a single join
+# instead of re-building the whole wrapper.
+_HTML_PREFIX = """
     <html>
       <body style="margin:0;padding:0;background:#F4F3EE;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Arial,sans-serif;">
         <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background:#F4F3EE;padding:32px 12px;">
@@ -27,12 +29,14 @@ def _wrap_html(body: str, footer: str = _DEFAULT_FOOTER) -> str:
                 </tr>
                 <tr>
                   <td style="padding-top:16px;font-size:16px;line-height:1.6;color:#1A1A17;">
-                    {body}
+                    """
+_HTML_MIDDLE = """
                   </td>
                 </tr>
                 <tr>
                   <td style="padding-top:32px;font-size:12px;color:#6B7280;">
-                    {footer}
+                    """
+_HTML_SUFFIX = """
                   </td>
                 </tr>
               </table>
@@ -44,40 +48,78 @@ def _wrap_html(body: str, footer: str = _DEFAULT_FOOTER) -> str:
     """
 
 
-def render_welcome_email(
-    *,
-    name: str | None,
-    position: int,
-    referral_link: str,
-    verification_link: str,
-) -> tuple[str, str]:
-    greeting = f"Hi {name}," if name else "Hi there,"
-    html_body = f"""
-    <p style="margin:0 0 16px;">{greeting}</p>
+def _wrap_html(body: str, footer: str = _DEFAULT_FOOTER) -> str:
+    return f"{_HTML_PREFIX}{body}{_HTML_MIDDLE}{footer}{_HTML_SUFFIX}"
+
+
+# Waitlist templates are parsed once at import; render only fills the slots. HTML slots are
+# escaped (name and links are user-influenced), the plain-text twin takes the raw values.
+_WELCOME_HTML_TMPL = string.Template("""
+    <p style="margin:0 0 16px;">$greeting</p>
     <p style="margin:0 0 16px;">You're officially on the EarningsNerd waitlist! 🎉</p>
-    <p style="margin:0 0 16px;">Your current position: <strong>#{position}</strong></p>
+    <p style="margin:0 0 16px;">Your current position: <strong>#$position</strong></p>
     <p style="margin:0 0 20px;">
       Share your referral link to move up the list. Each successful referral bumps you up <strong>5 spots</strong>.
     </p>
     <p style="margin:0 0 20px;">
-      <a href="{referral_link}" style="color:#3C6650;">{referral_link}</a>
+      <a href="$referral_link" style="color:#3C6650;">$referral_link</a>
     </p>
     <p style="margin:0 0 24px;">
       Please verify your email to secure your place:
-      <a href="{verification_link}" style="color:#3C6650;font-weight:600;">Verify email</a>
+      <a href="$verification_link" style="color:#3C6650;font-weight:600;">Verify email</a>
     </p>
     <p style="margin:0;">We'll keep you posted as we open up access.</p>
-    """
-    text_body = (
-        f"{greeting}\n\n"
-        "You're officially on the EarningsNerd waitlist!\n"
-        f"Your current position: #{position}\n\n"
-        "Share your referral link to move up the list. Each successful referral bumps you up 5 spots.\n"
-        f"{referral_link}\n\n"
-        f"Verify your email to secure your place: {verification_link}\n\n"
-        "We'll keep you posted as we open up access."
-    )
-    return _wrap_html(html_body), text_body
+    """)
+_WELCOME_TEXT_TMPL = string.Template(
+    "$greeting\n\n"
+    "You're officially on the EarningsNerd waitlist!\n"
+    "Your current position: #$position\n\n"
+    "Share your referral link to move up the list. Each successful referral bumps you up 5 spots.\n"
+    "$referral_link\n\n"
+    "Verify your email to secure your place: $verification_link\n\n"
+    "We'll keep you posted as we open up access."
+)
+_REFERRAL_HTML_TMPL = string.Template("""
+    <p style="margin:0 0 16px;">$greeting</p>
+    <p style="margin:0 0 16px;">You just moved up the EarningsNerd waitlist!</p>
+    <p style="margin:0 0 16px;">Your new position: <strong>#$position</strong></p>
+    <p style="margin:0 0 20px;">
+      Keep sharing your referral link to climb even faster:
+      <a href="$referral_link" style="color:#3C6650;">$referral_link</a>
+    </p>
+    <p style="margin:0;">Thanks for spreading the word.</p>
+    """)
+_REFERRAL_TEXT_TMPL = string.Template(
+    "$greeting\n\n"
+    "You just moved up the EarningsNerd waitlist!\n"
+    "Your new position: #$position\n\n"
+    "Keep sharing your referral link to climb even faster:\n"
+    "$referral_link\n\n"
+    "Thanks for spreading the word."
+)
+
+
+def _render_pair(
+    html_tmpl: string.Template, text_tmpl: string.Template, mapping: dict[str, object]
+) -> tuple[str, str]:
+    escaped = {key: html.escape(str(value)) for key, value in mapping.items()}
+    return _wrap_html(html_tmpl.substitute(escaped)), text_tmpl.substitute(mapping)
+
+
+def render_welcome_email(
+    *,
+    name: str | None,
+    position: int,
+    referral_link: str,
+    verification_link: str,
+) -> tuple[str, str]:
+    mapping = {
+        "greeting": f"Hi {name}," if name else "Hi there,",
+        "position": position,
+        "referral_link": referral_link,
+        "verification_link": verification_link,
+    }
+    return _render_pair(_WELCOME_HTML_TMPL, _WELCOME_TEXT_TMPL, mapping)
 
 
 def render_referral_success_email(
@@ -86,26 +128,12 @@ def render_referral_success_email(
     new_position: int,
     referral_link: str,
 ) -> tuple[str, str]:
-    greeting = f"Hi {name}," if name else "Hi there,"
-    html_body = f"""
-    <p style="margin:0 0 16px;">{greeting}</p>
-    <p style="margin:0 0 16px;">You just moved up the EarningsNerd waitlist!</p>
-    <p style="margin:0 0 16px;">Your new position: <strong>#{new_position}</strong></p>
-    <p style="margin:0 0 20px;">
-      Keep sharing your referral link to climb even faster:
-      <a href="{referral_link}" style="color:#3C6650;">{referral_link}</a>
-    </p>
-    <p style="margin:0;">Thanks for spreading the word.</p>
-    """
-    text_body = (
-        f"{greeting}\n\n"
-        "You just moved up the EarningsNerd waitlist!\n"
-        f"Your new position: #{new_position}\n\n"
-        "Keep sharing your referral link to climb even faster:\n"
-        f"{referral_link}\n\n"
-        "Thanks for spreading the word."
-    )
-    return _wrap_html(html_body), text_body
+    mapping = {
+        "greeting": f"Hi {name}," if name else "Hi there,",
+        "position": new_position,
+        "referral_link": referral_link,
+    }
+    return _render_pair(_REFERRAL_HTML_TMPL, _REFERRAL_TEXT_TMPL, mapping)
 
 
 async def send_waitlist_welcome_email(
@@ -125,7 +153,8 @@ async def send_waitlist_welcome_email(
     await send_email(
         to=[to_email],
         subject="You're on the EarningsNerd waitlist! 🎉",
-        html=f"{html}<pre style=\"display:none\">{text}</pre>",
+        html=html,
+        text=text,
     )
 
 
@@ -144,7 +173,8 @@ async def send_referral_success_email(
     await send_email(
         to=[to_email],
         subject="You just moved up the EarningsNerd waitlist!",
-        html=f"{html}<pre style=\"display:none\">{text}</pre>",
+        html=html,
+        text=text,
     )
 
 
@@ -171,7 +201,8 @@ async def send_verification_email(
     await send_email(
         to=[to_email],
         subject="Verify your EarningsNerd email",
-        html=f"{_wrap_html(html_body)}<pre style=\"display:none\">{text_body}</pre>",
+        html=_wrap_html(html_body),
+        text=text_body,
     )
 
 
@@ -200,7 +231,8 @@ async def send_invite_email(
     await send_email(
         to=[to_email],
         subject="Your EarningsNerd beta invite",
-        html=f"{_wrap_html(html_body, invite_footer)}<pre style=\"display:none\">{text_body}</pre>",
+        html=_wrap_html(html_body, invite_footer),
+        text=text_body,
     )
 
 
@@ -227,7 +259,8 @@ async def send_password_reset_email(
     await send_email(
         to=[to_email],
         subject="Reset your EarningsNerd password",
-        html=f"{_wrap_html(html_body)}<pre style=\"display:none\">{text_body}</pre>",
+        html=_wrap_html(html_body),
+        text=text_body,
     )
 
 
@@ -256,7 +289,8 @@ async def send_oauth_linked_email(
     await send_email(
         to=[to_email],
         subject=f"A {provider} sign-in was linked to your EarningsNerd account",
-        html=f"{_wrap_html(html_body)}<pre style=\"display:none\">{text_body}</pre>",
+        html=_wrap_html(html_body),
+        text=text_body,
     )
 
 
@@ -286,7 +320,8 @@ async def send_account_exists_email(
     await send_email(
         to=[to_email],
         subject="Someone tried to sign up with your EarningsNerd email",
-        html=f"{_wrap_html(html_body)}<pre style=\"display:none\">{text_body}</pre>",
+        html=_wrap_html(html_body),
+        text=text_body,
     )
 
 
@@ -491,7 +526,8 @@ async def send_earnings_day_alert(
     await send_email(
         to=[to_email],
         subject=subject,
-        html=f"{html_body}<pre style=\"display:none\">{text}</pre>",
+        html=html_body,
+        text=text,
     )
 
 
@@ -518,7 +554,8 @@ async def send_new_filing_alert(
     await send_email(
         to=[to_email],
         subject=f"{ticker} filed a {filing_type}",
-        html=f"{html}<pre style=\"display:none\">{text}</pre>",
+        html=html,
+        text=text,
     )
 
 
@@ -534,5 +571,6 @@ async def send_daily_digest(
     await send_email(
         to=[to_email],
         subject=subject,
-        html=f"{html}<pre style=\"display:none\">{text}</pre>",
+        html=html,
+        text=text,
     )
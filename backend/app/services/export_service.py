@@ -1,7 +1,9 @@
 import asyncio
 import csv
+import functools
 import io
 import re
+from collections import OrderedDict
 from html import escape
 
 from app.models import Summary, Filing
@@ -9,14 +11,74 @@ from app.services.pdf_branding import PALETTE, render_branded_pdf
 from app.services.summary_sections import Block, Section, render_sections
 from app.utils.datetimes import utcnow
 
+# Inline GFM forms the analysis narrative emits, compiled once (applied to every narrative line).
+_BOLD_RE = re.compile(r"\*\*([^*\n]+)\*\*")
+# Italic needs tight asterisks (no space inside) so a lone "*" or "5*3" stays literal.
+_ITALIC_RE = re.compile(r"(?<!\*)\*(?!\s)([^*\n]+)(?<!\s)\*(?!\*)")
+
+# Static tail + layout CSS of the filing-summary PDF: built once, not per export.
+_SUMMARY_CLOSING_NOTE_HTML = """
+            <div class="closing-note footnote">
+                <p>Generated by EarningsNerd — AI-Powered SEC Filing Analysis</p>
+                <p>This AI-generated summary is derived from publicly available SEC filings and is
+                provided for informational purposes only. It is not investment advice or a
+                recommendation to buy, sell, or hold any security, and it may be incomplete or
+                contain errors — the authoritative source is always the original SEC filing.
+                Use is subject to the EarningsNerd Terms of Service (earningsnerd.io/terms).</p>
+            </div>
+        """
+_SUMMARY_EXTRA_CSS = (
+    ".closing-note { margin-top: 28px; padding-top: 12px; "
+    f"border-top: 1px solid {PALETTE['border']}; }}"
+)
+
+
+# weasyprint.HTML, resolved on first PDF export. The import is heavy (cairo/pango via cffi) and
+# optional, so it stays out of module load, and later exports skip the import machinery entirely.
+_weasyprint_html = None
+
+
+def _get_weasyprint_html():
+    global _weasyprint_html
+    if _weasyprint_html is None:
+        from weasyprint import HTML
+
+        _weasyprint_html = HTML
+    return _weasyprint_html
+
+
+# Rendered sections kept per summary row so a PDF and a CSV download of the same summary share one
+# render_sections pass. Small: it only has to span one user's back-to-back exports.
+_SECTIONS_MEMO_SIZE = 32
+
+
 class ExportService:
     def __init__(self):
-        pass
+        self._sections_memo: "OrderedDict[tuple, list[Section]]" = OrderedDict()
+
+    def _summary_sections(self, summary: Summary) -> list[Section]:
+        """render_sections for a summary, memoized on the persisted row's identity + timestamps.
+
+        Any ORM write to the row bumps ``updated_at``, so a regenerated summary misses. Objects
+        without an id (unsaved rows, test doubles) always render fresh. Treat the result as
+        read-only: it is shared between exports.
+        """
+        summary_id = getattr(summary, "id", None)
+        if summary_id is None:
+            return render_sections(summary.raw_summary or {})
+        key = (summary_id, getattr(summary, "created_at", None), getattr(summary, "updated_at", None))
+        sections = self._sections_memo.get(key)
+        if sections is None:
+            sections = render_sections(summary.raw_summary or {})
+            self._sections_memo[key] = sections
+            while len(self._sections_memo) > _SECTIONS_MEMO_SIZE:
+                self._sections_memo.popitem(last=False)
+        else:
+            self._sections_memo.move_to_end(key)
+        return sections
 
     def generate_pdf_html(self, summary: Summary, filing: Filing) -> str:
         """HTML for the filing-summary PDF — body sections inside the shared branded shell."""
-        raw_summary = summary.raw_summary or {}
-
         meta_html = (
             f"Filing Date: {filing.filing_date.strftime('%B %d, %Y') if filing.filing_date else 'N/A'} · "
             f"Period End: {filing.period_end_date.strftime('%B %d, %Y') if filing.period_end_date else 'N/A'} · "
@@ -28,36 +90,25 @@ class ExportService:
         # lock-step with the CSV export and the on-page UI. This also fixes the crash: section
         # values are structured dicts/lists, never markdown strings, so they must not be passed
         # to a string formatter (the old code called .strip() on a dict -> AttributeError -> 500).
-        body_html = "".join(
-            self._render_section_html(section) for section in render_sections(raw_summary)
-        )
-        body_html += """
-            <div class="closing-note footnote">
-                <p>Generated by EarningsNerd — AI-Powered SEC Filing Analysis</p>
-                <p>This AI-generated summary is derived from publicly available SEC filings and is
-                provided for informational purposes only. It is not investment advice or a
-                recommendation to buy, sell, or hold any security, and it may be incomplete or
-                contain errors — the authoritative source is always the original SEC filing.
-                Use is subject to the EarningsNerd Terms of Service (earningsnerd.io/terms).</p>
-            </div>
-        """
+        # Every fragment goes into one list and is joined once (no per-section joins or trailing
+        # concatenation copying the growing body).
+        parts: list[str] = []
+        for section in self._summary_sections(summary):
+            self._write_section_html(parts, section)
+        parts.append(_SUMMARY_CLOSING_NOTE_HTML)
+        body_html = "".join(parts)
 
         return render_branded_pdf(
             title=f"{escape(filing.company.name or '')} — {escape(filing.filing_type or '')} Summary",
             doc_kind="Filing<br>Summary",
             meta_html=meta_html,
             body_html=body_html,
-            extra_css=(
-                ".closing-note { margin-top: 28px; padding-top: 12px; "
-                f"border-top: 1px solid {PALETTE['border']}; }}"
-            ),
+            extra_css=_SUMMARY_EXTRA_CSS,
         )
 
-    def _render_section_html(self, section: Section) -> str:
-        parts = [f"<h2>{escape(section.title)}</h2>"]
-        for block in section.blocks:
-            parts.append(self._render_block_html(block))
-        return "".join(parts)
+    def _write_section_html(self, parts: list[str], section: Section) -> None:
+        parts.append(f"<h2>{escape(section.title)}</h2>")
+        parts.extend(self._render_block_html(block) for block in section.blocks)
 
     @staticmethod
     def _render_block_html(block: Block) -> str:
@@ -79,7 +130,7 @@ class ExportService:
             if not block.items:
                 return ""
             lead = f"<p><strong>{escape(block.text)}</strong></p>" if block.text else ""
-            items = "".join(f"<li>{escape(item)}</li>" for item in block.items)
+            items = "".join([f"<li>{escape(item)}</li>" for item in block.items])
             return f"{lead}<ul>{items}</ul>"
         if block.kind in ("table", "metrics"):
             # "metrics" carries typed metric_rows for the web; exports render its string projection
@@ -88,12 +139,14 @@ class ExportService:
                 return ""
             thead = ""
             if block.headers:
-                head_cells = "".join(f"<th>{escape(h)}</th>" for h in block.headers)
+                head_cells = "".join([f"<th>{escape(h)}</th>" for h in block.headers])
                 thead = f"<thead><tr>{head_cells}</tr></thead>"
-            body = "".join(
-                "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+            # List comprehensions, not generators: str.join materializes a generator into a
+            # sequence first, so a list skips that copy (this runs once per table cell).
+            body = "".join([
+                "<tr>" + "".join([f"<td>{escape(cell)}</td>" for cell in row]) + "</tr>"
                 for row in block.rows
-            )
+            ])
             return f"<table>{thead}<tbody>{body}</tbody></table>"
         if block.kind == "callout":
             if not block.text:
@@ -106,69 +159,69 @@ class ExportService:
     def generate_csv(self, summary: Summary, filing: Filing) -> str:
         """Generate a CSV export of the full structured summary (all sections)."""
         output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Brand rows first (owner request, export overhaul): a CSV carries no styling, so the
-        # masthead is two plain rows saying who made it before the document title.
-        writer.writerow(["EarningsNerd — AI-Powered SEC Filing Analysis"])
-        writer.writerow(["earningsnerd.io"])
-        writer.writerow([])
-
-        # Header
-        writer.writerow([f"{filing.company.name} - {filing.filing_type} Summary"])
-        writer.writerow([f"Filing Date: {filing.filing_date.strftime('%Y-%m-%d') if filing.filing_date else 'N/A'}"])
-        writer.writerow([f"Generated: {utcnow().strftime('%Y-%m-%d %H:%M:%S')}"])
-        writer.writerow([])
+        # BOM: the brand row's em dash guarantees non-ASCII on row 1, and Excel on Windows only
+        # decodes a CSV as UTF-8 when the file leads with one (the same rationale as the deleted
+        # client-side analysis CSV). Explicit escape — a literal BOM char is invisible and easily
+        # stripped by editors/formatters. Written first rather than prepended to getvalue(), which
+        # would copy the whole document once more.
+        output.write("\ufeff")
+        # Rows are collected and handed to one writerows() call: a single pass through the csv
+        # writer's C loop instead of one Python->C round-trip per row.
+        rows: list[list[str]] = [
+            # Brand rows first (owner request, export overhaul): a CSV carries no styling, so the
+            # masthead is two plain rows saying who made it before the document title.
+            ["EarningsNerd — AI-Powered SEC Filing Analysis"],
+            ["earningsnerd.io"],
+            [],
+            # Header
+            [f"{filing.company.name} - {filing.filing_type} Summary"],
+            [f"Filing Date: {filing.filing_date.strftime('%Y-%m-%d') if filing.filing_date else 'N/A'}"],
+            [f"Generated: {utcnow().strftime('%Y-%m-%d %H:%M:%S')}"],
+            [],
+        ]
 
         # Render every structured section through the shared renderer (single source of truth)
         # so the CSV carries the same content as the PDF and the on-page summary, instead of just
         # the financial-highlights table + risks the old code emitted.
-        raw_summary = summary.raw_summary or {}
-        for section in render_sections(raw_summary):
-            self._write_section_csv(writer, section)
+        for section in self._summary_sections(summary):
+            self._write_section_csv(rows, section)
 
-        # BOM: the brand row's em dash guarantees non-ASCII on row 1, and Excel on Windows only
-        # decodes a CSV as UTF-8 when the file leads with one (the same rationale as the deleted
-        # client-side analysis CSV). Explicit escape — a literal BOM char is invisible and easily
-        # stripped by editors/formatters.
-        return "\ufeff" + output.getvalue()
+        csv.writer(output).writerows(rows)
+        return output.getvalue()
 
     @staticmethod
-    def _write_section_csv(writer, section: Section) -> None:
-        writer.writerow([section.title])
+    def _write_section_csv(rows: list[list[str]], section: Section) -> None:
+        rows.append([section.title])
         for block in section.blocks:
             if block.kind in ("paragraph", "subheading"):
                 if block.text:
-                    writer.writerow([block.text])
+                    rows.append([block.text])
             elif block.kind == "quote":
                 if block.text:
                     # Curly quotes (not straight ") so csv.writer doesn't double-escape into """…""".
                     line = f"“{block.text}”"
                     if block.speaker:
                         line += f" — {block.speaker}"
-                    writer.writerow([line])
+                    rows.append([line])
             elif block.kind == "bullets":
                 if block.text:
-                    writer.writerow([block.text])
-                    for item in block.items:
-                        writer.writerow(["", item])
+                    rows.append([block.text])
+                    rows.extend(["", item] for item in block.items)
                 else:
-                    for item in block.items:
-                        writer.writerow([item])
+                    rows.extend([item] for item in block.items)
             elif block.kind in ("table", "metrics"):
                 if block.headers:
-                    writer.writerow(block.headers)
-                for row in block.rows:
-                    writer.writerow(row)
+                    rows.append(block.headers)
+                rows.extend(block.rows)
             elif block.kind == "callout":
                 if block.text:
-                    writer.writerow([f"{block.label}: {block.text}" if block.label else block.text])
-        writer.writerow([])
+                    rows.append([f"{block.label}: {block.text}" if block.label else block.text])
+        rows.append([])
 
     async def export_pdf(self, summary: Summary, filing: Filing) -> bytes:
         """Export summary as PDF"""
         try:
-            from weasyprint import HTML
+            HTML = _get_weasyprint_html()
             html_content = self.generate_pdf_html(summary, filing)
             # WeasyPrint parse + render is CPU-heavy (hundreds of ms) — off the event loop.
             return await asyncio.to_thread(lambda: HTML(string=html_content).write_pdf())
@@ -183,13 +236,13 @@ class ExportService:
         ``**bold**`` and ``*italic*`` — into tags. Escape-first keeps the everything-escaped
         posture; both regexes are linear (no nesting, no lazy quantifiers) since this scans
         model output."""
-        escaped = escape(text)
-        escaped = re.sub(r"\*\*([^*\n]+)\*\*", r"<strong>\1</strong>", escaped)
-        # Italic needs tight asterisks (no space inside) so a lone "*" or "5*3" stays literal.
-        escaped = re.sub(r"(?<!\*)\*(?!\s)([^*\n]+)(?<!\s)\*(?!\*)", r"<em>\1</em>", escaped)
-        return escaped
+        escaped = _BOLD_RE.sub(r"<strong>\1</strong>", escape(text))
+        return _ITALIC_RE.sub(r"<em>\1</em>", escaped)
 
+    # Pure in its input: re-exports of the same analysis (PDF retries, PDF + Excel back to back)
+    # reuse the rendered narrative. Bounded, since narratives run to tens of KB.
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def _narrative_to_html(cls, narrative: str) -> str:
         """Dependency-free markdown→HTML for the analysis narrative: ``## ``/``### `` headings,
         ``- ``/``* `` bullet lists, ``**bold**``/``*italic*`` inline, blank-line paragraphs —
@@ -268,7 +321,7 @@ class ExportService:
                 return f"{sign}{currency}{magnitude / 1e6:.1f}M"
             return f"{sign}{currency}{magnitude:,.0f}"
 
-        header_cells = "".join(f"<th>{escape(period)}</th>" for period in periods)
+        header_cells = "".join([f"<th>{escape(period)}</th>" for period in periods])
         body_rows = []
         for series in dataset.get("series", []):
             by_period = {p.get("period"): p for p in series.get("points", [])}
@@ -304,9 +357,11 @@ class ExportService:
         )
         # "Generated" = when the AI actually wrote this narrative (the row's timestamps) — a
         # cached analysis exported weeks later must not present itself as freshly generated.
+        # One clock read for both dates, so an un-stamped row can't show Generated != Exported.
+        now = utcnow()
         generated_at = getattr(analysis, "updated_at", None) or getattr(analysis, "created_at", None)
-        generated_date = (generated_at or utcnow()).strftime("%B %d, %Y")
-        exported_date = utcnow().strftime("%B %d, %Y")
+        generated_date = (generated_at or now).strftime("%B %d, %Y")
+        exported_date = now.strftime("%B %d, %Y")
 
         meta_html = (
             f'<span class="data">{escape(company.ticker or "")}</span> · {mode_label} · '
@@ -366,7 +421,7 @@ class ExportService:
     async def export_analysis_pdf(self, analysis, company) -> bytes:
         """Export a Multi-Period Analysis as PDF (same WeasyPrint path as export_pdf)."""
         try:
-            from weasyprint import HTML
+            HTML = _get_weasyprint_html()
             html_content = self.generate_analysis_pdf_html(analysis, company)
             # WeasyPrint parse + render is CPU-heavy (hundreds of ms) — off the event loop.
             return await asyncio.to_thread(lambda: HTML(string=html_content).write_pdf())
@@ -1,9 +1,27 @@
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from decimal import Decimal
+from itertools import islice
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+import hashlib
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing XBRL metric/period entries.
+_EMPTY: Dict[str, Any] = {}
+
+
+def _metric_entries(xbrl_data: Dict[str, Any], key: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return a standardized metric's ``(current, prior)`` entries, ``_EMPTY`` where absent."""
+    metric = xbrl_data.get(key)
+    if not isinstance(metric, dict):
+        return _EMPTY, _EMPTY
+    return metric.get('current') or _EMPTY, metric.get('prior') or _EMPTY
+
+
+_HEADLINE_METRIC_KEYS = ("revenue", "net_income", "earnings_per_share")
+
 
 def has_valid_xbrl_data(xbrl_data: Optional[Dict[str, Any]]) -> bool:
     """Check if XBRL data contains actual metric values.
@@ -14,56 +32,135 @@ def has_valid_xbrl_data(xbrl_data: Optional[Dict[str, Any]]) -> bool:
     Note: Uses explicit `is not None` checks to allow zero as a valid value
     (e.g., zero net income is a legitimate financial figure).
     """
-    if not xbrl_data:
-        return False
-    if not isinstance(xbrl_data, dict):
+    if not xbrl_data or not isinstance(xbrl_data, dict):
         return False
     # Check if any metric has actual data
-    for key in ['revenue', 'net_income', 'earnings_per_share']:
-        metric = xbrl_data.get(key, {})
-        # Use 'is not None' to allow zero values (valid financial data)
-        if isinstance(metric, dict) and metric.get('current', {}).get('value') is not None:
-            return True
-        # Also check if it's a list with items (raw XBRL format)
-        if isinstance(metric, list) and len(metric) > 0:
-            if any(item.get('value') is not None for item in metric if isinstance(item, dict)):
+    for key in _HEADLINE_METRIC_KEYS:
+        metric = xbrl_data.get(key)
+        if isinstance(metric, dict):
+            # Use 'is not None' to allow zero values (valid financial data)
+            current = metric.get('current')
+            if isinstance(current, dict) and current.get('value') is not None:
+                return True
+        elif isinstance(metric, list):
+            # Raw XBRL format: a list of fact dicts
+            if any(isinstance(item, dict) and item.get('value') is not None for item in metric):
                 return True
     return False
 
 
+# (threshold, divisor, suffix), largest first: the first threshold the magnitude reaches wins.
+_CURRENCY_SCALES = ((1_000_000_000, 1_000_000_000, "B"), (1_000_000, 1_000_000, "M"))
+
+
 def format_currency(value: Optional[float]) -> str:
     if value is None:
         return "Not disclosed"
-    try:
-        abs_val = abs(value)
-        if abs_val >= 1_000_000_000:
-            return f"${value / 1_000_000_000:.1f}B"
-        if abs_val >= 1_000_000:
-            return f"${value / 1_000_000:.1f}M"
-        return f"${value:,.0f}"
-    except Exception as e:
-        logger.warning(f"Error formatting currency value {value}: {e}")
+    # bool is an int subclass but never a money value; anything else non-numeric is a data bug.
+    if not isinstance(value, (int, float, Decimal)) or isinstance(value, bool):
+        logger.warning("Error formatting currency value %r: not a number", value)
         return "Not disclosed"
-
-
-def _extract_section_text(text: str, section_patterns: List[str], max_chars: int = 2000) -> Optional[str]:
-    """Extract a section from filing text using regex patterns."""
+    abs_val = abs(value)
+    for threshold, divisor, suffix in _CURRENCY_SCALES:
+        if abs_val >= threshold:
+            return f"${value / divisor:.1f}{suffix}"
+    return f"${value:,.0f}"
+
+
+# Sentence terminators folded onto "." so str.split can stand in for re.split(r'[.!?]+', ...).
+_SENTENCE_END_TABLE = str.maketrans({"!": ".", "?": "."})
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Same pieces as ``re.split(r'[.!?]+', text)``, via two C-level string passes."""
+    pieces = text.translate(_SENTENCE_END_TABLE).split(".")
+    if len(pieces) > 2:
+        # A run of terminators is one split for the regex: drop the empty interior pieces.
+        pieces = [pieces[0], *[piece for piece in pieces[1:-1] if piece], pieces[-1]]
+    return pieces
+
+
+def _locator(header: str, terminator: str) -> Tuple[Tuple[str, ...], re.Pattern, re.Pattern]:
+    # The header's words, lowercased. Every letter run in these headers is a required literal, so
+    # a text missing one cannot match; the first word is where any match starts.
+    words = tuple(word.lower() for word in re.findall(r"[A-Za-z]{2,}", header))
+    return words, re.compile(header, re.IGNORECASE), re.compile(terminator, re.IGNORECASE)
+
+
+# Section locators, tried in order: (words, header, terminator). The section body runs from the
+# end of the header to the next terminator (or the end of the text).
+_RISK_SECTION_RES = (
+    _locator(r"Item\s*1A[\.\s\-:]*Risk\s*Factors", r"Item\s*\d|PART\s*II"),
+    _locator(r"RISK\s*FACTORS", r"Item\s*\d|PART\s*II"),
+    _locator(r"Factors\s*That\s*May\s*Affect", r"Item\s*\d"),
+)
+_MDA_ANY_RE = _locator(r"MANAGEMENT['']?S?\s*DISCUSSION\s*AND\s*ANALYSIS", r"Item\s*\d")
+# Different patterns per form. 20-F uses Item 5 (Operating & Financial Review) as its MD&A.
+_MDA_SECTION_RES = {
+    "10-K": (
+        _locator(r"Item\s*7[\.\s\-:]*Management['']?s?\s*Discussion", r"Item\s*7A|Item\s*8"),
+        _MDA_ANY_RE,
+    ),
+    "20-F": (
+        _locator(r"Item\s*5[\.\s\-:]*Operating\s*and\s*Financial\s*Review", r"Item\s*6|Item\s*7"),
+        _locator(r"Operating\s*and\s*Financial\s*Review\s*and\s*Prospects", r"Item\s*\d"),
+        _MDA_ANY_RE,
+    ),
+    "10-Q": (
+        _locator(r"Item\s*2[\.\s\-:]*Management['']?s?\s*Discussion", r"Item\s*3|Item\s*4"),
+        _MDA_ANY_RE,
+    ),
+}
+
+# Raw characters scanned past a header, per output character: whitespace runs collapse, so the
+# window leaves headroom before max_chars of cleaned text is reached.
+_SECTION_WINDOW_FACTOR = 4
+
+# Bullet points, then numbered items, within a located Risk Factors section. The section text has
+# its whitespace collapsed (no newlines), so a numbered item can only lead it: anchoring with a
+# plain ``^`` lets the engine try the start alone instead of probing every offset for ``\n``.
+_RISK_ITEM_RES = (
+    re.compile(r"[•\-\*]\s*([A-Z][^•\-\*\n]{50,300})"),
+    re.compile(r"^\s*(\d+[\.\)]\s*[A-Z][^\n]{50,300})"),
+)
+
+
+def _extract_section_text(
+    text: str, section_patterns: Sequence[Tuple[str, re.Pattern, re.Pattern]], max_chars: int = 2000
+) -> Optional[str]:
+    """Extract a section from filing text using (words, header, terminator) locators.
+
+    Cheap ``str.find`` probes run first: a locator whose header words are absent is skipped
+    without touching the regex engine, and a header search starts at the first occurrence of
+    its leading word. Only a bounded window after the header is searched for the terminator.
+    """
     if not text:
         return None
 
-    for pattern in section_patterns:
-        try:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                content = match.group(1) if match.groups() else match.group(0)
-                # Clean and truncate
-                content = re.sub(r'\s+', ' ', content).strip()
-                if len(content) > max_chars:
-                    content = content[:max_chars] + "..."
-                return content
-        except Exception as e:
-            logger.warning(f"Error processing regex pattern in _extract_section_text: {e}")
-            continue
+    lowered = text.lower()
+    # Offsets found in the lowered copy only map back onto ``text`` when lowering kept its length.
+    if len(lowered) != len(text):
+        lowered = None
+
+    for words, header_re, terminator_re in section_patterns:
+        pos = 0
+        if lowered is not None:
+            pos = lowered.find(words[0])
+            if pos < 0 or not all(word in lowered for word in words[1:]):
+                continue
+        header = header_re.search(text, pos)
+        if header:
+            start = header.end()
+            window_end = min(start + max_chars * _SECTION_WINDOW_FACTOR, len(text))
+            terminator = terminator_re.search(text, start, window_end)
+            end = terminator.start() if terminator else window_end
+            # Clean and truncate (str.split() splits on the same Unicode whitespace as \s)
+            content = ' '.join(text[start:end].split())
+            if len(content) > max_chars:
+                content = content[:max_chars] + "..."
+            elif terminator is None and window_end < len(text):
+                content += "..."
+            return content
     return None
 
 
@@ -72,14 +169,7 @@ def _extract_risk_factors(filing_text: str, filing_type: str = "10-Q") -> List[D
     if not filing_text:
         return []
 
-    # Patterns to find Risk Factors section
-    patterns = [
-        r"Item\s*1A[\.\s\-:]*Risk\s*Factors(.*?)(?=Item\s*\d|PART\s*II|$)",
-        r"RISK\s*FACTORS(.*?)(?=Item\s*\d|PART\s*II|$)",
-        r"Factors\s*That\s*May\s*Affect(.*?)(?=Item\s*\d|$)",
-    ]
-
-    section_text = _extract_section_text(filing_text, patterns, max_chars=5000)
+    section_text = _extract_section_text(filing_text, _RISK_SECTION_RES, max_chars=5000)
 
     if not section_text or len(section_text) < 100:
         return []
@@ -88,15 +178,10 @@ def _extract_risk_factors(filing_text: str, filing_type: str = "10-Q") -> List[D
     risks = []
 
     # Look for bullet points or numbered risks
-    risk_patterns = [
-        r"[•\-\*]\s*([A-Z][^•\-\*\n]{50,300})",  # Bullet points
-        r"(?:^|\n)\s*(\d+[\.\)]\s*[A-Z][^\n]{50,300})",  # Numbered items
-    ]
-
-    for pattern in risk_patterns:
-        matches = re.findall(pattern, section_text)
-        for match in matches[:5]:  # Limit to 5 risks
-            clean_text = re.sub(r'\s+', ' ', match).strip()
+    for pattern in _RISK_ITEM_RES:
+        # Limit to 5 risks; islice stops the scan there instead of collecting every match.
+        for match in islice(pattern.finditer(section_text), 5):
+            clean_text = ' '.join(match.group(1).split())
             if len(clean_text) > 50:
                 risks.append({
                     "summary": clean_text[:200] + ("..." if len(clean_text) > 200 else ""),
@@ -106,7 +191,7 @@ def _extract_risk_factors(filing_text: str, filing_type: str = "10-Q") -> List[D
 
     # If no structured risks found, extract first few sentences as summary
     if not risks and len(section_text) > 100:
-        sentences = re.split(r'[.!?]+', section_text)
+        sentences = _split_sentences(section_text)
         summary_sentences = [s.strip() for s in sentences[:3] if len(s.strip()) > 30]
         if summary_sentences:
             risks.append({
@@ -123,24 +208,7 @@ def _extract_mda(filing_text: str, filing_type: str = "10-Q") -> str:
     if not filing_text:
         return ""
 
-    # Different patterns per form. 20-F uses Item 5 (Operating & Financial Review) as its MD&A.
-    if filing_type == "10-K":
-        patterns = [
-            r"Item\s*7[\.\s\-:]*Management['']?s?\s*Discussion(.*?)(?=Item\s*7A|Item\s*8|$)",
-            r"MANAGEMENT['']?S?\s*DISCUSSION\s*AND\s*ANALYSIS(.*?)(?=Item\s*\d|$)",
-        ]
-    elif filing_type == "20-F":
-        patterns = [
-            r"Item\s*5[\.\s\-:]*Operating\s*and\s*Financial\s*Review(.*?)(?=Item\s*6|Item\s*7|$)",
-            r"Operating\s*and\s*Financial\s*Review\s*and\s*Prospects(.*?)(?=Item\s*\d|$)",
-            r"MANAGEMENT['']?S?\s*DISCUSSION\s*AND\s*ANALYSIS(.*?)(?=Item\s*\d|$)",
-        ]
-    else:  # 10-Q
-        patterns = [
-            r"Item\s*2[\.\s\-:]*Management['']?s?\s*Discussion(.*?)(?=Item\s*3|Item\s*4|$)",
-            r"MANAGEMENT['']?S?\s*DISCUSSION\s*AND\s*ANALYSIS(.*?)(?=Item\s*\d|$)",
-        ]
-
+    patterns = _MDA_SECTION_RES.get(filing_type, _MDA_SECTION_RES["10-Q"])
     section_text = _extract_section_text(filing_text, patterns, max_chars=3000)
 
     if section_text and len(section_text) > 100:
@@ -150,6 +218,40 @@ def _extract_mda(filing_text: str, filing_type: str = "10-Q") -> str:
     return ""
 
 
+# Memo for the filing-text extraction. A timed-out filing is usually retried with the same text,
+# and locating Risk Factors/MD&A in a multi-MB filing costs far more than hashing it. Key:
+# (filing_type, blake2b digest of the text). Value: (risk factor dicts, MD&A text) — risk dicts
+# are copied on the way out because the pipeline mutates the payload it builds from them.
+_text_sections_memo: OrderedDict[Tuple[str, bytes], Tuple[List[Dict[str, Any]], str]] = OrderedDict()
+_TEXT_SECTIONS_MEMO_SIZE = 32
+
+
+def _extract_text_sections(text_source: str, filing_type: str) -> Tuple[List[Dict[str, Any]], str]:
+    """Return ``(risk_factors, mda)`` extracted from filing text (empty on failure), memoized."""
+    digest = hashlib.blake2b(text_source.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (filing_type, digest)
+    cached = _text_sections_memo.get(key)
+    if cached is None:
+        risks: List[Dict[str, Any]] = []
+        mda = ""
+        try:
+            risks = _extract_risk_factors(text_source, filing_type)
+        except Exception as e:
+            logger.warning("Failed to extract risk factors: %s", e)
+        try:
+            mda = _extract_mda(text_source, filing_type)
+        except Exception as e:
+            logger.warning("Failed to extract MD&A: %s", e)
+        cached = (risks, mda)
+        _text_sections_memo[key] = cached
+        if len(_text_sections_memo) > _TEXT_SECTIONS_MEMO_SIZE:
+            _text_sections_memo.popitem(last=False)
+    else:
+        _text_sections_memo.move_to_end(key)
+    risks, mda = cached
+    return [dict(risk) for risk in risks], mda
+
+
 def generate_xbrl_summary(
     xbrl_data: Optional[Dict[str, Any]],
     company_name: str,
@@ -178,75 +280,64 @@ def generate_xbrl_summary(
     """
     filing_type = (filing_type or "10-Q").upper()
 
-    # Defaults
-    business_overview = f"## {company_name} {filing_type} Summary\n\n"
-
-    # Extract metrics if available
+    # Extract metrics if available: each metric's current/prior entries are read once here and
+    # reused by the overview and the highlights table.
     metrics_summary = []
-    # Use has_valid_xbrl_data() to properly check for data
-    # An empty dict {} is falsy, so `if xbrl_data:` would skip valid responses
-    has_xbrl_data = has_valid_xbrl_data(xbrl_data)
-
-    if has_xbrl_data:
-        # Note: xbrl_data is guaranteed truthy by has_valid_xbrl_data()
-        revenue = xbrl_data.get('revenue', {}).get('current', {})
-        net_income = xbrl_data.get('net_income', {}).get('current', {})
-        eps = xbrl_data.get('earnings_per_share', {}).get('current', {})
-
-        if revenue.get('value'):
-            metrics_summary.append(f"- **Revenue**: {format_currency(revenue['value'])} (Period: {revenue.get('period', 'N/A')})")
-            has_xbrl_data = True
+    if isinstance(xbrl_data, dict):
+        revenue, prior_revenue = _metric_entries(xbrl_data, 'revenue')
+        net_income, prior_net_income = _metric_entries(xbrl_data, 'net_income')
+        eps, prior_eps = _metric_entries(xbrl_data, 'earnings_per_share')
+    else:
+        revenue = prior_revenue = net_income = prior_net_income = eps = prior_eps = _EMPTY
+    # Usually answered by the entries just read; has_valid_xbrl_data() only runs for the other
+    # shapes it accepts (e.g. raw XBRL lists). Explicit `is not None` keeps zero as valid data.
+    has_xbrl_data = (
+        any(entry.get('value') is not None for entry in (revenue, net_income, eps))
+        or has_valid_xbrl_data(xbrl_data)
+    )
 
-        if net_income.get('value'):
-            metrics_summary.append(f"- **Net Income**: {format_currency(net_income['value'])} (Period: {net_income.get('period', 'N/A')})")
-            has_xbrl_data = True
+    # (label, current, prior, formatted current): one pass feeds both the overview snapshot and
+    # the highlights table.
+    currency_metrics = [
+        (label, current, prior, format_currency(current.get('value')))
+        for label, current, prior in (
+            ("Revenue", revenue, prior_revenue),
+            ("Net Income", net_income, prior_net_income),
+        )
+    ]
+    for label, current, _, current_display in currency_metrics:
+        if current.get('value'):
+            metrics_summary.append(f"- **{label}**: {current_display} (Period: {current.get('period', 'N/A')})")
 
-        if eps.get('value'):
-            metrics_summary.append(f"- **EPS**: {eps['value']} (Period: {eps.get('period', 'N/A')})")
-            has_xbrl_data = True
+    if eps.get('value'):
+        metrics_summary.append(f"- **EPS**: {eps['value']} (Period: {eps.get('period', 'N/A')})")
 
     # Build business overview text
+    overview_parts = [f"## {company_name} {filing_type} Summary\n\n"]
     if metrics_summary:
-        business_overview += "### Financial Snapshot (XBRL)\n" + "\n".join(metrics_summary) + "\n\n"
+        overview_parts.append("### Financial Snapshot (XBRL)\n")
+        overview_parts.append("\n".join(metrics_summary))
+        overview_parts.append("\n\n")
     else:
-        business_overview += "Financial metrics are being processed.\n\n"
-
-    business_overview += "_Click 'Regenerate Analysis' for the full AI-powered insights._"
+        overview_parts.append("Financial metrics are being processed.\n\n")
+    overview_parts.append("_Click 'Regenerate Analysis' for the full AI-powered insights._")
+    business_overview = "".join(overview_parts)
 
     # ALWAYS provide financial_highlights with meaningful structure
     if has_xbrl_data:
-        revenue = xbrl_data.get('revenue', {}).get('current', {})
-        net_income = xbrl_data.get('net_income', {}).get('current', {})
-        eps = xbrl_data.get('earnings_per_share', {}).get('current', {})
-        prior_revenue = xbrl_data.get('revenue', {}).get('prior', {})
-        prior_net_income = xbrl_data.get('net_income', {}).get('prior', {})
-        prior_eps = xbrl_data.get('earnings_per_share', {}).get('prior', {})
-
-        table_rows = []
-
-        # Revenue row
-        rev_current = format_currency(revenue.get('value'))
-        rev_prior = format_currency(prior_revenue.get('value')) if prior_revenue.get('value') else "—"
-        rev_commentary = "Full comparison available in detailed analysis." if rev_current == "Not disclosed" else "From XBRL data"
-        table_rows.append({
-            "metric": "Revenue",
-            "current_period": rev_current,
-            "prior_period": rev_prior,
-            "change": "—",
-            "commentary": rev_commentary
-        })
-
-        # Net Income row
-        ni_current = format_currency(net_income.get('value'))
-        ni_prior = format_currency(prior_net_income.get('value')) if prior_net_income.get('value') else "—"
-        ni_commentary = "Full comparison available in detailed analysis." if ni_current == "Not disclosed" else "From XBRL data"
-        table_rows.append({
-            "metric": "Net Income",
-            "current_period": ni_current,
-            "prior_period": ni_prior,
-            "change": "—",
-            "commentary": ni_commentary
-        })
+        table_rows = [
+            {
+                "metric": label,
+                "current_period": current_display,
+                "prior_period": format_currency(prior.get('value')) if prior.get('value') else "—",
+                "change": "—",
+                "commentary": (
+                    "Full comparison available in detailed analysis."
+                    if current_display == "Not disclosed" else "From XBRL data"
+                ),
+            }
+            for label, _, prior, current_display in currency_metrics
+        ]
 
         # EPS row if available
         if eps.get('value') is not None:
@@ -292,16 +383,14 @@ def generate_xbrl_summary(
     # EXTRACT REAL RISK FACTORS from filing text
     # Priority: filing_excerpt > filing_text > placeholder
     risk_factors = []
+    extracted_mda = ""
 
     text_source = filing_excerpt or filing_text
     if text_source:
-        try:
-            extracted_risks = _extract_risk_factors(text_source, filing_type)
-            if extracted_risks:
-                risk_factors = extracted_risks
-                logger.info(f"Extracted {len(risk_factors)} risk factors from filing text")
-        except Exception as e:
-            logger.warning(f"Failed to extract risk factors: {e}")
+        extracted_risks, extracted_mda = _extract_text_sections(text_source, filing_type)
+        if extracted_risks:
+            risk_factors = extracted_risks
+            logger.info("Extracted %d risk factors from filing text", len(risk_factors))
 
     # Fallback if extraction failed
     if not risk_factors:
@@ -316,14 +405,9 @@ def generate_xbrl_summary(
     # EXTRACT REAL MD&A from filing text
     management_discussion = ""
 
-    if text_source:
-        try:
-            extracted_mda = _extract_mda(text_source, filing_type)
-            if extracted_mda and len(extracted_mda) > 100:
-                management_discussion = extracted_mda
-                logger.info("Extracted MD&A from filing text")
-        except Exception as e:
-            logger.warning(f"Failed to extract MD&A: {e}")
+    if extracted_mda and len(extracted_mda) > 100:
+        management_discussion = extracted_mda
+        logger.info("Extracted MD&A from filing text")
 
     # Fallback if extraction failed
     if not management_discussion:
@@ -5,12 +5,12 @@ from datetime import date, datetime, timedelta, timezone
 from app.utils.datetimes import utcnow, iso_z
 from typing import Dict, List, Optional, Set, TypeVar
 
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, func, literal_column
+from sqlalchemy.orm import Session
 
 from app.integrations.fmp import FMPClient, FMPEarningsEvent, fmp_client
 from app.integrations.finnhub import FinnhubClient, FinnhubSentiment, finnhub_client
-from app.models import Filing, UserSearch
+from app.models import Company, Filing, UserSearch
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def _normalize(values: Dict[KeyT, float]) -> Dict[KeyT, float]:
     return {key: min(value / max_value, 1.0) for key, value in values.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class HotFilingRecord:
     filing_id: int
     symbol: str
@@ -64,11 +64,18 @@ class HotFilingRecord:
         }
 
 
+# GET /api/hot_filings caps `limit` at 20. One ranking computed at this size serves every
+# limit by slicing, so a refresh covers them all and a shorter list is a prefix of a longer one.
+_RANKED_LIMIT = 20
+
+
 class HotFilingsService:
     """Service for computing and caching hot filings."""
 
-    _cache: Dict[int, Dict[str, object]]
-    _cache_expiry: Dict[int, datetime]
+    _cache: Optional[List[Dict[str, object]]]
+    _cache_limit: int
+    _cache_updated: Optional[str]
+    _cache_expiry: Optional[datetime]
 
     def __init__(
         self,
@@ -76,8 +83,10 @@ class HotFilingsService:
         fmp_client_instance: Optional[FMPClient] = None,
         news_client: Optional[FinnhubClient] = None,
     ) -> None:
-        self._cache = {}
-        self._cache_expiry = {}
+        self._cache = None
+        self._cache_limit = 0
+        self._cache_updated = None
+        self._cache_expiry = None
         self._ttl = timedelta(minutes=ttl_minutes)
         # Lazy lock initialization for event loop safety (created on first use)
         self._lock: Optional[asyncio.Lock] = None
@@ -99,32 +108,36 @@ class HotFilingsService:
         now = utcnow()
 
         async with self._get_lock():
-            cache_entry = self._cache.get(limit)
-            cache_expiry = self._cache_expiry.get(limit)
-
             if (
-                not force_refresh
-                and cache_entry is not None
-                and cache_expiry is not None
-                and now < cache_expiry
+                force_refresh
+                or self._cache is None
+                or self._cache_expiry is None
+                or now >= self._cache_expiry
+                or limit > self._cache_limit
             ):
-                return cache_entry
+                ranked_limit = max(limit, _RANKED_LIMIT)
+                records = await self._calculate_hot_filings(db, ranked_limit)
+                self._cache = [record.to_dict() for record in records]
+                self._cache_limit = ranked_limit
+                self._cache_updated = iso_z(now)
+                self._cache_expiry = now + self._ttl
 
-            records = await self._calculate_hot_filings(db, limit)
-            payload = {
-                "filings": [record.to_dict() for record in records],
-                "last_updated": iso_z(now),
-            }
-
-            self._cache[limit] = payload
-            self._cache_expiry[limit] = now + self._ttl
-            return payload
+            return {"filings": self._cache[:limit], "last_updated": self._cache_updated}
 
     async def _calculate_hot_filings(self, db: Session, limit: int) -> List[HotFilingRecord]:
         candidate_limit = max(limit * 3, 20)
+        # Only the columns scoring reads, as plain rows: no ORM hydration of the wide Filing and
+        # Company rows. The inner join also drops company-less filings, which can't be ranked.
         recent_filings = (
-            db.query(Filing)
-            .options(joinedload(Filing.company))
+            db.query(
+                Filing.id,
+                Filing.company_id,
+                Filing.filing_type,
+                Filing.filing_date,
+                Company.ticker,
+                Company.name,
+            )
+            .join(Company, Filing.company_id == Company.id)
             .order_by(desc(Filing.filing_date))
             .limit(candidate_limit)
             .all()
@@ -137,48 +150,57 @@ class HotFilingsService:
         unique_company_ids = list({cid for cid in company_ids if cid is not None})
         now = utcnow()
 
-        # Gather search interest over the last 7 days
+        # Search interest over the last 7 days and filing velocity over the
+        # last 30 days, fetched in one round-trip and split by the kind tag.
         seven_days_ago = now - timedelta(days=7)
+        thirty_days_ago = now - timedelta(days=30)
         search_interest: Dict[int, float] = {}
+        filing_velocity: Dict[int, float] = {}
         if unique_company_ids:
             search_counts = (
-                db.query(UserSearch.company_id, func.count(UserSearch.id))
+                db.query(
+                    literal_column("'search'").label("kind"),
+                    UserSearch.company_id,
+                    func.count(UserSearch.id),
+                )
                 .filter(
                     UserSearch.company_id.in_(unique_company_ids),
                     UserSearch.created_at >= seven_days_ago,
                 )
                 .group_by(UserSearch.company_id)
-                .all()
             )
-            search_interest = {company_id: count for company_id, count in search_counts}
-
-        # Filing velocity over the last 30 days
-        thirty_days_ago = now - timedelta(days=30)
-        filing_velocity: Dict[int, float] = {}
-        if unique_company_ids:
             filing_counts = (
-                db.query(Filing.company_id, func.count(Filing.id))
+                db.query(
+                    literal_column("'velocity'").label("kind"),
+                    Filing.company_id,
+                    func.count(Filing.id),
+                )
                 .filter(
                     Filing.company_id.in_(unique_company_ids),
                     Filing.filing_date >= thirty_days_ago,
                 )
                 .group_by(Filing.company_id)
-                .all()
             )
-            filing_velocity = {company_id: count for company_id, count in filing_counts}
-
-        ticker_to_company: Dict[str, int] = {
-            filing.company.ticker.upper(): filing.company_id
-            for filing in recent_filings
-            if filing.company and filing.company_id and filing.company.ticker
+            for kind, company_id, count in search_counts.union_all(filing_counts).all():
+                if kind == "search":
+                    search_interest[company_id] = count
+                else:
+                    filing_velocity[company_id] = count
+
+        # Uppercase each ticker once; the scoring loop below reuses this list positionally.
+        normalized_tickers = [(filing.ticker or "").upper() for filing in recent_filings]
+        tickers: Set[str] = {
+            ticker
+            for ticker, filing in zip(normalized_tickers, recent_filings)
+            if ticker and filing.company_id
         }
 
-        tickers = set(ticker_to_company.keys())
-
-        # Load FMP earnings calendar data
-        fmp_earnings = await self._load_fmp_earnings(tickers)
-
-        news_sentiments = await self._load_finnhub_sentiments(tickers)
+        # FMP earnings calendar and Finnhub sentiment are independent network calls; overlap them.
+        # Both loaders swallow their own failures and return {}, so gather never aborts here.
+        fmp_earnings, news_sentiments = await asyncio.gather(
+            self._load_fmp_earnings(tickers),
+            self._load_finnhub_sentiments(tickers),
+        )
         normalized_news_buzz = _normalize(
             {
                 symbol: sentiment.buzz_ratio
@@ -210,11 +232,13 @@ class HotFilingsService:
 
         today = date.today()
         hot_records: List[HotFilingRecord] = []
-        for filing in recent_filings:
-            if not filing.company:
-                continue
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for filing, ticker in zip(recent_filings, normalized_tickers):
+            company_id = filing.company_id
+            symbol = filing.ticker
+            filing_type = filing.filing_type
+            filing_date = filing.filing_date
 
-            ticker = (filing.company.ticker or "").upper()
             fmp_event: Optional[FMPEarningsEvent] = (
                 fmp_earnings.get(ticker) if ticker else None
             )
@@ -222,12 +246,12 @@ class HotFilingsService:
                 news_sentiments.get(ticker) if ticker else None
             )
 
-            age_hours = (now - _to_aware_utc(filing.filing_date)).total_seconds() / 3600
+            age_hours = (now - _to_aware_utc(filing_date)).total_seconds() / 3600
             recency_weight = max(0.0, 1 - min(age_hours / 72.0, 1.0))
             recency_score = recency_weight * 5.0
 
-            search_score = normalized_search.get(filing.company_id, 0.0) * 3.0
-            velocity_score = normalized_velocity.get(filing.company_id, 0.0) * 2.0
+            search_score = normalized_search.get(company_id, 0.0) * 3.0
+            velocity_score = normalized_velocity.get(company_id, 0.0) * 2.0
 
             # FMP earnings calendar bonus (replaces EarningsWhispers)
             fmp_earnings_bonus = 0.0
@@ -257,7 +281,7 @@ class HotFilingsService:
             # above other forms. DB-read-only over already-ingested filings — no SEC cost — so this
             # is ungated; it only re-weights FPI filings already surfaced via ENABLE_FPI_FILINGS.
             filing_type_bonus = 0.5
-            if (filing.filing_type or "").upper() in {"10-K", "10-Q", "20-F", "40-F", "6-K"}:
+            if (filing_type or "").upper() in {"10-K", "10-Q", "20-F", "40-F", "6-K"}:
                 filing_type_bonus = 1.5
 
             buzz_score = (
@@ -271,22 +295,18 @@ class HotFilingsService:
                 + news_sentiment_bonus
             )
 
+            # Each source is checked exactly once, so plain appends can't duplicate.
             sources: List[str] = ["recency"]
-
-            def add_source(name: str) -> None:
-                if name not in sources:
-                    sources.append(name)
-
             if search_score > 0:
-                add_source("search_activity")
+                sources.append("search_activity")
             if velocity_score > 0:
-                add_source("filing_velocity")
+                sources.append("filing_velocity")
             if fmp_earnings_bonus > 0:
-                add_source("earnings_calendar")
+                sources.append("earnings_calendar")
             if news_buzz_score > 0:
-                add_source("finnhub_news_buzz")
+                sources.append("finnhub_news_buzz")
             if news_headline_score > 0 or news_sentiment_bonus > 0:
-                add_source("finnhub_sentiment")
+                sources.append("finnhub_sentiment")
 
             buzz_components = {
                 "recency": round(recency_score, 2),
@@ -299,26 +319,27 @@ class HotFilingsService:
                 "news_sentiment": round(news_sentiment_bonus, 2),
             }
 
-            logger.debug(
-                "Hot filing computed",
-                extra={
-                    "filing_id": filing.id,
-                    "symbol": filing.company.ticker,
-                    "buzz_score": buzz_score,
-                    "sources": sources,
-                    "components": buzz_components,
-                    "fmp_earnings_date": fmp_event.earnings_date.isoformat() if fmp_event else None,
-                    "finnhub_sentiment": sentiment.raw if sentiment else None,
-                },
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Hot filing computed",
+                    extra={
+                        "filing_id": filing.id,
+                        "symbol": symbol,
+                        "buzz_score": buzz_score,
+                        "sources": sources,
+                        "components": buzz_components,
+                        "fmp_earnings_date": fmp_event.earnings_date.isoformat() if fmp_event else None,
+                        "finnhub_sentiment": sentiment.raw if sentiment else None,
+                    },
+                )
 
             hot_records.append(
                 HotFilingRecord(
                     filing_id=filing.id,
-                    symbol=filing.company.ticker,
-                    company_name=filing.company.name,
-                    filing_type=filing.filing_type,
-                    filing_date=filing.filing_date,
+                    symbol=symbol,
+                    company_name=filing.name,
+                    filing_type=filing_type,
+                    filing_date=filing_date,
                     buzz_score=buzz_score,
                     sources=sources,
                     buzz_components=buzz_components,
@@ -148,28 +148,34 @@ class OpenAIService(
         Helper method to run heavy parsing in a separate thread.
         This isolates CPU-intensive BeautifulSoup and regex operations from the main event loop.
         """
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(filing_text, 'html.parser')
-            # Extract text
-            filing_text_clean = soup.get_text(separator='\n', strip=False)
-            
-            # Explicitly clear the soup tree to free memory immediately
-            # This is critical for 10-K filings which can parse into very large trees
-            soup.decompose()  # Destroys the tree
-            del soup
-        except Exception:
-            # Fallback if parsing fails
-            filing_text_clean = filing_text
-
-        # Use the provided excerpt or extract critical sections (regex intensive)
-        # PASS cleaned_text to avoid double parsing!
-        filing_sample = filing_excerpt or self.extract_critical_sections(
-            filing_text, 
-            filing_type_key, 
-            cleaned_text=filing_text_clean
-        )
-        
+        # Use the provided excerpt or extract critical sections (regex intensive). The excerpt was
+        # itself assembled from a parse of this filing upstream, so the document is only parsed
+        # here when there is no excerpt — the cleaned text feeds nothing else.
+        if filing_excerpt:
+            filing_sample = filing_excerpt
+        else:
+            try:
+                from bs4 import BeautifulSoup
+                # lxml tree builder: same get_text() output as html.parser on filing HTML, built in C.
+                soup = BeautifulSoup(filing_text, 'lxml')
+                # Extract text
+                filing_text_clean = soup.get_text(separator='\n', strip=False)
+
+                # Explicitly clear the soup tree to free memory immediately
+                # This is critical for 10-K filings which can parse into very large trees
+                soup.decompose()  # Destroys the tree
+                del soup
+            except Exception:
+                # Fallback if parsing fails
+                filing_text_clean = filing_text
+
+            # PASS cleaned_text to avoid double parsing!
+            filing_sample = self.extract_critical_sections(
+                filing_text,
+                filing_type_key,
+                cleaned_text=filing_text_clean
+            )
+
         if not filing_sample:
             # Fallback to first 15k chars if extraction fails
             filing_sample = filing_text[:15000]
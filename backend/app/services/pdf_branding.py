@@ -234,6 +234,12 @@ li {{ margin: 3px 0; }}
 """
 
 
+# Everything static in the document head, rendered once at import: the fonts/palette never change
+# at runtime, so each export interpolates these instead of rebuilding ~150 lines of CSS + the SVG.
+_SHELL_STYLE = f"{font_face_css()}\n{shell_css()}"
+_MASTHEAD_MARK = mark_svg(30)
+
+
 def render_branded_pdf(
     *,
     title: str,
@@ -252,14 +258,13 @@ def render_branded_pdf(
 <head>
 <meta charset="UTF-8">
 <style>
-{font_face_css()}
-{shell_css()}
+{_SHELL_STYLE}
 {extra_css}
 </style>
 </head>
 <body>
   <div class="masthead">
-    {mark_svg(30)}
+    {_MASTHEAD_MARK}
     <span class="wordmark">Earnings<em>Nerd</em></span>
     <span class="doc-kind">{doc_kind}</span>
   </div>
@@ -381,6 +381,18 @@ def make_cache_key(namespace: CacheNamespace, *parts: str) -> str:
 CACHE_OPERATION_TIMEOUT = 2.0
 
 
+def _ready_client() -> Optional[aioredis.Redis]:
+    """
+    Return the already-initialized client for the current loop, or None.
+
+    The hot cache_get/cache_set path only needs get_redis_client()'s lazy init once; after
+    that, wrapping it in asyncio.wait_for schedules a throwaway task per call. Callers fall
+    back to the timed acquisition when this returns None.
+    """
+    _reset_on_loop_change()
+    return _client
+
+
 async def cache_get(key: str) -> Optional[Any]:
     """
     Get a value from cache.
@@ -396,15 +408,17 @@ async def cache_get(key: str) -> Optional[Any]:
     if settings.SKIP_REDIS_INIT:
         return None
 
-    try:
-        client = await asyncio.wait_for(
-            get_redis_client(),
-            timeout=CACHE_OPERATION_TIMEOUT
-        )
-    except asyncio.TimeoutError:
-        logger.warning(f"Redis client acquisition timed out for cache_get({key})")
-        _cache_stats.errors += 1
-        return None
+    client = _ready_client()
+    if client is None:
+        try:
+            client = await asyncio.wait_for(
+                get_redis_client(),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Redis client acquisition timed out for cache_get({key})")
+            _cache_stats.errors += 1
+            return None
 
     if client is None:
         _cache_stats.misses += 1
@@ -454,15 +468,17 @@ async def cache_set(
     if settings.SKIP_REDIS_INIT:
         return False
 
-    try:
-        client = await asyncio.wait_for(
-            get_redis_client(),
-            timeout=CACHE_OPERATION_TIMEOUT
-        )
-    except asyncio.TimeoutError:
-        logger.warning(f"Redis client acquisition timed out for cache_set({key})")
-        _cache_stats.errors += 1
-        return False
+    client = _ready_client()
+    if client is None:
+        try:
+            client = await asyncio.wait_for(
+                get_redis_client(),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Redis client acquisition timed out for cache_set({key})")
+            _cache_stats.errors += 1
+            return False
 
     if client is None:
         return False
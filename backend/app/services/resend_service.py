@@ -16,6 +16,7 @@ async def send_email(
     subject: str,
     html: str,
     from_email: str | None = None,
+    text: str | None = None,
 ) -> dict:
     if not settings.RESEND_API_KEY:
         raise ResendError("Resend is not configured. Set RESEND_API_KEY.")
@@ -26,6 +27,9 @@ async def send_email(
         "subject": subject,
         "html": html,
     }
+    # A real text/plain alternative (better deliverability than a hidden copy inside the HTML).
+    if text:
+        payload["text"] = text
     headers = {
         "Authorization": f"Bearer {settings.RESEND_API_KEY}",
         "Content-Type": "application/json",
@@ -96,14 +96,17 @@ def _str_list(value: Any) -> List[str]:
 
 def _format_evidence(value: Any) -> str:
     """Collapse supporting-evidence (str/list/dict) into one string. Mirrors the frontend."""
-    if isinstance(value, (list, tuple, set)):
-        return "; ".join(_clean(item) for item in value if _clean(item))
+    if isinstance(value, str):  # the usual shape: skip the container probes
+        return _strip_inline_markdown(value.strip())
     if isinstance(value, dict):
-        return "; ".join(_clean(item) for item in value.values() if _clean(item))
-    return _clean(value)
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set)):
+        return _clean(value)
+    # Clean each item once (the filter used to re-run _clean's four regex passes per item).
+    return "; ".join([cleaned for cleaned in map(_clean, value) if cleaned])
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """A format-agnostic piece of content within a section.
 
@@ -168,13 +171,23 @@ class Block:
         return out
 
 
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+# Section titles are a fixed set of constants (v1 literals + SECTION_META), and every builder
+# constructs its Section before knowing whether it has content, so each title is slugified once.
+_slug_cache: dict[str, str] = {}
+
+
 def _slugify(title: str) -> str:
     """Stable anchor slug from a section title (for the web TOC / deep links)."""
-    slug = re.sub(r"[^a-z0-9]+", "-", (title or "").lower()).strip("-")
-    return slug or "section"
+    slug = _slug_cache.get(title)
+    if slug is None:
+        slug = _SLUG_SEPARATORS.sub("-", (title or "").lower()).strip("-") or "section"
+        if len(_slug_cache) < 256:  # bound it should a caller ever pass free-form titles
+            _slug_cache[title] = slug
+    return slug
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     title: str
     blocks: List[Block] = field(default_factory=list)
@@ -346,6 +359,10 @@ def _risk_factors(sections: dict) -> Section:
     return section
 
 
+# Where a risk's supporting evidence may live, in precedence order (first non-empty wins).
+_RISK_EVIDENCE_KEYS = ("supporting_evidence", "supportingEvidence", "evidence", "source")
+
+
 def _normalize_risk(risk: Any) -> Optional[tuple]:
     """Mirror frontend ``normalizeRisk`` + the page's placeholder filter.
 
@@ -361,12 +378,7 @@ def _normalize_risk(risk: Any) -> Optional[tuple]:
     if not summary:
         return None
 
-    evidence = _format_evidence(
-        risk.get("supporting_evidence")
-        or risk.get("supportingEvidence")
-        or risk.get("evidence")
-        or risk.get("source")
-    )
+    evidence = _format_evidence(next((v for k in _RISK_EVIDENCE_KEYS if (v := risk.get(k))), None))
     if not evidence or is_placeholder(evidence):
         return None
     if description and is_placeholder(description):
@@ -826,7 +838,7 @@ def _markdown_table(headers: List[str], rows: List[List[str]]) -> str:
 
     def _line(cells: List[str]) -> str:
         padded = list(cells) + [""] * (cols - len(cells))
-        return "| " + " | ".join(_md_cell(c) for c in padded[:cols]) + " |"
+        return "| " + " | ".join([_md_cell(c) for c in padded[:cols]]) + " |"
 
     head = headers if headers else [""] * cols
     out = [_line(head), "| " + " | ".join(["---"] * cols) + " |"]
@@ -180,6 +180,10 @@ async def lifespan(app: FastAPI):
     await close_redis()
     logger.info("Redis connections closed")
 
+    # Close the pooled data.sec.gov client used by the XBRL companyfacts fallback
+    from app.services.edgar.client import close_sec_client
+    await close_sec_client()
+
     # Shutdown EdgarTools thread pool
     from app.services.edgar.async_executor import shutdown_executor
     shutdown_executor(wait=True)
@@ -10,10 +10,16 @@ so a 10-Q page could show annual figures. These tests pin the new behavior:
 - cache keys are versioned so stale wrong-period entries cannot be served.
 """
 
+import os
+import time
+
+import httpx
 import pandas as pd
 import pytest
 from unittest.mock import AsyncMock, patch
 
+from app.config import settings
+from app.services.edgar import client as sec_client_module
 from app.services.edgar import xbrl_service as xbrl_module
 from app.services.edgar.instance_extractor import (
     DURATION_CONCEPTS,
@@ -414,6 +420,166 @@ async def test_fetch_uses_latest_financials_as_last_resort():
     latest.assert_awaited_once_with("0000320193", "a")
 
 
+@pytest.mark.asyncio
+async def test_company_facts_fallback_reuses_pooled_client():
+    """Successive companyfacts fetches share one pooled client (no per-call handshake)."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"facts": {"us-gaap": {}}})
+
+    await sec_client_module.close_sec_client()
+    client = sec_client_module.get_sec_client()
+    assert sec_client_module.get_sec_client() is client
+    assert client.headers["User-Agent"] == sec_client_module.EDGAR_IDENTITY
+    client._transport = httpx.MockTransport(handler)
+
+    service = EdgarXBRLService()
+    try:
+        for _ in range(2):
+            assert await service._fallback_to_company_facts("0000320193", "a") is not None
+        assert len(seen) == 2
+        assert not client.is_closed
+    finally:
+        await sec_client_module.close_sec_client()
+    assert client.is_closed
+    assert sec_client_module._sec_client is None
+
+
+def _assets_facts(accn):
+    return {"facts": {"us-gaap": {"Assets": {"units": {"USD": [
+        {"end": "2025-12-31", "val": 10.0, "form": "10-K", "accn": accn, "filed": "2026-02-01"},
+    ]}}}}}
+
+
+@pytest.mark.asyncio
+async def test_company_facts_disk_cache_skips_refetch_until_target_missing(tmp_path):
+    """A cached payload serves repeat fallbacks; one lacking the target filing is re-fetched."""
+    payloads = [_assets_facts("0000320193-26-000001"), _assets_facts("0000320193-26-000002")]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=payloads[len(seen) - 1])
+
+    await sec_client_module.close_sec_client()
+    sec_client_module.get_sec_client()._transport = httpx.MockTransport(handler)
+    service = EdgarXBRLService()
+    try:
+        with patch.object(settings, "COMPANYFACTS_CACHE_DIR", str(tmp_path)):
+            first = await service._fallback_to_company_facts("0000320193", "0000320193-26-000001")
+            again = await service._fallback_to_company_facts("0000320193", "0000320193-26-000001")
+            assert len(seen) == 1
+            assert again == first
+            assert list(tmp_path.glob("CIK*.json.gz"))
+
+            # A newer filing isn't in the cached payload, so it goes back to SEC.
+            newer = await service._fallback_to_company_facts("0000320193", "0000320193-26-000002")
+            assert len(seen) == 2
+            assert newer["total_assets"][0]["accn"] == "0000320193-26-000002"
+    finally:
+        await sec_client_module.close_sec_client()
+
+
+@pytest.mark.asyncio
+async def test_company_facts_stale_disk_cache_revalidates_with_conditional_get(tmp_path):
+    """Past the TTL the cached payload is revalidated; a 304 reuses it and restarts the TTL."""
+    accn = "0000320193-26-000001"
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json=_assets_facts(accn),
+            headers={"ETag": '"v1"', "Last-Modified": "Sat, 31 Jan 2026 00:00:00 GMT"},
+        )
+
+    await sec_client_module.close_sec_client()
+    sec_client_module.get_sec_client()._transport = httpx.MockTransport(handler)
+    service = EdgarXBRLService()
+    try:
+        with patch.object(settings, "COMPANYFACTS_CACHE_DIR", str(tmp_path)):
+            first = await service._fallback_to_company_facts("0000320193", accn)
+            assert "If-None-Match" not in seen[0].headers
+
+            (cached_file,) = tmp_path.glob("CIK*.json.gz")
+            stale = time.time() - (settings.COMPANYFACTS_CACHE_TTL_HOURS + 1) * 3600
+            os.utime(cached_file, (stale, stale))
+
+            again = await service._fallback_to_company_facts("0000320193", accn)
+            assert len(seen) == 2
+            assert seen[1].headers["If-Modified-Since"] == "Sat, 31 Jan 2026 00:00:00 GMT"
+            assert again == first
+            assert cached_file.stat().st_mtime > stale + 3600
+    finally:
+        await sec_client_module.close_sec_client()
+
+
+def test_company_facts_disk_cache_concurrent_writes_for_one_cik(tmp_path, caplog):
+    """Two executor threads storing the same CIK never share a temp file or fail the write."""
+    import gzip
+    import threading
+
+    from app.services.edgar import companyfacts_cache
+
+    payloads = [b'{"facts": "a"}' * 50_000, b'{"facts": "b"}' * 50_000]
+    barrier = threading.Barrier(2)
+
+    def writer(raw):
+        barrier.wait()
+        for _ in range(25):
+            companyfacts_cache.write_companyfacts("320193", raw)
+
+    with patch.object(settings, "COMPANYFACTS_CACHE_DIR", str(tmp_path)), caplog.at_level("WARNING"):
+        threads = [threading.Thread(target=writer, args=(raw,)) for raw in payloads]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert "write failed" not in caplog.text
+    (entry,) = tmp_path.glob("CIK*.json.gz")
+    assert gzip.decompress(entry.read_bytes()) in payloads
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_company_facts_disk_cache_failed_write_removes_temp_file(tmp_path, caplog):
+    from app.services.edgar import companyfacts_cache
+
+    with patch.object(settings, "COMPANYFACTS_CACHE_DIR", str(tmp_path)), \
+            patch.object(companyfacts_cache.os, "replace", side_effect=OSError("disk full")), \
+            caplog.at_level("WARNING"):
+        companyfacts_cache.write_companyfacts("320193", b"{}")
+
+    assert "write failed" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_company_facts_disk_cache_eviction_skips_files_deleted_mid_sweep(tmp_path, caplog):
+    """A file another worker removed after the glob is skipped, not reported as a failed write."""
+    from pathlib import Path
+
+    from app.services.edgar import companyfacts_cache
+
+    real_glob = Path.glob
+
+    def glob_with_vanished_file(self, pattern):
+        return [*real_glob(self, pattern), self / "CIK0000000001.json.gz"]
+
+    with patch.object(settings, "COMPANYFACTS_CACHE_DIR", str(tmp_path)), \
+            patch.object(settings, "COMPANYFACTS_CACHE_MAX_FILES", 1), caplog.at_level("WARNING"):
+        companyfacts_cache.write_companyfacts("320193", b"{}")
+        os.utime(tmp_path / "CIK0000320193.json.gz", (time.time() - 3600, time.time() - 3600))
+        with patch.object(Path, "glob", glob_with_vanished_file):
+            companyfacts_cache.write_companyfacts("789019", b"{}")
+
+    assert "write failed" not in caplog.text
+    assert [p.name for p in tmp_path.iterdir()] == ["CIK0000789019.json.gz"]
+
+
 # ---------------------------------------------------------------------------
 # Cache key versioning
 # ---------------------------------------------------------------------------
@@ -481,3 +647,19 @@ def test_extended_golden_set_concepts_match_product_extraction():
     assert EXTENDED_METRIC_CONCEPTS["net_interest_income"][2] == "duration"
     # The product suppresses the conflated revenue total for banks — the generator must too.
     assert "revenue" in bank["suppress"]
+
+
+@pytest.mark.asyncio
+async def test_large_company_facts_payload_is_parsed_off_loop():
+    raw = httpx.Response(200, json=_assets_facts("0000320193-26-000001")).content
+    service = EdgarXBRLService()
+    inline = await service._decode_company_facts(raw, "0000320193-26-000001")
+
+    with patch.object(xbrl_module, "_COMPANY_FACTS_OFFLOAD_BYTES", 1), \
+         patch.object(xbrl_module, "run_in_executor_with_timeout",
+                      wraps=xbrl_module.run_in_executor_with_timeout) as offload:
+        offloaded = await service._decode_company_facts(raw, "0000320193-26-000001")
+
+    offload.assert_called_once()
+    assert offloaded == inline
+    assert inline["total_assets"][0]["value"] == 10.0
@@ -42,3 +42,12 @@ def test_daily_digest_lists_each_filing():
     for needle in ("ACME", "GBX", "10-Q", "8-K", "/filing/1", "/filing/2"):
         assert needle in html
     assert "@" not in html
+
+
+def test_wrap_html_places_body_before_footer():
+    from app.services.email_service import _wrap_html
+
+    out = _wrap_html("<p>BODY</p>", footer="FOOTER")
+    assert out.count("<p>BODY</p>") == 1
+    assert out.index("<p>BODY</p>") < out.index("FOOTER")
+    assert out.rstrip().endswith("</html>")
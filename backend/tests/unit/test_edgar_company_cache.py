@@ -7,7 +7,6 @@ These tests pin the cache/lock behavior (no network: EdgarCompany is faked).
 """
 import threading
 import time
-from datetime import timedelta
 
 import pytest
 
@@ -65,7 +64,7 @@ def test_resolver_rebuilds_after_ttl():
     company, ts = client_mod._company_cache["0000320193"]
     client_mod._company_cache["0000320193"] = (
         company,
-        ts - client_mod._COMPANY_CACHE_TTL - timedelta(seconds=1),
+        ts - client_mod._COMPANY_CACHE_TTL_SECONDS - 1,
     )
     client_mod.resolve_filing_by_accession("0000320193", "acc")
     assert _CountingCompany.construct_count == 2
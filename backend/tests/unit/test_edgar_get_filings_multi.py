@@ -272,7 +272,6 @@ async def test_negative_cache_skips_repeat_full_load_for_form_mismatched_company
 async def test_negative_cache_expires_after_ttl(monkeypatch):
     # After the TTL, a form-mismatched company is re-checked (a company that later starts filing the
     # form must not be negatively cached forever).
-    from datetime import timedelta
 
     _FakeEdgarCompany.recent_result = []
     _FakeEdgarCompany.full_result = []
@@ -284,7 +283,7 @@ async def test_negative_cache_expires_after_ttl(monkeypatch):
     assert len(client_mod._empty_fallback_cache) == 1
     key = next(iter(client_mod._empty_fallback_cache))
     client_mod._empty_fallback_cache[key] = (
-        client_mod._empty_fallback_cache[key] - client_mod._EMPTY_FALLBACK_TTL - timedelta(minutes=1)
+        client_mod._empty_fallback_cache[key] - client_mod._EMPTY_FALLBACK_TTL_SECONDS - 60
     )
 
     _FakeEdgarCompany.calls = []
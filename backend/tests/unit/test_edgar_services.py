@@ -7,6 +7,7 @@ and maintain backward compatibility with the legacy interfaces.
 
 import pytest
 from datetime import date
+from unittest.mock import patch
 
 # Test the models
 from app.services.edgar.models import (
@@ -214,6 +215,10 @@ class TestMetricChange:
         assert change.percentage is None
         assert change.direction == "increase"
 
+    def test_compute_dict_matches_compute_to_dict(self):
+        for current, prior in ((150.0, 100.0), (80.0, 100.0), (100.0, 0.0), (None, 1.0), (-5.0, 0.0)):
+            assert MetricChange.compute_dict(current, prior) == MetricChange.compute(current, prior).to_dict()
+
 
 class TestExceptions:
     """Test the exception hierarchy."""
@@ -371,6 +376,104 @@ class TestNullHandling:
         assert result == {}
 
 
+class TestStandardizedMetricsMemo:
+    """extract_standardized_metrics memoizes per input dict."""
+
+    def test_same_dict_is_standardized_once(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {"revenue": [{"period": "2024-12-31", "value": 100.0, "form": "10-K"}]}
+        with patch.object(
+            edgar_xbrl_service, "_build_standardized_metrics",
+            wraps=edgar_xbrl_service._build_standardized_metrics,
+        ) as build:
+            first = edgar_xbrl_service.extract_standardized_metrics(data)
+            second = edgar_xbrl_service.extract_standardized_metrics(data)
+
+        assert build.call_count == 1
+        assert second == first
+        assert second is not first
+        assert first["revenue"]["current"]["value"] == 100.0
+
+    def test_mutating_a_result_does_not_leak_into_later_calls(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {"revenue": [
+            {"period": "2023-12-31", "value": 80.0, "form": "10-K"},
+            {"period": "2024-12-31", "value": 100.0, "form": "10-K"},
+        ]}
+        first = edgar_xbrl_service.extract_standardized_metrics(data)
+        # current/prior stay the series' own points, as in a freshly built result.
+        assert first["revenue"]["current"] is first["revenue"]["series"][0]
+        assert first["revenue"]["prior"] is first["revenue"]["series"][1]
+
+        first["revenue"]["current"]["value"] = -1.0
+        first["revenue"]["change"]["absolute"] = 0.0
+        first["revenue"]["series"].clear()
+
+        again = edgar_xbrl_service.extract_standardized_metrics(data)
+        assert again["revenue"]["current"]["value"] == 100.0
+        assert again["revenue"]["change"]["absolute"] == 20.0
+        assert len(again["revenue"]["series"]) == 2
+
+    def test_in_place_value_correction_is_recomputed(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {"revenue": [{"period": "2024-12-31", "value": 100.0, "form": "10-K"}]}
+        assert edgar_xbrl_service.extract_standardized_metrics(data)["revenue"]["current"]["value"] == 100.0
+
+        data["revenue"][0]["value"] = 105.0
+        assert edgar_xbrl_service.extract_standardized_metrics(data)["revenue"]["current"]["value"] == 105.0
+
+    def test_grown_series_is_recomputed(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {"revenue": [{"period": "2023-12-31", "value": 80.0, "form": "10-K"}]}
+        assert edgar_xbrl_service.extract_standardized_metrics(data)["revenue"]["current"]["value"] == 80.0
+
+        data["revenue"].append({"period": "2024-12-31", "value": 100.0, "form": "10-K"})
+        result = edgar_xbrl_service.extract_standardized_metrics(data)
+        assert result["revenue"]["current"]["value"] == 100.0
+        assert result["revenue"]["prior"]["value"] == 80.0
+
+    def test_series_is_newest_first_and_keeps_first_duplicate(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {"revenue": [
+            {"period": "2023-12-31", "value": 80.0, "form": "10-K"},
+            {"period": "2024-12-31", "value": None, "form": "10-K"},
+            {"period": "2024-12-31", "value": 100.0, "form": "10-K"},
+            {"period": "2024-12-31", "value": 99.0, "form": "10-K/A"},
+            {"period": None, "value": 5.0},
+        ]}
+        series = edgar_xbrl_service.extract_standardized_metrics(data)["revenue"]["series"]
+
+        assert [(e["period"], e["value"]) for e in series] == [("2024-12-31", 100.0), ("2023-12-31", 80.0)]
+
+    def test_net_margin_joins_on_period_and_skips_gaps(self):
+        from app.services.edgar.xbrl_service import edgar_xbrl_service
+
+        data = {
+            "revenue": [
+                {"period": "2024-12-31", "value": 200.0, "form": "10-K"},
+                {"period": "2023-12-31", "value": 0.0, "form": "10-K"},
+                {"period": "2022-12-31", "value": 100.0, "form": "10-K"},
+                {"period": "2021-12-31", "value": 50.0, "form": "10-K"},
+            ],
+            "net_income": [
+                {"period": "2024-12-31", "value": 20.0, "form": "10-K"},
+                {"period": "2023-12-31", "value": 5.0, "form": "10-K"},
+                {"period": "2021-12-31", "value": 10.0, "form": "10-K"},
+            ],
+        }
+        series = edgar_xbrl_service.extract_standardized_metrics(data)["net_margin"]["series"]
+
+        assert [(e["period"], e["value"], e["form"]) for e in series] == [
+            ("2024-12-31", 10.0, "10-K"),
+            ("2021-12-31", 20.0, "10-K"),
+        ]
+
+
 class TestEdgarConfig:
     """Test configuration loading."""
 
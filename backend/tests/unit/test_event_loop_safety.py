@@ -223,6 +223,25 @@ class TestCacheOperationTimeouts:
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_cache_get_reuses_ready_client_with_single_get(self):
+        """An initialized client is used directly and a read is one bare GET (no EXISTS)."""
+        import app.services.redis_service as redis_module
+
+        mock_client = AsyncMock()
+        mock_client.get.return_value = '{"revenue": []}'
+        redis_module._client = mock_client
+        redis_module._init_lock_loop = asyncio.get_running_loop()
+
+        with patch.object(redis_module.settings, "SKIP_REDIS_INIT", False), \
+             patch('app.services.redis_service.get_redis_client', new_callable=AsyncMock) as mock_get_client:
+            result = await cache_get("test:key")
+
+        assert result == {"revenue": []}
+        mock_get_client.assert_not_called()
+        mock_client.get.assert_awaited_once_with("test:key")
+        mock_client.exists.assert_not_called()
+
 
 class TestRedisConnectionResetScenarios:
     """Tests for various connection reset scenarios."""
@@ -242,6 +242,38 @@ class TestCsv:
         assert "+23.8%" not in csv_out   # the model's own change text is never rendered
 
 
+class TestSectionsMemo:
+    """PDF + CSV of the same persisted summary share one render_sections pass."""
+
+    def test_same_row_renders_once_until_updated(self, service, monkeypatch):
+        import app.services.export_service as export_module
+
+        calls = []
+        real = export_module.render_sections
+
+        def counting(raw):
+            calls.append(raw)
+            return real(raw)
+
+        monkeypatch.setattr(export_module, "render_sections", counting)
+        summary, filing = _make_summary_and_filing(_full_sections())
+        summary.id, summary.created_at, summary.updated_at = 7, date(2026, 2, 7), None
+
+        pdf_html = service.generate_pdf_html(summary, filing)
+        csv_text = service.generate_csv(summary, filing)
+        assert len(calls) == 1
+        assert "Executive Assessment" in pdf_html and "Executive Assessment" in csv_text
+
+        summary.updated_at = date(2026, 2, 8)
+        service.generate_csv(summary, filing)
+        assert len(calls) == 2
+
+    def test_unsaved_summary_is_not_memoized(self, service):
+        summary, filing = _make_summary_and_filing(_full_sections())
+        service.generate_csv(summary, filing)
+        assert not service._sections_memo
+
+
 class TestRenderSections:
     def test_drops_empty_and_placeholder_sections(self):
         sections = {
@@ -276,8 +308,10 @@ class TestNewBlockKinds:
     a labelled note) — the same Section/Block projection the web renders."""
 
     def _csv_of(self, service, section):
+        rows = []
+        service._write_section_csv(rows, section)
         buf = io.StringIO()
-        service._write_section_csv(csv.writer(buf), section)
+        csv.writer(buf).writerows(rows)
         return buf.getvalue()
 
     def test_metrics_block_renders_as_a_table_in_pdf_and_csv(self, service):
@@ -481,3 +515,7 @@ class TestNarrativeToHtml:
     def test_unpaired_asterisks_stay_literal(self):
         html = ExportService._narrative_to_html("A lone * asterisk and 5*3 math survive.")
         assert "<em>" not in html and "<strong>" not in html
+
+    def test_repeat_narrative_is_rendered_once(self):
+        narrative = "## Memo\nRendered **once** per distinct narrative."
+        assert ExportService._narrative_to_html(narrative) is ExportService._narrative_to_html(narrative)
@@ -0,0 +1,155 @@
+"""fallback_summary: currency formatting, filing-text section extraction and the degraded summary shape."""
+import re
+from decimal import Decimal
+
+from app.services.fallback_summary import (
+    _RISK_SECTION_RES,
+    _extract_risk_factors,
+    _extract_section_text,
+    _split_sentences,
+    format_currency,
+    generate_xbrl_summary,
+    has_valid_xbrl_data,
+)
+
+
+def test_format_currency_scales():
+    assert format_currency(81_600_000_000) == "$81.6B"
+    assert format_currency(-2_500_000_000.0) == "$-2.5B"
+    assert format_currency(999_999_999) == "$1000.0M"
+    assert format_currency(12_345_678) == "$12.3M"
+    assert format_currency(950_000) == "$950,000"
+    assert format_currency(0) == "$0"
+    assert format_currency(Decimal("1500000")) == "$1.5M"
+
+
+def test_format_currency_rejects_non_numbers():
+    for value in (None, "12", True, [1]):
+        assert format_currency(value) == "Not disclosed"
+
+
+def test_business_overview_lists_xbrl_metrics():
+    xbrl = {
+        "revenue": {"current": {"value": 81_600_000_000, "period": "2025-06-30"}},
+        "net_income": {"current": {"value": 12_345_678, "period": "2025-06-30"}},
+    }
+    overview = generate_xbrl_summary(xbrl, "Acme", filing_type="10-k")["business_overview"]
+    assert overview == (
+        "## Acme 10-K Summary\n\n"
+        "### Financial Snapshot (XBRL)\n"
+        "- **Revenue**: $81.6B (Period: 2025-06-30)\n"
+        "- **Net Income**: $12.3M (Period: 2025-06-30)\n\n"
+        "_Click 'Regenerate Analysis' for the full AI-powered insights._"
+    )
+
+
+def test_business_overview_without_xbrl():
+    overview = generate_xbrl_summary(None, "Acme")["business_overview"]
+    assert overview == (
+        "## Acme 10-Q Summary\n\n"
+        "Financial metrics are being processed.\n\n"
+        "_Click 'Regenerate Analysis' for the full AI-powered insights._"
+    )
+
+
+def test_highlights_table_reads_current_and_prior_once_extracted():
+    xbrl = {
+        "revenue": {
+            "current": {"value": 2_000_000_000, "period": "2025-06-30"},
+            "prior": {"value": 1_500_000_000},
+        },
+        "net_income": None,
+        "earnings_per_share": {"current": {"value": 1.25}, "prior": None},
+    }
+    table = generate_xbrl_summary(xbrl, "Acme")["raw_summary"]["sections"]["results_that_matter"]["table"]
+    assert [(r["metric"], r["current_period"], r["prior_period"]) for r in table] == [
+        ("Revenue", "$2.0B", "$1.5B"),
+        ("Net Income", "Not disclosed", "—"),
+        ("EPS (Basic)", "$1.25", "—"),
+    ]
+
+
+def test_mda_extraction_uses_the_form_specific_patterns():
+    body = "Revenue rose on data-center demand. " * 5
+    ten_k = f"Item 7. Management's Discussion {body} Item 8. Financial Statements"
+    assert generate_xbrl_summary(None, "Acme", filing_text=ten_k, filing_type="10-K")[
+        "raw_summary"]["sections"]["earnings_quality"]["operating_vs_one_time"].endswith(body.strip())
+    # An unrecognised form falls back to the 10-Q locators, which don't match Item 7.
+    assert generate_xbrl_summary(None, "Acme", filing_text=ten_k, filing_type="S-1")[
+        "raw_summary"]["sections"]["earnings_quality"] == {}
+
+
+def test_section_extraction_stops_at_terminator_or_window():
+    text = "Intro. Item 1A. Risk Factors  Supply   is\nconcentrated. Item 1B. Unresolved"
+    assert _extract_section_text(text, _RISK_SECTION_RES) == "Supply is concentrated."
+
+    # No terminator: only a bounded window past the header is read, and the cut is marked.
+    long_text = "RISK FACTORS " + "word " * 10_000
+    extracted = _extract_section_text(long_text, _RISK_SECTION_RES, max_chars=100)
+    assert extracted == "word " * 20 + "..."
+
+
+def test_risk_items_from_bullets_and_a_leading_numbered_item():
+    risk = "Customer concentration could materially reduce revenue if a key buyer leaves us"
+    bullets = "Item 1A. Risk Factors\n" + "".join(f"• {risk} ({i}).\n" for i in range(7))
+    assert [r["summary"] for r in _extract_risk_factors(bullets)] == [f"{risk} ({i})." for i in range(5)]
+
+    numbered = f"Item 1A. Risk Factors\n1. {risk}.\n2. {risk} again.\nItem 2. Properties"
+    assert [r["summary"] for r in _extract_risk_factors(numbered)] == [f"1. {risk}. 2. {risk} again."]
+
+
+def test_section_search_starts_at_the_header_anchor():
+    body = "Demand for accelerators outpaced supply during the quarter."
+    text = "Cover page. " * 1000 + f"RISK FACTORS {body} PART II"
+    assert _extract_section_text(text, _RISK_SECTION_RES) == body
+    # Lowering "İ" adds a character, so offsets fall back to a scan from the start.
+    assert _extract_section_text("İ" * 50 + text, _RISK_SECTION_RES) == body
+
+
+def test_locators_missing_a_header_word_are_skipped():
+    # "Factors That May Affect" needs every word; "factors" alone must not reach the regex.
+    assert _extract_section_text("Several factors drove margins. " * 20, _RISK_SECTION_RES) is None
+    assert _RISK_SECTION_RES[0][0] == ("item", "risk", "factors")
+
+
+def test_text_extraction_is_memoized_and_returns_fresh_risk_dicts(monkeypatch):
+    from app.services import fallback_summary
+
+    calls = []
+    real = fallback_summary._extract_risk_factors
+
+    def counting(text, filing_type="10-Q"):
+        calls.append(filing_type)
+        return real(text, filing_type)
+
+    monkeypatch.setattr(fallback_summary, "_extract_risk_factors", counting)
+    monkeypatch.setattr(fallback_summary, "_text_sections_memo", fallback_summary.OrderedDict())
+    risk = "Customer concentration could materially reduce revenue if a key buyer leaves us"
+    text = "Item 1A. Risk Factors\n" + f"• {risk}.\n" * 3
+
+    first = generate_xbrl_summary(None, "Acme", filing_text=text)["risk_factors"]
+    first[0]["summary"] = "mutated by the pipeline"
+    second = generate_xbrl_summary(None, "Acme", filing_text=text)["risk_factors"]
+    assert calls == ["10-Q"]
+    assert second[0]["summary"] == f"{risk}."
+
+
+def test_raw_list_shaped_xbrl_counts_as_data_without_crashing():
+    xbrl = {"revenue": [{"value": 5_000_000, "period": "2025-06-30"}]}
+    result = generate_xbrl_summary(xbrl, "Acme")
+    table = result["raw_summary"]["sections"]["results_that_matter"]["table"]
+    assert [row["commentary"] for row in table] == ["Full comparison available in detailed analysis."] * 2
+    assert "Financial metrics are being processed." in result["business_overview"]
+
+
+def test_split_sentences_matches_regex_split():
+    for text in ("", "abc", "a.", ".a", "...", "a..b", "Rates rose! Why? Costs... fell.", ". Lead. Tail?!"):
+        assert _split_sentences(text) == re.split(r"[.!?]+", text)
+
+
+def test_has_valid_xbrl_data_shapes():
+    assert has_valid_xbrl_data({"net_income": {"current": {"value": 0}}})  # zero is data
+    assert has_valid_xbrl_data({"revenue": [{"value": None}, {"value": 12}]})
+    for data in (None, {}, [], {"revenue": {"current": None}}, {"revenue": {"current": {"value": None}}},
+                 {"revenue": ["12"]}, {"other": {"current": {"value": 1}}}):
+        assert not has_valid_xbrl_data(data)
@@ -0,0 +1,48 @@
+"""GET /api/hot_filings — orjson-encoded payload shape, pulse enrichment, cache entry untouched."""
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class _StubService:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def get_hot_filings(self, db, limit=10, force_refresh=False):
+        return self.payload
+
+
+def test_returns_encoded_payload_with_pulse_and_leaves_cache_entry_alone(client, monkeypatch):
+    import app.routers.hot_filings as router_module
+
+    filing = {
+        "filing_id": 7,
+        "symbol": "AAPL",
+        "company_name": "Apple Inc.",
+        "filing_type": "10-K",
+        "filing_date": "2026-06-18T12:00:00+00:00",
+        "buzz_score": 5.5,
+        "sources": ["recency", "search_activity"],
+        "buzz_components": {"recency": 4.5, "search_activity": 1.0},
+    }
+    cached = {"filings": [filing], "last_updated": "2026-06-18T12:05:00Z"}
+    monkeypatch.setattr(router_module, "hot_filings_service", _StubService(cached))
+
+    response = client.get("/api/hot_filings?limit=5")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["last_updated"] == "2026-06-18T12:05:00Z"
+    assert body["filings"][0]["buzz_score"] == 5.5
+    assert body["filings"][0]["sources"] == ["recency", "search_activity"]
+    assert "pulse" in body["filings"][0]
+    # The cached service entry is shared across requests and must not gain the pulse key.
+    assert "pulse" not in filing
@@ -12,19 +12,24 @@ from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from app.services.hot_filings import HotFilingsService, _to_aware_utc
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Company, Filing, UserSearch
+from app.services.hot_filings import HotFilingRecord, HotFilingsService, _to_aware_utc
 
 
 def _make_filing(filing_date):
-    company = SimpleNamespace(ticker="AAPL", name="Apple Inc.")
-    # company_id=None keeps the secondary search/velocity queries (and the FMP/
-    # Finnhub network calls) skipped, so the real scoring loop runs unmocked.
+    # Mirrors the column row the candidate query returns. company_id=None keeps the
+    # secondary search/velocity queries (and the FMP/Finnhub network calls) skipped,
+    # so the real scoring loop runs unmocked.
     return SimpleNamespace(
         id=1,
         company_id=None,
-        company=company,
         filing_type="10-K",
         filing_date=filing_date,
+        ticker="AAPL",
+        name="Apple Inc.",
     )
 
 
@@ -32,7 +37,7 @@ def _stub_db(filings):
     db = MagicMock()
     (
         db.query.return_value
-        .options.return_value
+        .join.return_value
         .order_by.return_value
         .limit.return_value
         .all.return_value
@@ -65,3 +70,102 @@ def test_calculate_hot_filings_with_tz_aware_filing_date_does_not_crash():
     assert len(records) == 1
     # Recent (12h old) filing must earn a positive recency-driven buzz score.
     assert records[0].buzz_score > 0
+
+
+def test_calculate_hot_filings_on_sqlite_splits_search_and_velocity_counts():
+    # Real SQLite returns naive filing dates, and the search/velocity counts come
+    # back from one UNION ALL that the loop splits by its kind tag.
+    eng = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=eng)
+    db = sessionmaker(bind=eng)()
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        Company(id=1, ticker="AAA", name="Alpha", cik="0000000001"),
+        Company(id=2, ticker="BBB", name="Beta", cik="0000000002"),
+    ])
+    for i in range(3):
+        db.add(Filing(company_id=1, accession_number=f"a-{i}", filing_type="10-Q",
+                      filing_date=now - timedelta(days=i + 1), document_url="https://example.com/a"))
+    db.add(Filing(company_id=2, accession_number="b-0", filing_type="10-K",
+                  filing_date=now - timedelta(days=1), document_url="https://example.com/b"))
+    db.add_all([UserSearch(company_id=2, query="beta", created_at=now) for _ in range(2)])
+    db.commit()
+
+    svc = HotFilingsService()
+    svc._fmp_client = None
+    svc._news_client = None
+    records = asyncio.run(svc._calculate_hot_filings(db, limit=10))
+
+    by_ticker = {}
+    for record in records:
+        by_ticker.setdefault(record.symbol, record)
+    assert by_ticker["BBB"].buzz_components["search_activity"] > 0
+    assert by_ticker["AAA"].buzz_components["search_activity"] == 0
+    assert by_ticker["AAA"].buzz_components["filing_velocity"] > by_ticker["BBB"].buzz_components["filing_velocity"]
+    assert by_ticker["BBB"].sources == ["recency", "search_activity", "filing_velocity"]
+    assert by_ticker["AAA"].sources == ["recency", "filing_velocity"]
+    assert by_ticker["AAA"].company_name == "Alpha"
+
+
+def test_calculate_hot_filings_loads_fmp_and_finnhub_concurrently():
+    # The FMP fetch can only finish once the Finnhub fetch has started, so a sequential
+    # await of the two loaders would time out (swallowed by the loader) and never complete.
+    finnhub_started = asyncio.Event()
+    fmp_completed = []
+
+    class _Fmp:
+        async def fetch_earnings_calendar(self):
+            await asyncio.wait_for(finnhub_started.wait(), timeout=1)
+            fmp_completed.append(True)
+            return {}
+
+    class _Finnhub:
+        async def fetch_news_sentiment(self, tickers):
+            finnhub_started.set()
+            return {}
+
+    svc = HotFilingsService()
+    svc._fmp_client = _Fmp()
+    svc._news_client = _Finnhub()
+    filing = _make_filing(datetime.now(timezone.utc) - timedelta(hours=1))
+    filing.company_id = 1
+    db = _stub_db([filing])
+
+    records = asyncio.run(svc._calculate_hot_filings(db, limit=10))
+
+    assert fmp_completed == [True]
+    assert len(records) == 1
+
+
+def test_get_hot_filings_serves_every_limit_from_one_ranking():
+    svc = HotFilingsService()
+    calls = []
+
+    async def _calculate(db, limit):
+        calls.append(limit)
+        return [
+            HotFilingRecord(
+                filing_id=i,
+                symbol=f"T{i}",
+                company_name=f"Company {i}",
+                filing_type="10-K",
+                filing_date=datetime(2026, 6, 18, tzinfo=timezone.utc),
+                buzz_score=float(limit - i),
+                sources=["recency"],
+                buzz_components={"recency": 1.0},
+            )
+            for i in range(limit)
+        ]
+
+    svc._calculate_hot_filings = _calculate
+
+    top_five = asyncio.run(svc.get_hot_filings(MagicMock(), limit=5))
+    top_twenty = asyncio.run(svc.get_hot_filings(MagicMock(), limit=20))
+
+    assert calls == [20]
+    assert len(top_five["filings"]) == 5
+    assert top_twenty["filings"][:5] == top_five["filings"]
+    assert top_five["last_updated"] == top_twenty["last_updated"]
+
+    asyncio.run(svc.get_hot_filings(MagicMock(), limit=10, force_refresh=True))
+    assert calls == [20, 20]
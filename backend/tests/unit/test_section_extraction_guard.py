@@ -162,3 +162,15 @@ def test_mda_backfill_skips_window_overlapping_financials():
     out = openai_service.assemble_excerpt_from_sections(sections, "10-K", filing_text=raw)
     assert "FINANCIAL STATEMENTS CONTEXT (recovered from filing)" in out
     assert "MD&A CONTEXT (recovered from filing)" not in out  # deduped — overlaps the financials window
+
+
+def test_parse_and_clean_text_skips_html_parse_when_excerpt_given(monkeypatch):
+    import bs4
+
+    parses = []
+    real = bs4.BeautifulSoup
+    monkeypatch.setattr(bs4, "BeautifulSoup", lambda *a, **kw: parses.append(a) or real(*a, **kw))
+    excerpt = "ITEM 7 - MANAGEMENT'S DISCUSSION AND ANALYSIS:\nRevenue rose."
+    result = openai_service._parse_and_clean_text("<html><body>raw</body></html>", "10-K", excerpt)
+    assert result["filing_sample"] == excerpt
+    assert parses == []
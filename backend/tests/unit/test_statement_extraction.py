@@ -11,9 +11,11 @@ Covers the PR #239 review findings:
 
 import pandas as pd
 import pytest
+from unittest.mock import patch
 
 from app.services.edgar.statement_parser import (
     extract_metric_values,
+    index_statement,
     normalize_concept,
     statement_dataframe,
 )
@@ -95,6 +97,59 @@ def test_duplicate_column_labels_do_not_drop_values():
     assert values == [("2025-12-31", 5.0)]
 
 
+def test_non_numeric_cells_fall_through_to_next_row():
+    # Per column, the first row with a NUMERIC value wins; None / non-numeric cells are skipped
+    # and a column with no numeric value at all yields no period.
+    df = pd.DataFrame({
+        "concept": ["us-gaap_NetIncomeLoss", "us-gaap_NetIncomeLoss"],
+        "2025-12-31": [None, "n/a"],
+        "2024-12-31": ["5", 3.0],
+        "2023-12-31": [float("nan"), 2.0],
+        "abstract": [False, False],
+        "dimension": [False, False],
+    })
+    _, values = extract_metric_values(df, ["NetIncomeLoss"])
+    assert values == [("2024-12-31", 5.0), ("2023-12-31", 2.0)]
+
+
+def test_float_columns_fall_through_nan_to_next_row():
+    # All-float period columns take the no-coercion fast path; NaN still falls through per column.
+    df = pd.DataFrame({
+        "concept": ["us-gaap_NetIncomeLoss", "us-gaap_NetIncomeLoss"],
+        "2025-12-31": [float("nan"), 7.0],
+        "2024-12-31": [5.0, 3.0],
+        "abstract": [False, False],
+        "dimension": [False, False],
+    })
+    _, values = extract_metric_values(df, ["NetIncomeLoss"])
+    assert values == [("2025-12-31", 7.0), ("2024-12-31", 5.0)]
+
+
+def test_limit_keeps_most_recent_periods_in_order():
+    df = pd.DataFrame({
+        "concept": ["us-gaap_NetIncomeLoss"],
+        **{f"{year}-12-31": [float(year)] for year in (2021, 2024, 2022, 2025, 2023)},
+        "abstract": [False],
+        "dimension": [False],
+    })
+    _, values = extract_metric_values(df, ["NetIncomeLoss"], limit=3)
+    assert values == [("2025-12-31", 2025.0), ("2024-12-31", 2024.0), ("2023-12-31", 2023.0)]
+
+
+def test_indexed_statement_matches_dataframe_lookups():
+    # One index_statement() is shared across metrics; every lookup must equal the DataFrame path.
+    df = _modern_df()
+    stmt = index_statement(df)
+    for candidates in (
+        ["RevenueFromContractWithCustomerExcludingAssessedTax"],
+        ["Revenues", "NetIncomeLoss"],
+        ["EarningsPerShareAbstract"],
+        ["Missing"],
+    ):
+        assert extract_metric_values(stmt, candidates) == extract_metric_values(df, candidates)
+    assert index_statement(pd.DataFrame()) is None
+
+
 def test_legacy_schema_concepts_as_index():
     df = pd.DataFrame(
         {"2024-09-28": [391_035_000_000.0], "2023-09-30": [383_285_000_000.0]},
@@ -137,6 +192,55 @@ def test_statement_dataframe_handles_method_and_property():
     assert statement_dataframe(MissingStyle(), "income_statement") is None
 
 
+@pytest.mark.asyncio
+async def test_latest_financials_statement_failure_does_not_drop_others():
+    # All statements are read in one executor hop (the EdgarTools object they share isn't
+    # thread-safe); one raising must not lose the others' metrics.
+    class Statement:
+        def to_dataframe(self):
+            return pd.DataFrame({
+                "concept": ["us-gaap_Assets"],
+                "2025-12-31": [500.0],
+                "abstract": [False],
+                "dimension": [False],
+            })
+
+    class Financials:
+        def income_statement(self):
+            raise RuntimeError("no income statement")
+
+        def balance_sheet(self):
+            return Statement()
+
+        def cash_flow_statement(self):
+            return None
+
+    class Company:
+        def __init__(self, cik):
+            pass
+
+        def get_financials(self):
+            return Financials()
+
+    from app.services.edgar import xbrl_service
+
+    hops = []
+    real_run = xbrl_service.run_in_executor_with_timeout
+
+    async def counting_run(fn, timeout):
+        hops.append(fn)
+        return await real_run(fn, timeout=timeout)
+
+    with patch("app.services.edgar.xbrl_service.EdgarCompany", Company), \
+            patch("app.services.edgar.xbrl_service.run_in_executor_with_timeout", counting_run):
+        result = await EdgarXBRLService()._fetch_from_latest_financials("0000320193", "a")
+
+    # One hop builds the financials, one reads every statement.
+    assert len(hops) == 2
+    assert result["total_assets"] == [{"period": "2025-12-31", "value": 500.0, "form": None, "accn": "a"}]
+    assert result["revenue"] == []
+
+
 # ---------------------------------------------------------------------------
 # company-facts fallback (_parse_company_facts)
 # ---------------------------------------------------------------------------
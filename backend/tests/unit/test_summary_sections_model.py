@@ -145,6 +145,19 @@ def test_risks_section_carries_an_explicit_role():
     assert risks.to_dict()["role"] == "risks"
 
 
+def test_risk_evidence_list_and_dict_collapse_to_cleaned_items():
+    raw = _raw({
+        "risk_factors": [
+            {"title": "Supply", "description": "Foundry reliance.",
+             "supporting_evidence": ["  **Item 1A**  ", "", None, "TSMC"]},
+            {"title": "Rates", "description": "Floating-rate debt.",
+             "supportingEvidence": {"a": "Note 7", "b": "  "}},
+        ],
+    })
+    risks = next(s for s in render_sections(raw) if s.title == "Investment Risks & Concerns")
+    assert [row[2] for row in risks.blocks[0].rows] == ["Item 1A; TSMC", "Note 7"]
+
+
 def test_inline_markdown_is_stripped_at_the_projection():
     # The model is primed to emit markdown inside JSON string fields; the structured page renders raw
     # text, so inline markup is normalized ONCE here so every surface agrees.
@@ -2,12 +2,12 @@
 Two-Tier Caching Tests
 
 Tests for the L1 (in-memory) + L2 (Redis) caching implementation.
-Covers stress testing, concurrent access, and LRU eviction.
+Covers stress testing, concurrent access, and least-hit eviction with ageing.
 """
 
 import asyncio
 import pytest
-from datetime import datetime, timedelta
+import time
 from unittest.mock import AsyncMock, patch
 
 # Import cache components
@@ -27,8 +27,11 @@ class TestLRUCacheEviction:
     """Tests for LRU eviction behavior in L1 cache."""
 
     def setup_method(self):
-        """Clear cache before each test."""
+        """Clear cache before each test and restart the ageing clock so no sweep decays mid-test."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
         clear_xbrl_cache()
+        xbrl_module._last_decay = time.monotonic()
 
     def teardown_method(self):
         """Clear cache after each test."""
@@ -36,20 +39,19 @@ class TestLRUCacheEviction:
 
     def test_cache_set_sync_adds_entry(self):
         """_cache_set_sync should add entries to the cache."""
-        _cache_set_sync("test:key1", (datetime.now(), {"data": "value1"}))
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": "value1"}))
 
         assert "test:key1" in _xbrl_cache
         assert _xbrl_cache["test:key1"][1] == {"data": "value1"}
 
     def test_cache_set_sync_updates_existing_entry(self):
-        """_cache_set_sync should update existing entries and move to end."""
-        _cache_set_sync("test:key1", (datetime.now(), {"data": "old"}))
-        _cache_set_sync("test:key2", (datetime.now(), {"data": "newer"}))
-        _cache_set_sync("test:key1", (datetime.now(), {"data": "updated"}))
+        """_cache_set_sync should update existing entries in place (no reorder)."""
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": "old"}))
+        _cache_set_sync("test:key2", (time.monotonic(), {"data": "newer"}))
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": "updated"}))
 
-        # key1 should be at the end (most recently used)
         keys = list(_xbrl_cache.keys())
-        assert keys[-1] == "test:key1"
+        assert keys == ["test:key1", "test:key2"]
         assert _xbrl_cache["test:key1"][1] == {"data": "updated"}
 
     def test_lru_eviction_when_over_max_size(self):
@@ -64,7 +66,7 @@ class TestLRUCacheEviction:
         try:
             # Add 7 entries (should evict 2 oldest)
             for i in range(7):
-                _cache_set_sync(f"test:key{i}", (datetime.now(), {"index": i}))
+                _cache_set_sync(f"test:key{i}", (time.monotonic(), {"index": i}))
 
             # Should have only 5 entries
             assert len(_xbrl_cache) == 5
@@ -79,17 +81,142 @@ class TestLRUCacheEviction:
         finally:
             xbrl_module._cache_max_size = original_max
 
-    def test_access_updates_lru_order(self):
-        """Accessing an entry should move it to end of LRU queue."""
-        _cache_set_sync("test:key1", (datetime.now(), {"data": 1}))
-        _cache_set_sync("test:key2", (datetime.now(), {"data": 2}))
-        _cache_set_sync("test:key3", (datetime.now(), {"data": 3}))
+    @pytest.mark.asyncio
+    async def test_hit_protects_entry_from_eviction(self):
+        """A hit bumps the entry's counter, so the least-hit entry is evicted instead."""
+        import app.services.edgar.xbrl_service as xbrl_module
+        original_max = xbrl_module._cache_max_size
+        xbrl_module._cache_max_size = 3
+        version = xbrl_module._XBRL_CACHE_VERSION
 
-        # Access key1 (oldest) - should move it to end
-        _cache_set_sync("test:key1", (datetime.now(), {"data": 1}))
+        try:
+            for i in range(1, 4):
+                _cache_set_sync(f"{version}:cik:acc{i}", (time.monotonic(), {"data": i}))
 
-        keys = list(_xbrl_cache.keys())
-        assert keys == ["test:key2", "test:key3", "test:key1"]
+            # Hit acc1 (oldest) through the real L1 path
+            assert await EdgarXBRLService().get_xbrl_data("acc1", "cik") == {"data": 1}
+
+            _cache_set_sync(f"{version}:cik:acc4", (time.monotonic(), {"data": 4}))
+
+            assert f"{version}:cik:acc1" in _xbrl_cache
+            assert f"{version}:cik:acc2" not in _xbrl_cache
+            assert f"{version}:cik:acc4" in _xbrl_cache
+        finally:
+            xbrl_module._cache_max_size = original_max
+
+    def test_hit_counters_age_when_saturated(self):
+        """Counters are halved once one saturates so stale-but-popular entries can age out."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": 1}))
+        _cache_set_sync("test:key2", (time.monotonic(), {"data": 2}))
+        _xbrl_cache["test:key1"][2] = xbrl_module._HIT_COUNT_CEILING - 1
+        _xbrl_cache["test:key2"][2] = 10
+
+        xbrl_module._record_cache_hit(_xbrl_cache["test:key1"])
+
+        assert _xbrl_cache["test:key1"][2] == xbrl_module._HIT_COUNT_CEILING >> 1
+        assert _xbrl_cache["test:key2"][2] == 5
+
+    def test_sweep_ages_counters_so_early_hot_entry_loses_to_newer_traffic(self):
+        """After an ageing sweep, an entry hot only in the past is evicted ahead of current traffic."""
+        import app.services.edgar.xbrl_service as xbrl_module
+        original_max = xbrl_module._cache_max_size
+        xbrl_module._cache_max_size = 2
+
+        try:
+            _cache_set_sync("test:early", (time.monotonic(), {"data": "early"}))
+            for _ in range(8):
+                xbrl_module._record_cache_hit(_xbrl_cache["test:early"])
+
+            # One ageing interval passes: the sweep halves the early entry's 8 hits to 4.
+            with patch.object(xbrl_module, "_last_decay", time.monotonic() - xbrl_module._SWEEP_INTERVAL_SECONDS):
+                xbrl_module._sweep_expired_sync(time.monotonic())
+            assert _xbrl_cache["test:early"][2] == 4
+
+            _cache_set_sync("test:recent", (time.monotonic(), {"data": "recent"}))
+            for _ in range(5):
+                xbrl_module._record_cache_hit(_xbrl_cache["test:recent"])
+
+            _cache_set_sync("test:new", (time.monotonic(), {"data": "new"}))
+
+            # Without ageing the early entry (8) would outrank recent (5) and recent would go.
+            assert "test:early" not in _xbrl_cache
+            assert {"test:recent", "test:new"} <= set(_xbrl_cache)
+        finally:
+            xbrl_module._cache_max_size = original_max
+
+    def test_sweep_ages_counters_at_most_once_per_interval(self):
+        """Full-cache inserts sweep on every call, but counters only halve once per interval."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": 1}))
+        _xbrl_cache["test:key1"][2] = 8
+
+        for _ in range(3):
+            xbrl_module._sweep_expired_sync(time.monotonic())
+        assert _xbrl_cache["test:key1"][2] == 8
+
+        xbrl_module._last_decay = time.monotonic() - xbrl_module._SWEEP_INTERVAL_SECONDS
+        for _ in range(3):
+            xbrl_module._sweep_expired_sync(time.monotonic())
+        assert _xbrl_cache["test:key1"][2] == 4
+
+    def test_full_cache_sweeps_expired_before_evicting_live(self):
+        """When full, expired entries go first; live least-hit entries survive."""
+        import app.services.edgar.xbrl_service as xbrl_module
+        original_max = xbrl_module._cache_max_size
+        xbrl_module._cache_max_size = 3
+
+        try:
+            _cache_set_sync("test:live1", (time.monotonic(), {"data": 1}))
+            _cache_set_sync("test:stale", (time.monotonic() - 25 * 3600, {"data": "old"}))
+            _cache_set_sync("test:live2", (time.monotonic(), {"data": 2}))
+            _xbrl_cache["test:stale"][2] = 50  # popular, but expired
+
+            _cache_set_sync("test:new", (time.monotonic(), {"data": 3}))
+
+            assert "test:stale" not in _xbrl_cache
+            assert {"test:live1", "test:live2", "test:new"} <= set(_xbrl_cache)
+        finally:
+            xbrl_module._cache_max_size = original_max
+
+    def test_periodic_sweep_drops_cold_expired_entries(self):
+        """An insert after the sweep interval drops expired entries nobody reads again."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
+        _cache_set_sync("test:live", (time.monotonic(), {"data": 1}))
+        _cache_set_sync("test:stale", (time.monotonic() - 25 * 3600, {"data": "old"}))
+        expirations = get_xbrl_cache_stats()["l1_expirations"]
+
+        with patch.object(xbrl_module, "_last_sweep", time.monotonic() - xbrl_module._SWEEP_INTERVAL_SECONDS):
+            _cache_set_sync("test:new", (time.monotonic(), {"data": 2}))
+
+        assert "test:stale" not in _xbrl_cache
+        assert {"test:live", "test:new"} <= set(_xbrl_cache)
+        assert get_xbrl_cache_stats()["l1_expirations"] == expirations + 1
+
+    @pytest.mark.asyncio
+    async def test_l2_payload_strings_are_shared_in_l1(self):
+        """Repeated period/form/accn strings decoded from Redis collapse to one object each."""
+        import json
+
+        payload = json.loads(json.dumps({
+            "revenue": [{"period": "2024-12-31", "value": 1.0, "form": "10-K", "accn": "0001-24-1"}],
+            "net_income": [{"period": "2024-12-31", "value": 2.0, "form": "10-K", "accn": "0001-24-1"}],
+            "reporting_currency": "USD",
+        }))
+        assert payload["revenue"][0]["period"] is not payload["net_income"][0]["period"]
+
+        service = EdgarXBRLService()
+        with patch.object(service, "_get_from_redis", AsyncMock(return_value=payload)):
+            data = await service.get_xbrl_data("0001-24-1", "1")
+
+        rev, ni = data["revenue"][0], data["net_income"][0]
+        assert rev["period"] is ni["period"]
+        assert rev["form"] is ni["form"]
+        assert rev["accn"] is ni["accn"]
+        assert rev == {"period": "2024-12-31", "value": 1.0, "form": "10-K", "accn": "0001-24-1"}
 
 
 class TestCacheStats:
@@ -120,8 +247,8 @@ class TestCacheStats:
 
     def test_cache_stats_counts_entries(self):
         """Cache stats should accurately count entries."""
-        _cache_set_sync("test:key1", (datetime.now(), {"data": 1}))
-        _cache_set_sync("test:key2", (datetime.now(), {"data": 2}))
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": 1}))
+        _cache_set_sync("test:key2", (time.monotonic(), {"data": 2}))
 
         stats = get_xbrl_cache_stats()
 
@@ -131,10 +258,10 @@ class TestCacheStats:
     def test_cache_stats_identifies_expired_entries(self):
         """Cache stats should correctly identify expired entries."""
         # Add a fresh entry
-        _cache_set_sync("test:fresh", (datetime.now(), {"data": "fresh"}))
+        _cache_set_sync("test:fresh", (time.monotonic(), {"data": "fresh"}))
 
         # Add an expired entry (25 hours ago)
-        expired_time = datetime.now() - timedelta(hours=25)
+        expired_time = time.monotonic() - 25 * 3600
         _cache_set_sync("test:expired", (expired_time, {"data": "expired"}))
 
         stats = get_xbrl_cache_stats()
@@ -151,7 +278,7 @@ class TestCacheStats:
 
         try:
             for i in range(25):
-                _cache_set_sync(f"test:key{i}", (datetime.now(), {"data": i}))
+                _cache_set_sync(f"test:key{i}", (time.monotonic(), {"data": i}))
 
             stats = get_xbrl_cache_stats()
             assert stats["l1_utilization_percent"] == 25.0
@@ -184,7 +311,7 @@ class TestAsyncCacheLock:
     @pytest.mark.asyncio
     async def test_async_clear_acquires_lock(self):
         """async_clear_xbrl_cache should acquire the cache lock."""
-        _cache_set_sync("test:key1", (datetime.now(), {"data": 1}))
+        _cache_set_sync("test:key1", (time.monotonic(), {"data": 1}))
 
         # Clear should work and acquire the lock
         count = await async_clear_xbrl_cache()
@@ -235,7 +362,7 @@ class TestConcurrentAccess:
     async def test_concurrent_reads_same_key(self):
         """Multiple concurrent reads of the same key should be safe."""
         # Pre-populate cache
-        _cache_set_sync("test:shared", (datetime.now(), {"data": "shared_value"}))
+        _cache_set_sync("test:shared", (time.monotonic(), {"data": "shared_value"}))
 
         lock = _get_cache_lock()
         results = []
@@ -261,7 +388,7 @@ class TestConcurrentAccess:
 
         async def write_cache(key: str, value: dict):
             async with lock:
-                _cache_set_sync(key, (datetime.now(), value))
+                _cache_set_sync(key, (time.monotonic(), value))
 
         # Run 20 concurrent writes to different keys
         tasks = [write_cache(f"test:key{i}", {"index": i}) for i in range(20)]
@@ -279,7 +406,7 @@ class TestConcurrentAccess:
 
         # Pre-populate some entries
         for i in range(5):
-            _cache_set_sync(f"test:existing{i}", (datetime.now(), {"index": i}))
+            _cache_set_sync(f"test:existing{i}", (time.monotonic(), {"index": i}))
 
 
         async def read_op(key: str):
@@ -291,7 +418,7 @@ class TestConcurrentAccess:
 
         async def write_op(key: str, value: dict):
             async with lock:
-                _cache_set_sync(key, (datetime.now(), value))
+                _cache_set_sync(key, (time.monotonic(), value))
 
         # Mix reads and writes
         tasks = []
@@ -307,6 +434,51 @@ class TestConcurrentAccess:
         for i in range(5):
             assert f"test:existing{i}" in _xbrl_cache
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_same_key_fetch_once(self):
+        """Concurrent cold requests for one filing share a single fetch (no stampede)."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
+        fetched = {"revenue": [{"period": "2024-01-01", "value": 1000}]}
+        release = asyncio.Event()
+
+        async def slow_fetch(cik, accession_number):
+            await release.wait()
+            return fetched
+
+        with patch.object(EdgarXBRLService, '_get_from_redis', new_callable=AsyncMock) as mock_redis_get, \
+             patch.object(EdgarXBRLService, '_set_to_redis', new_callable=AsyncMock), \
+             patch.object(EdgarXBRLService, '_fetch_xbrl_data', side_effect=slow_fetch) as mock_fetch:
+            mock_redis_get.return_value = None
+            service = EdgarXBRLService()
+
+            tasks = [asyncio.create_task(service.get_xbrl_data("acc-sf", "cik-sf")) for _ in range(10)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert mock_fetch.call_count == 1
+        assert mock_redis_get.call_count == 1
+        assert all(r == fetched for r in results)
+        assert xbrl_module._inflight_fetches == {}
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_does_not_wait_on_lock(self):
+        """A fresh L1 hit is served lock-free, even while a writer holds the cache lock."""
+        import app.services.edgar.xbrl_service as xbrl_module
+
+        key = f"{xbrl_module._XBRL_CACHE_VERSION}:cik-hit:acc-hit"
+        _cache_set_sync(key, (time.monotonic(), {"data": "hot"}))
+
+        with patch.object(EdgarXBRLService, '_get_from_redis', new_callable=AsyncMock) as mock_redis_get:
+            async with _get_cache_lock():
+                result = await asyncio.wait_for(
+                    EdgarXBRLService().get_xbrl_data("acc-hit", "cik-hit"), timeout=1.0
+                )
+
+        assert result == {"data": "hot"}
+        mock_redis_get.assert_not_called()
+
 
 class TestStressConditions:
     """Stress tests for cache under high load."""
@@ -325,7 +497,7 @@ class TestStressConditions:
         async def rapid_ops():
             for i in range(100):
                 async with lock:
-                    _cache_set_sync(f"test:rapid{i}", (datetime.now(), {"i": i}))
+                    _cache_set_sync(f"test:rapid{i}", (time.monotonic(), {"i": i}))
                     if f"test:rapid{i}" in _xbrl_cache:
                         _ = _xbrl_cache[f"test:rapid{i}"]
 
@@ -348,7 +520,7 @@ class TestStressConditions:
             # Add 100 entries (should evict 50)
             for i in range(100):
                 async with lock:
-                    _cache_set_sync(f"test:pressure{i}", (datetime.now(), {"i": i}))
+                    _cache_set_sync(f"test:pressure{i}", (time.monotonic(), {"i": i}))
 
             # Should have exactly max_size entries
             assert len(_xbrl_cache) == 50
@@ -372,7 +544,7 @@ class TestStressConditions:
         async def add_entries():
             for i in range(20):
                 async with lock:
-                    _cache_set_sync(f"test:load{i}", (datetime.now(), {"i": i}))
+                    _cache_set_sync(f"test:load{i}", (time.monotonic(), {"i": i}))
                 await asyncio.sleep(0.001)
 
         async def clear_periodically():
@@ -0,0 +1,53 @@
+"""Waitlist email rendering: template slots are filled, HTML slots escaped, text slots raw."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import email_service
+from app.services.email_service import render_referral_success_email, render_welcome_email
+
+
+def test_welcome_email_fills_every_slot():
+    html, text = render_welcome_email(
+        name="Jane",
+        position=12,
+        referral_link="https://earningsnerd.io/r/abc",
+        verification_link="https://earningsnerd.io/verify/xyz",
+    )
+    for needle in ("Hi Jane,", "#12", "https://earningsnerd.io/r/abc", "https://earningsnerd.io/verify/xyz"):
+        assert needle in html
+        assert needle in text
+    assert "$" not in html and "$" not in text
+
+
+def test_welcome_email_escapes_user_content_in_html_only():
+    html, text = render_welcome_email(
+        name="<b>Jane</b>",
+        position=1,
+        referral_link="https://earningsnerd.io/r?a=1&b=2",
+        verification_link="https://earningsnerd.io/v",
+    )
+    assert "<b>Jane</b>" not in html
+    assert "&lt;b&gt;Jane&lt;/b&gt;" in html
+    assert 'href="https://earningsnerd.io/r?a=1&amp;b=2"' in html
+    assert "Hi <b>Jane</b>," in text
+    assert "https://earningsnerd.io/r?a=1&b=2" in text
+
+
+def test_referral_success_email_without_name():
+    html, text = render_referral_success_email(
+        name=None, new_position=4, referral_link="https://earningsnerd.io/r/abc"
+    )
+    assert text.startswith("Hi there,\n\n")
+    assert "#4" in html and "#4" in text
+
+
+@pytest.mark.asyncio
+async def test_send_passes_text_alternative_separately():
+    with patch.object(email_service, "send_email", AsyncMock()) as send:
+        await email_service.send_referral_success_email(
+            to_email="jane@example.com", name="Jane", new_position=4, referral_link="https://x/r"
+        )
+    kwargs = send.await_args.kwargs
+    assert "<pre" not in kwargs["html"]
+    assert kwargs["text"].startswith("Hi Jane,\n\n")